@@ -0,0 +1,78 @@
+"""add user_proof_stats rollup
+
+Revision ID: 003_user_proof_stats
+Revises: 002_email_prefs
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_user_proof_stats'
+down_revision: Union[str, None] = '002_email_prefs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create user_proof_stats and backfill it from proofs_of_build"""
+    stats = op.create_table(
+        'user_proof_stats',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('total_proofs', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('verified_proofs', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('approved_proofs', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('projects_with_proofs', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('proofs_by_type', sa.JSON(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    )
+
+    # Backfill: one grouped pass per aggregate, assembled per user
+    conn = op.get_bind()
+    rows = {}
+
+    def row_for(user_id):
+        return rows.setdefault(user_id, {
+            'user_id': user_id,
+            'total_proofs': 0,
+            'verified_proofs': 0,
+            'approved_proofs': 0,
+            'projects_with_proofs': 0,
+            'proofs_by_type': {},
+        })
+
+    for user_id, proof_type, status, count in conn.execute(sa.text("""
+        SELECT user_id, CAST(proof_type AS VARCHAR), CAST(status AS VARCHAR), COUNT(*)
+        FROM proofs_of_build
+        GROUP BY user_id, proof_type, status
+    """)):
+        row = row_for(user_id)
+        row['total_proofs'] += count
+        row['proofs_by_type'][proof_type] = row['proofs_by_type'].get(proof_type, 0) + count
+        if status == 'verified':
+            row['verified_proofs'] += count
+
+    for user_id, count in conn.execute(sa.text("""
+        SELECT user_id, COUNT(DISTINCT project_id) FROM proofs_of_build GROUP BY user_id
+    """)):
+        row_for(user_id)['projects_with_proofs'] = count
+
+    for user_id, count in conn.execute(sa.text("""
+        SELECT p.user_id, COUNT(a.id)
+        FROM proof_approvals a JOIN proofs_of_build p ON p.id = a.proof_id
+        WHERE CAST(a.status AS VARCHAR) = 'approved'
+        GROUP BY p.user_id
+    """)):
+        row_for(user_id)['approved_proofs'] = count
+
+    if rows:
+        op.bulk_insert(stats, list(rows.values()))
+
+
+def downgrade() -> None:
+    """Drop user_proof_stats"""
+    op.drop_table('user_proof_stats')
@@ -0,0 +1,45 @@
+"""add full-text search index on profiles
+
+Revision ID: 004_profile_search
+Revises: 003_user_proof_stats
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.profile_search import PG_CREATE_INDEX, PG_INDEX_NAME, SQLITE_FTS_DDL, SQLITE_FTS_DROP
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_profile_search'
+down_revision: Union[str, None] = '003_user_proof_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """GIN tsvector expression index on PostgreSQL, FTS5 table + triggers on SQLite"""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        # Built without locking profiles against writes
+        with op.get_context().autocommit_block():
+            op.execute(PG_CREATE_INDEX.format(concurrently='CONCURRENTLY'))
+    elif dialect == 'sqlite':
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO profiles_fts(profiles_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Drop the full-text index"""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {PG_INDEX_NAME}')
+    elif dialect == 'sqlite':
+        for statement in SQLITE_FTS_DROP:
+            op.execute(statement)
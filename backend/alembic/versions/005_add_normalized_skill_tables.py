@@ -0,0 +1,68 @@
+"""add normalized profile_skills / project_required_skills
+
+Revision ID: 005_skill_tables
+Revises: 004_profile_search
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_skill_tables'
+down_revision: Union[str, None] = '004_profile_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _normalize(skills):
+    return sorted({s.strip().lower() for s in (skills or []) if isinstance(s, str) and s.strip()})
+
+
+def upgrade() -> None:
+    """Create the skill association tables and backfill them from the JSON columns"""
+    profile_skills = op.create_table(
+        'profile_skills',
+        sa.Column('profile_id', sa.Integer(), sa.ForeignKey('profiles.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('skill', sa.String(), primary_key=True),
+    )
+    op.create_index('idx_profile_skills_skill', 'profile_skills', ['skill', 'profile_id'])
+
+    project_skills = op.create_table(
+        'project_required_skills',
+        sa.Column('project_id', sa.Integer(), sa.ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('skill', sa.String(), primary_key=True),
+    )
+    op.create_index('idx_project_required_skills_skill', 'project_required_skills', ['skill', 'project_id'])
+
+    # Backfill (JSON parsing differs per backend, so normalize in Python)
+    conn = op.get_bind()
+    profiles = sa.table('profiles', sa.column('id', sa.Integer), sa.column('skills', sa.JSON))
+    projects = sa.table('projects', sa.column('id', sa.Integer), sa.column('required_skills', sa.JSON))
+
+    rows = [
+        {'profile_id': profile_id, 'skill': skill}
+        for profile_id, skills in conn.execute(sa.select(profiles.c.id, profiles.c.skills))
+        for skill in _normalize(skills)
+    ]
+    if rows:
+        op.bulk_insert(profile_skills, rows)
+
+    rows = [
+        {'project_id': project_id, 'skill': skill}
+        for project_id, skills in conn.execute(sa.select(projects.c.id, projects.c.required_skills))
+        for skill in _normalize(skills)
+    ]
+    if rows:
+        op.bulk_insert(project_skills, rows)
+
+
+def downgrade() -> None:
+    """Drop the skill association tables"""
+    op.drop_index('idx_project_required_skills_skill', table_name='project_required_skills')
+    op.drop_table('project_required_skills')
+    op.drop_index('idx_profile_skills_skill', table_name='profile_skills')
+    op.drop_table('profile_skills')
@@ -0,0 +1,51 @@
+"""add profile_verified_skills
+
+Revision ID: 006_verified_skills
+Revises: 005_skill_tables
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_verified_skills'
+down_revision: Union[str, None] = '005_skill_tables'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _verified_names(verified_skills):
+    return sorted({
+        vs['skill'].strip().lower()
+        for vs in (verified_skills or [])
+        if isinstance(vs, dict) and vs.get('verified') and isinstance(vs.get('skill'), str) and vs['skill'].strip()
+    })
+
+
+def upgrade() -> None:
+    """Create profile_verified_skills and backfill it from profiles.verified_skills"""
+    verified_skills = op.create_table(
+        'profile_verified_skills',
+        sa.Column('profile_id', sa.Integer(), sa.ForeignKey('profiles.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('skill', sa.String(), primary_key=True),
+    )
+    op.create_index('idx_profile_verified_skills_skill', 'profile_verified_skills', ['skill', 'profile_id'])
+
+    profiles = sa.table('profiles', sa.column('id', sa.Integer), sa.column('verified_skills', sa.JSON))
+    rows = [
+        {'profile_id': profile_id, 'skill': skill}
+        for profile_id, entries in op.get_bind().execute(sa.select(profiles.c.id, profiles.c.verified_skills))
+        for skill in _verified_names(entries)
+    ]
+    if rows:
+        op.bulk_insert(verified_skills, rows)
+
+
+def downgrade() -> None:
+    """Drop profile_verified_skills"""
+    op.drop_index('idx_profile_verified_skills_skill', table_name='profile_verified_skills')
+    op.drop_table('profile_verified_skills')
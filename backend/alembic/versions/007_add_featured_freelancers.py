@@ -0,0 +1,52 @@
+"""add featured_freelancers leaderboard
+
+Revision ID: 007_featured_leaderboard
+Revises: 006_verified_skills
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_featured_leaderboard'
+down_revision: Union[str, None] = '006_verified_skills'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create featured_freelancers, backfill it from profiles and index portfolio_items.profile_id"""
+    op.create_table(
+        'featured_freelancers',
+        sa.Column('profile_id', sa.Integer(), sa.ForeignKey('profiles.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('average_rating', sa.Float(), nullable=False),
+        sa.Column('completed_projects', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_reviews', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    )
+    op.create_index(
+        'idx_featured_freelancers_rank', 'featured_freelancers',
+        ['average_rating', 'completed_projects', 'profile_id']
+    )
+    # Featured portfolio counts are looked up per listed profile
+    op.create_index('ix_portfolio_items_profile_id', 'portfolio_items', ['profile_id'])
+
+    op.execute("""
+        INSERT INTO featured_freelancers (profile_id, user_id, average_rating, completed_projects, total_reviews)
+        SELECT p.id, p.user_id, p.average_rating, COALESCE(p.completed_projects, 0), p.total_reviews
+        FROM profiles p JOIN users u ON u.id = p.user_id
+        WHERE CAST(u.role AS VARCHAR) = 'freelancer' AND u.is_active
+          AND p.average_rating >= 4.0 AND p.total_reviews > 0
+    """)
+
+
+def downgrade() -> None:
+    """Drop featured_freelancers and the portfolio_items.profile_id index"""
+    op.drop_index('ix_portfolio_items_profile_id', table_name='portfolio_items')
+    op.drop_index('idx_featured_freelancers_rank', table_name='featured_freelancers')
+    op.drop_table('featured_freelancers')
@@ -0,0 +1,64 @@
+"""add composite indexes for hot filters
+
+Revision ID: 008_composite_indexes
+Revises: 007_featured_leaderboard
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_composite_indexes'
+down_revision: Union[str, None] = '007_featured_leaderboard'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns) - mirrored in the models' __table_args__ / index=True
+INDEXES = [
+    ('idx_projects_status_created', 'projects', ['status', 'created_at', 'id']),
+    ('idx_applications_project_applicant_status', 'applications', ['project_id', 'applicant_id', 'status']),
+    ('idx_applications_applicant_status', 'applications', ['applicant_id', 'status']),
+    ('idx_proofs_user_status', 'proofs_of_build', ['user_id', 'status']),
+    ('idx_proofs_project_created', 'proofs_of_build', ['project_id', 'created_at']),
+    ('idx_notifications_user_read_created', 'notifications', ['user_id', 'is_read', 'created_at']),
+    ('idx_project_messages_project_deleted_created', 'project_messages', ['project_id', 'deleted_at', 'created_at']),
+    ('idx_reviews_reviewee_created', 'reviews', ['reviewee_id', 'created_at']),
+    ('ix_profiles_github_username', 'profiles', ['github_username']),
+]
+
+
+def upgrade() -> None:
+    """Create the indexes - CONCURRENTLY on PostgreSQL, so the tables stay writable"""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                # A failed concurrent build leaves an INVALID index behind; drop it so IF NOT EXISTS retries
+                op.execute(f"""
+                    DO $$ BEGIN
+                        IF EXISTS (
+                            SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                            WHERE c.relname = '{name}' AND NOT i.indisvalid
+                        ) THEN
+                            EXECUTE 'DROP INDEX {name}';
+                        END IF;
+                    END $$
+                """)
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop the indexes"""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, _, _ in reversed(INDEXES):
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,98 @@
+"""add user_dashboard_stats counters
+
+Revision ID: 009_dashboard_stats
+Revises: 008_composite_indexes
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_dashboard_stats'
+down_revision: Union[str, None] = '008_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Counter refreshes count a business user's projects in progress
+OWNER_STATUS_INDEX = ('idx_projects_owner_status', 'projects', ['owner_id', 'status'])
+
+
+def upgrade() -> None:
+    """Create user_dashboard_stats, backfill it and index projects by (owner_id, status)"""
+    op.create_table(
+        'user_dashboard_stats',
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('owned_active_projects', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('pending_applications', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('accepted_applications', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_earnings', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('completed_projects', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('average_rating', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('total_reviews', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    )
+
+    op.execute("""
+        INSERT INTO user_dashboard_stats (
+            user_id, owned_active_projects, pending_applications, accepted_applications,
+            total_earnings, completed_projects, average_rating, total_reviews
+        )
+        SELECT u.id,
+               COALESCE(owned.active, 0),
+               COALESCE(apps.pending, 0),
+               COALESCE(apps.accepted, 0),
+               COALESCE(p.total_earnings, 0),
+               COALESCE(p.completed_projects, 0),
+               COALESCE(p.average_rating, 0),
+               COALESCE(p.total_reviews, 0)
+        FROM users u
+        LEFT JOIN profiles p ON p.user_id = u.id
+        LEFT JOIN (
+            SELECT owner_id, COUNT(*) AS active
+            FROM projects
+            WHERE CAST(status AS VARCHAR) = 'in_progress'
+            GROUP BY owner_id
+        ) owned ON owned.owner_id = u.id
+        LEFT JOIN (
+            SELECT applicant_id,
+                   SUM(CASE WHEN CAST(status AS VARCHAR) = 'pending' THEN 1 ELSE 0 END) AS pending,
+                   SUM(CASE WHEN CAST(status AS VARCHAR) = 'accepted' THEN 1 ELSE 0 END) AS accepted
+            FROM applications
+            GROUP BY applicant_id
+        ) apps ON apps.applicant_id = u.id
+    """)
+
+    name, table, columns = OWNER_STATUS_INDEX
+    if op.get_bind().dialect.name == 'postgresql':
+        # CONCURRENTLY, as in 008, so projects stays writable; the block commits the table and backfill first
+        with op.get_context().autocommit_block():
+            # A failed concurrent build leaves an INVALID index behind; drop it so IF NOT EXISTS retries
+            op.execute(f"""
+                DO $$ BEGIN
+                    IF EXISTS (
+                        SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+                        WHERE c.relname = '{name}' AND NOT i.indisvalid
+                    ) THEN
+                        EXECUTE 'DROP INDEX {name}';
+                    END IF;
+                END $$
+            """)
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+    else:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Drop user_dashboard_stats and the projects (owner_id, status) index"""
+    name, table, _ = OWNER_STATUS_INDEX
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    else:
+        op.drop_index(name, table_name=table, if_exists=True)
+    op.drop_table('user_dashboard_stats')
@@ -5,6 +5,7 @@ from typing import Optional
 from app.db.database import get_db
 from app.models.models import User
 from app.core.security import decode_token
+from app.core.user_cache import load_user
 
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
@@ -32,7 +33,7 @@ def get_current_user(
             detail="Invalid token payload"
         )
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = load_user(db, int(user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +77,7 @@ def get_current_user_optional(
     if not user_id:
         return None
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = load_user(db, int(user_id))
     if not user or not user.is_active:
         return None
 
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.models.models import User, UserRole
+from app.api.dependencies import get_current_user
+from app.db.pool_metrics import get_pool_metrics
+from app.core.user_cache import user_cache
+from app.core.config import settings
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.get("/db/pool-metrics")
+def get_db_pool_metrics(current_user: User = Depends(get_current_user)):
+    """Connection pool gauges, checkout-wait histograms and counters for every engine"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can view database metrics"
+        )
+
+    return {
+        "workers": settings.WEB_CONCURRENCY,
+        "adaptive": settings.DB_POOL_ADAPTIVE,
+        "pools": get_pool_metrics(),
+    }
+
+
+@router.get("/cache/users")
+def get_user_cache_metrics(current_user: User = Depends(get_current_user)):
+    """Hit rate and estimated time saved by the authenticated-user cache"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only admins can view cache metrics"
+        )
+
+    if user_cache is None:
+        return {"enabled": False}
+
+    return {"enabled": True, **user_cache.stats()}
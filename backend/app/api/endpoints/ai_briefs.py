@@ -3,14 +3,16 @@ AI Project Brief Generation Endpoints
 Smart Project Brief feature
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.models.models import User, ProjectBrief
 from app.schemas.schemas import ProjectBriefCreate, ProjectBriefResponse, AIBriefGeneration
 from app.api.dependencies import get_current_user
-from app.services.ai_service import ai_service
+from app.services.ai_service import get_ai_service
 
 router = APIRouter()
 
@@ -19,7 +21,7 @@ router = APIRouter()
 async def generate_project_brief(
     brief_data: ProjectBriefCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate an AI-powered project brief from raw description
@@ -38,8 +40,9 @@ async def generate_project_brief(
         )
 
     try:
-        # Generate brief using AI service
-        result = ai_service.generate_project_brief(
+        # Generate brief using AI service (blocking HTTP call, keep it off the event loop)
+        result = await run_in_threadpool(
+            get_ai_service().generate_project_brief,
             raw_description=brief_data.raw_description,
             project_type=brief_data.project_type,
             reference_context=""  # TODO: Add file parsing in future
@@ -59,7 +62,7 @@ async def save_project_brief(
     brief_create: ProjectBriefCreate,
     ai_data: AIBriefGeneration,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Save an AI-generated project brief to database
@@ -94,13 +97,13 @@ async def save_project_brief(
         )
 
         db.add(db_brief)
-        db.commit()
-        db.refresh(db_brief)
+        await db.commit()
+        await db.refresh(db_brief)
 
         return db_brief
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save project brief: {str(e)}"
@@ -110,13 +113,15 @@ async def save_project_brief(
 @router.get("/my-briefs", response_model=List[ProjectBriefResponse])
 async def get_my_briefs(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all project briefs created by the current user"""
 
-    briefs = db.query(ProjectBrief).filter(
-        ProjectBrief.user_id == current_user.id
-    ).order_by(ProjectBrief.created_at.desc()).all()
+    briefs = (await db.scalars(
+        select(ProjectBrief).where(
+            ProjectBrief.user_id == current_user.id
+        ).order_by(ProjectBrief.created_at.desc())
+    )).all()
 
     return briefs
 
@@ -125,14 +130,16 @@ async def get_my_briefs(
 async def get_brief(
     brief_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific project brief by ID"""
 
-    brief = db.query(ProjectBrief).filter(
-        ProjectBrief.id == brief_id,
-        ProjectBrief.user_id == current_user.id
-    ).first()
+    brief = await db.scalar(
+        select(ProjectBrief).where(
+            ProjectBrief.id == brief_id,
+            ProjectBrief.user_id == current_user.id
+        )
+    )
 
     if not brief:
         raise HTTPException(
@@ -147,14 +154,16 @@ async def get_brief(
 async def regenerate_brief(
     brief_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Regenerate AI brief from saved brief data"""
 
-    brief = db.query(ProjectBrief).filter(
-        ProjectBrief.id == brief_id,
-        ProjectBrief.user_id == current_user.id
-    ).first()
+    brief = await db.scalar(
+        select(ProjectBrief).where(
+            ProjectBrief.id == brief_id,
+            ProjectBrief.user_id == current_user.id
+        )
+    )
 
     if not brief:
         raise HTTPException(
@@ -164,7 +173,8 @@ async def regenerate_brief(
 
     try:
         # Regenerate with AI
-        result = ai_service.generate_project_brief(
+        result = await run_in_threadpool(
+            get_ai_service().generate_project_brief,
             raw_description=brief.raw_description,
             project_type=brief.project_type,
             reference_context=""
@@ -182,13 +192,13 @@ async def regenerate_brief(
         brief.ai_model_used = result.get("ai_model_used")
         brief.confidence_score = result["confidence_score"]
 
-        db.commit()
-        db.refresh(brief)
+        await db.commit()
+        await db.refresh(brief)
 
         return AIBriefGeneration(**result)
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to regenerate brief: {str(e)}"
@@ -199,14 +209,16 @@ async def regenerate_brief(
 async def delete_brief(
     brief_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a project brief"""
 
-    brief = db.query(ProjectBrief).filter(
-        ProjectBrief.id == brief_id,
-        ProjectBrief.user_id == current_user.id
-    ).first()
+    brief = await db.scalar(
+        select(ProjectBrief).where(
+            ProjectBrief.id == brief_id,
+            ProjectBrief.user_id == current_user.id
+        )
+    )
 
     if not brief:
         raise HTTPException(
@@ -214,8 +226,8 @@ async def delete_brief(
             detail="Project brief not found"
         )
 
-    db.delete(brief)
-    db.commit()
+    await db.delete(brief)
+    await db.commit()
 
     return {"message": "Project brief deleted successfully"}
 
@@ -225,7 +237,7 @@ async def save_brief_and_create_project(
     brief_data: ProjectBriefCreate,
     ai_data: AIBriefGeneration,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Save AI brief and immediately convert it to an active project
@@ -265,7 +277,7 @@ async def save_brief_and_create_project(
         )
 
         db.add(db_brief)
-        db.flush()  # Get the brief ID without committing
+        await db.flush()  # Get the brief ID without committing
 
         # 2. Create the actual project
         project = Project(
@@ -286,16 +298,16 @@ async def save_brief_and_create_project(
         )
 
         db.add(project)
-        db.flush()  # Get the project ID
+        await db.flush()  # Get the project ID
 
         # 3. Link them
         db_brief.project_id = project.id
         db_brief.status = "converted_to_project"
 
         # Commit everything
-        db.commit()
-        db.refresh(db_brief)
-        db.refresh(project)
+        await db.commit()
+        await db.refresh(db_brief)
+        await db.refresh(project)
 
         return {
             "brief": db_brief,
@@ -304,7 +316,7 @@ async def save_brief_and_create_project(
         }
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create project: {str(e)}"
@@ -3,12 +3,13 @@ AI Co-Pilot API Endpoints
 Handles AI-powered project management features
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.api.dependencies import get_current_user
+from app.api.pagination import InvalidCursor, invalid_cursor_error, set_next_cursor
 from app.models.models import User, SummaryType
 from app.schemas.schemas import (
     GenerateSummaryRequest,
@@ -27,7 +28,7 @@ router = APIRouter(prefix="/ai-copilot", tags=["AI Co-Pilot"])
 async def generate_project_summary(
     request: GenerateSummaryRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Generate an AI-powered project summary.
@@ -77,7 +78,7 @@ async def get_project_summaries(
     limit: int = 10,
     include_archived: bool = False,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all AI summaries for a project.
@@ -89,13 +90,13 @@ async def get_project_summaries(
     **Returns:**
     - List of summaries ordered by creation date (newest first)
     """
-    service = AICopilotService(db)
-
     try:
-        summaries = service.get_project_summaries(
-            project_id=project_id,
-            limit=limit,
-            include_archived=include_archived
+        summaries = await db.run_sync(
+            lambda session: AICopilotService(session).get_project_summaries(
+                project_id=project_id,
+                limit=limit,
+                include_archived=include_archived
+            )
         )
 
         return summaries
@@ -111,7 +112,7 @@ async def get_project_summaries(
 async def get_latest_summary(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get the most recent AI summary for a project.
@@ -119,10 +120,10 @@ async def get_latest_summary(
     **Returns:**
     - Latest published summary, or null if none exists
     """
-    service = AICopilotService(db)
-
     try:
-        summary = service.get_latest_summary(project_id)
+        summary = await db.run_sync(
+            lambda session: AICopilotService(session).get_latest_summary(project_id)
+        )
         return summary
 
     except Exception as e:
@@ -136,7 +137,7 @@ async def get_latest_summary(
 async def send_message(
     message: ProjectMessageCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Send a message in a project chat.
@@ -148,17 +149,17 @@ async def send_message(
     **Returns:**
     - Created message object
     """
-    service = AICopilotService(db)
-
     try:
-        msg = service.send_message(
-            project_id=message.project_id,
-            sender_id=current_user.id,
-            message=message.message,
-            message_type=message.message_type,
-            attachments=message.attachments,
-            parent_message_id=message.parent_message_id,
-            thread_id=message.thread_id
+        msg = await db.run_sync(
+            lambda session: AICopilotService(session).send_message(
+                project_id=message.project_id,
+                sender_id=current_user.id,
+                message=message.message,
+                message_type=message.message_type,
+                attachments=message.attachments,
+                parent_message_id=message.parent_message_id,
+                thread_id=message.thread_id
+            )
         )
 
         return msg
@@ -178,32 +179,41 @@ async def send_message(
 @router.get("/messages/{project_id}", response_model=List[ProjectMessageResponse])
 async def get_project_messages(
     project_id: int,
-    limit: int = 50,
-    offset: int = 0,
+    response: Response,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get messages for a project.
 
     **Query Parameters:**
-    - limit: Maximum number of messages to return (default: 50)
-    - offset: Number of messages to skip (default: 0)
+    - limit: Maximum number of messages to return (default: 50, max: 100)
+    - offset: Number of messages to skip (default: 0, ignored when cursor is given)
+    - cursor: X-Next-Cursor header of the previous page
 
     **Returns:**
     - List of messages ordered by creation date (newest first)
     """
-    service = AICopilotService(db)
-
     try:
-        messages = service.get_project_messages(
-            project_id=project_id,
-            limit=limit,
-            offset=offset
+        messages, next_cursor = await db.run_sync(
+            lambda session: AICopilotService(session).get_project_messages(
+                project_id=project_id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor
+            )
         )
+        set_next_cursor(response, next_cursor)
 
         return messages
 
+    except InvalidCursor:
+        raise invalid_cursor_error()
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -215,7 +225,7 @@ async def get_project_messages(
 async def mark_message_read(
     message_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Mark a message as read by the current user.
@@ -223,10 +233,10 @@ async def mark_message_read(
     **Returns:**
     - Success message
     """
-    service = AICopilotService(db)
-
     try:
-        service.mark_message_read(message_id, current_user.id)
+        await db.run_sync(
+            lambda session: AICopilotService(session).mark_message_read(message_id, current_user.id)
+        )
         return {"status": "success", "message": "Message marked as read"}
     except Exception as e:
         raise HTTPException(
@@ -239,7 +249,7 @@ async def mark_message_read(
 async def mark_all_messages_read(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Mark all messages in a project as read by the current user.
@@ -247,10 +257,10 @@ async def mark_all_messages_read(
     **Returns:**
     - Success message
     """
-    service = AICopilotService(db)
-
     try:
-        service.mark_all_messages_read(project_id, current_user.id)
+        await db.run_sync(
+            lambda session: AICopilotService(session).mark_all_messages_read(project_id, current_user.id)
+        )
         return {"status": "success", "message": "All messages marked as read"}
     except Exception as e:
         raise HTTPException(
@@ -263,7 +273,7 @@ async def mark_all_messages_read(
 async def update_online_status(
     is_online: bool = True,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update the current user's online status.
@@ -274,10 +284,10 @@ async def update_online_status(
     **Returns:**
     - Updated online status
     """
-    service = AICopilotService(db)
-
     try:
-        status_obj = service.update_online_status(current_user.id, is_online)
+        status_obj = await db.run_sync(
+            lambda session: AICopilotService(session).update_online_status(current_user.id, is_online)
+        )
         return {
             "user_id": current_user.id,
             "is_online": status_obj.is_online,
@@ -294,7 +304,7 @@ async def update_online_status(
 async def get_online_status(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get online status of a user.
@@ -302,10 +312,10 @@ async def get_online_status(
     **Returns:**
     - User's online status
     """
-    service = AICopilotService(db)
-
     try:
-        status_obj = service.get_online_status(user_id)
+        status_obj = await db.run_sync(
+            lambda session: AICopilotService(session).get_online_status(user_id)
+        )
         return status_obj
     except Exception as e:
         raise HTTPException(
@@ -318,7 +328,7 @@ async def get_online_status(
 async def start_typing(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Indicate that the current user has started typing in a project chat.
@@ -326,10 +336,10 @@ async def start_typing(
     **Returns:**
     - Success message
     """
-    service = AICopilotService(db)
-
     try:
-        service.start_typing(project_id, current_user.id)
+        await db.run_sync(
+            lambda session: AICopilotService(session).start_typing(project_id, current_user.id)
+        )
         return {"status": "success", "message": "Typing indicator started"}
     except Exception as e:
         raise HTTPException(
@@ -342,7 +352,7 @@ async def start_typing(
 async def stop_typing(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Indicate that the current user has stopped typing in a project chat.
@@ -350,10 +360,10 @@ async def stop_typing(
     **Returns:**
     - Success message
     """
-    service = AICopilotService(db)
-
     try:
-        service.stop_typing(project_id, current_user.id)
+        await db.run_sync(
+            lambda session: AICopilotService(session).stop_typing(project_id, current_user.id)
+        )
         return {"status": "success", "message": "Typing indicator stopped"}
     except Exception as e:
         raise HTTPException(
@@ -366,7 +376,7 @@ async def stop_typing(
 async def get_typing_indicators(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get list of users currently typing in a project chat.
@@ -374,10 +384,10 @@ async def get_typing_indicators(
     **Returns:**
     - List of users typing (excludes current user)
     """
-    service = AICopilotService(db)
-
     try:
-        typing_users = service.get_typing_indicators(project_id, current_user.id)
+        typing_users = await db.run_sync(
+            lambda session: AICopilotService(session).get_typing_indicators(project_id, current_user.id)
+        )
         return typing_users
     except Exception as e:
         raise HTTPException(
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.db.database import get_db
-from app.models.models import Application, User, Project, ApplicationStatus, UserRole, Notification
+from app.models.models import Application, User, Project, ApplicationStatus, UserRole, Notification, Profile
 from app.schemas.schemas import ApplicationCreate, ApplicationResponse, ApplicationUpdate
 from app.api.dependencies import get_current_user
+from app.services.match_scoring import rank_applicants, score_match
+from app.api.pagination import keyset_page, set_next_cursor, split_page
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -62,8 +65,8 @@ def create_application(
 
         new_application = Application(**application_kwargs)
 
-        # Calculate AI match score (simplified - you'd use actual AI here)
-        new_application.ai_match_score = calculate_match_score(current_user, project)
+        # Skill-overlap match score (re-scored when either side's skills change)
+        new_application.ai_match_score = score_match(db, current_user.id, project.id)
 
         db.add(new_application)
         db.commit()
@@ -166,15 +169,49 @@ def get_project_applications(
     return applications
 
 
+def _applicant_response(application: Application, user: User, profile, rank_score: Optional[float] = None) -> dict:
+    data = {
+        "application_id": application.id,
+        "applicant_id": user.id,
+        "email": user.email,
+        "first_name": profile.first_name or "",
+        "last_name": profile.last_name or "",
+        "bio": profile.bio or "",
+        "avatar_url": profile.avatar_url,
+        "skills": profile.skills or [],
+        "location": profile.location or "",
+        "hourly_rate": profile.hourly_rate,
+        "average_rating": profile.average_rating or 0,
+        "total_reviews": profile.total_reviews or 0,
+        "completed_projects": profile.completed_projects or 0,
+        "status": application.status.value,
+        "cover_letter": application.cover_letter or "",
+        "proposed_rate": application.proposed_rate,
+        "ai_match_score": application.ai_match_score,
+        "applied_at": application.applied_at.isoformat() if application.applied_at else None
+    }
+    if rank_score is not None:
+        data["rank_score"] = rank_score
+    return data
+
+
 @router.get("/project/{project_id}/applicants")
 def get_project_applicants_with_profiles(
     project_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0, description="Ignored when cursor is given"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page (not with rank=true)"),
+    rank: bool = Query(False, description="Order by rank_score (skill overlap, rating, verified proofs)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all applicants for a specific project with their profile info (for project owner)"""
-    from app.models.models import Profile
+    """Get all applicants for a specific project with their profile info (for project owner)
 
+    Best AI match first by default; pass the X-Next-Cursor header of a page as `cursor`
+    to get the next one. With rank=true, applicants are ordered by a combined rank_score
+    and paged with `offset`.
+    """
     # Verify project ownership
     project = db.query(Project).filter(Project.id == project_id).first()
     if not project:
@@ -189,39 +226,32 @@ def get_project_applicants_with_profiles(
             detail="Only project owner can view applicants"
         )
 
-    # Get applications with user profiles
-    applications = db.query(Application).filter(
-        Application.project_id == project_id
-    ).order_by(Application.ai_match_score.desc()).all()
-
-    applicants_data = []
-    for app in applications:
-        user = db.query(User).filter(User.id == app.applicant_id).first()
-        profile = db.query(Profile).filter(Profile.user_id == app.applicant_id).first()
-
-        if user and profile:
-            applicants_data.append({
-                "application_id": app.id,
-                "applicant_id": user.id,
-                "email": user.email,
-                "first_name": profile.first_name or "",
-                "last_name": profile.last_name or "",
-                "bio": profile.bio or "",
-                "avatar_url": profile.avatar_url,
-                "skills": profile.skills or [],
-                "location": profile.location or "",
-                "hourly_rate": profile.hourly_rate,
-                "average_rating": profile.average_rating or 0,
-                "total_reviews": profile.total_reviews or 0,
-                "completed_projects": profile.completed_projects or 0,
-                "status": app.status.value,
-                "cover_letter": app.cover_letter or "",
-                "proposed_rate": app.proposed_rate,
-                "ai_match_score": app.ai_match_score,
-                "applied_at": app.created_at.isoformat()
-            })
-
-    return {"applicants": applicants_data, "total": len(applicants_data)}
+    # Applications with their applicant and profile in one joined query
+    query = db.query(Application, User, Profile).join(
+        User, User.id == Application.applicant_id
+    ).join(
+        Profile, Profile.user_id == Application.applicant_id
+    ).filter(Application.project_id == project_id)
+    total = query.count()
+
+    if rank:
+        ranked = rank_applicants(db, project_id)
+        page = ranked[offset:offset + limit]
+        rows = {application.id: (application, user, profile) for application, user, profile in query.filter(
+            Application.id.in_([application_id for application_id, _ in page])
+        )}
+        applicants_data = [
+            _applicant_response(*rows[application_id], rank_score=score)
+            for application_id, score in page if application_id in rows
+        ]
+        return {"applicants": applicants_data, "total": total}
+
+    order = [(func.coalesce(Application.ai_match_score, -1.0), True), (Application.id, True)]
+    rows, next_cursor = split_page(keyset_page(query, order, limit, cursor, offset).all(), order, limit)
+    set_next_cursor(response, next_cursor)
+
+    applicants_data = [_applicant_response(application, user, profile) for application, user, profile in rows]
+    return {"applicants": applicants_data, "total": total}
 
 
 @router.patch("/{application_id}", response_model=ApplicationResponse)
@@ -299,45 +329,3 @@ def withdraw_application(
     db.commit()
     
     return None
-
-
-def calculate_match_score(user: User, project: Project) -> float:
-    """
-    Calculate AI match score between user skills and project requirements
-    This is a simplified version - in production, you'd use actual AI/ML
-    """
-    # Get or create profile
-    from app.models.models import Profile
-    from app.db.database import SessionLocal
-
-    db = SessionLocal()
-    try:
-        profile = db.query(Profile).filter(Profile.user_id == user.id).first()
-
-        if not profile:
-            # Create profile if doesn't exist
-            profile = Profile(user_id=user.id)
-            db.add(profile)
-            db.commit()
-            db.refresh(profile)
-
-        if not profile.skills or not project.required_skills:
-            return 50.0
-
-        user_skills = set(profile.skills)
-        required_skills = set(project.required_skills)
-
-        if not required_skills:
-            return 70.0
-
-        # Calculate skill overlap
-        matching_skills = user_skills.intersection(required_skills)
-        match_percentage = (len(matching_skills) / len(required_skills)) * 100
-
-        # Add some randomness for demo purposes
-        import random
-        match_percentage += random.uniform(-10, 10)
-
-        return min(max(match_percentage, 0), 100)
-    finally:
-        db.close()
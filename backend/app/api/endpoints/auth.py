@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from datetime import timedelta
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
 from app.models.models import User, Profile
 from app.schemas.schemas import UserCreate, UserLogin, Token, UserResponse, RefreshTokenRequest, GoogleAuthRequest, GitHubAuthRequest, GitHubConnectRequest, HuggingFaceAuthRequest, HuggingFaceConnectRequest
-from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token
+from app.core.security import (
+    verify_password_async, get_password_hash_async, password_needs_rehash, PasswordHashingBusy,
+    create_access_token, create_refresh_token
+)
 from app.core.config import settings
 from app.api.dependencies import get_current_user
 import logging
@@ -16,15 +19,23 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+def _hashing_busy_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user"""
     import logging
     logger = logging.getLogger(__name__)
 
     try:
         # Check if user already exists
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
+        existing_user = await db.scalar(select(User).where(User.email == user_data.email))
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -32,22 +43,25 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
             )
 
         # Create new user and profile in a transaction
-        hashed_password = get_password_hash(user_data.password)
+        try:
+            hashed_password = await get_password_hash_async(user_data.password)
+        except PasswordHashingBusy:
+            raise _hashing_busy_error()
         new_user = User(
             email=user_data.email,
             hashed_password=hashed_password,
             role=user_data.role
         )
         db.add(new_user)
-        db.flush()  # Flush to get the user ID without committing
+        await db.flush()  # Flush to get the user ID without committing
 
         # Create empty profile
         profile = Profile(user_id=new_user.id)
         db.add(profile)
 
         # Commit both together
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
 
         logger.info(f"Successfully registered user: {user_data.email} with role: {user_data.role}")
         return new_user
@@ -56,7 +70,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Registration failed for {user_data.email}: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -65,12 +79,19 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Login and get access token"""
     # Find user
-    user = db.query(User).filter(User.email == user_credentials.email).first()
-    
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    user = await db.scalar(select(User).where(User.email == user_credentials.email))
+
+    try:
+        password_ok = bool(user and user.hashed_password) and await verify_password_async(
+            user_credentials.password, user.hashed_password
+        )
+    except PasswordHashingBusy:
+        raise _hashing_busy_error()
+
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -82,6 +103,14 @@ def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
+
+    # Upgrade the stored hash if the bcrypt cost policy changed since it was made
+    if password_needs_rehash(user.hashed_password):
+        try:
+            user.hashed_password = await get_password_hash_async(user_credentials.password)
+            await db.commit()
+        except PasswordHashingBusy:
+            pass  # Not worth failing the login over; try again next time
     
     # Create tokens
     access_token = create_access_token(data={"sub": str(user.id)})
@@ -149,6 +178,8 @@ def google_auth(auth_data: GoogleAuthRequest, db: Session = Depends(get_db)):
             # If GOOGLE_CLIENT_ID is not set, skip verification for development
             if settings.GOOGLE_CLIENT_ID:
                 logger.info("Verifying Google token with GOOGLE_CLIENT_ID")
+                from google.oauth2 import id_token  # Imported lazily - slow to import
+                from google.auth.transport import requests as google_requests
                 idinfo = id_token.verify_oauth2_token(
                     token,
                     google_requests.Request(),
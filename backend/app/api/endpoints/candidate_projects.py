@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -26,6 +26,7 @@ from app.schemas.schemas import (
     ProjectActionResponse
 )
 from app.api.dependencies import get_current_user
+from app.api.pagination import keyset_page, set_next_cursor, split_page
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/candidate-projects", tags=["candidate-projects"])
@@ -94,10 +95,10 @@ def send_project_creation_email(
         )
 
     try:
-        from app.services.email_service import email_service
+        from app.services.email_service import get_email_service
 
         logger.info("Calling email service...")
-        success = email_service.send_project_created_notification(
+        success = get_email_service().send_project_created_notification(
             candidate_email=email_data.candidate_email,
             candidate_name=email_data.candidate_name,
             agent_name=email_data.agent_name,
@@ -147,10 +148,10 @@ def send_project_update_email_endpoint(
         )
 
     try:
-        from app.services.email_service import email_service
+        from app.services.email_service import get_email_service
 
         logger.info("Calling email service...")
-        success = email_service.send_project_updated_notification(
+        success = get_email_service().send_project_updated_notification(
             candidate_email=email_data.candidate_email,
             candidate_name=email_data.candidate_name,
             agent_name=email_data.agent_name,
@@ -200,10 +201,10 @@ def send_schedule_email_endpoint(
         )
 
     try:
-        from app.services.email_service import email_service
+        from app.services.email_service import get_email_service
 
         logger.info("Calling email service for scheduling notification...")
-        success = email_service.send_schedule_request_notification(
+        success = get_email_service().send_schedule_request_notification(
             recipient_email=email_data.recipient_email,
             recipient_name=email_data.recipient_name,
             requester_name=email_data.requester_name,
@@ -278,7 +279,7 @@ def create_candidate_project(
 
     # Send email notification to candidate (direct call - no Celery needed)
     try:
-        from app.services.email_service import email_service
+        from app.services.email_service import get_email_service
         from app.models.models import Profile
         import logging
         logger = logging.getLogger(__name__)
@@ -314,7 +315,7 @@ def create_candidate_project(
                 # Send email directly
                 logger.info(f"📧 Sending project created email to {candidate.email}")
 
-                success = email_service.send_project_created_notification(
+                success = get_email_service().send_project_created_notification(
                     candidate_email=candidate.email,
                     candidate_name=candidate_name,
                     agent_name=agent_name,
@@ -378,8 +379,10 @@ def create_candidate_project(
 
 @router.get("/", response_model=List[CandidateProjectResponse])
 def get_candidate_projects(
-    skip: int = Query(0, ge=0),
+    response: Response,
+    skip: int = Query(0, ge=0, description="Ignored when cursor is given"),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     status: Optional[CandidateProjectStatus] = None,
     candidate_id: Optional[int] = None,
     agent_id: Optional[int] = None,
@@ -407,7 +410,9 @@ def get_candidate_projects(
     if agent_id and current_user.role == UserRole.ADMIN:
         query = query.filter(CandidateProject.agent_id == agent_id)
 
-    projects = query.order_by(CandidateProject.created_at.desc()).offset(skip).limit(limit).all()
+    order = [(CandidateProject.created_at, True), (CandidateProject.id, True)]
+    projects, next_cursor = split_page(keyset_page(query, order, limit, cursor, skip).all(), order, limit)
+    set_next_cursor(response, next_cursor)
     return projects
 
 
@@ -551,7 +556,7 @@ def update_candidate_project(
 
     # Send email notifications (direct call - no Celery needed)
     try:
-        from app.services.email_service import email_service
+        from app.services.email_service import get_email_service
         from app.models.models import Profile
         import logging
         logger = logging.getLogger(__name__)
@@ -591,7 +596,7 @@ def update_candidate_project(
                     new_status = update_data_dict['status'].value if hasattr(update_data_dict['status'], 'value') else str(update_data_dict['status'])
                     logger.info(f"📧 Sending project status changed email to {candidate.email}")
 
-                    success = email_service.send_project_status_changed_notification(
+                    success = get_email_service().send_project_status_changed_notification(
                         candidate_email=candidate.email,
                         candidate_name=candidate_name,
                         agent_name=agent_name,
@@ -610,7 +615,7 @@ def update_candidate_project(
                     update_summary = ", ".join([f"{k}: {v}" for k, v in update_data_dict.items()])
                     logger.info(f"📧 Sending project updated email to {candidate.email}")
 
-                    success = email_service.send_project_updated_notification(
+                    success = get_email_service().send_project_updated_notification(
                         candidate_email=candidate.email,
                         candidate_name=candidate_name,
                         agent_name=agent_name,
@@ -755,7 +760,7 @@ def create_project_update(
 
     # Send email notification about project update (direct call - no Celery needed)
     try:
-        from app.services.email_service import email_service
+        from app.services.email_service import get_email_service
         from app.models.models import Profile
         import logging
         logger = logging.getLogger(__name__)
@@ -794,7 +799,7 @@ def create_project_update(
 
                 logger.info(f"📧 Sending project update email to {candidate.email}")
 
-                success = email_service.send_project_updated_notification(
+                success = get_email_service().send_project_updated_notification(
                     candidate_email=candidate.email,
                     candidate_name=candidate_name,
                     agent_name=agent_name,
@@ -967,7 +972,7 @@ def create_project_action(
     # Send email notification for scheduling actions (screen_share or work_session)
     if action_data.action_type in ["screen_share", "work_session"]:
         try:
-            from app.services.email_service import email_service
+            from app.services.email_service import get_email_service
 
             # Get agent and candidate details
             agent = db.query(User).filter(User.id == project.agent_id).first()
@@ -1011,7 +1016,7 @@ def create_project_action(
                         # Fallback to email username (before @) instead of full email
                         requester_name = requester.email.split('@')[0] if requester.email else "User"
 
-                    email_service.send_schedule_request_notification(
+                    get_email_service().send_schedule_request_notification(
                         recipient_email=recipient.email,
                         recipient_name=recipient_name,
                         requester_name=requester_name,
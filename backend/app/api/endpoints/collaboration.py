@@ -4,13 +4,14 @@ Handles team overlap calculations, timezone information, and scheduling
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from datetime import datetime
 from zoneinfo import ZoneInfo
 import logging
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.api.dependencies import get_current_user
 from app.models.models import User, Profile, Project, Application
 from app.schemas.schemas import (
@@ -27,9 +28,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/collaboration", tags=["collaboration"])
 
 
-def get_user_timezone_info(user: User, db: Session) -> UserTimezoneInfo:
+async def get_user_timezone_info(user: User, db: AsyncSession) -> UserTimezoneInfo:
     """Helper function to get user timezone info"""
-    profile = db.query(Profile).filter(Profile.user_id == user.id).first()
+    profile = await db.scalar(select(Profile).where(Profile.user_id == user.id))
 
     if not profile:
         raise HTTPException(
@@ -59,20 +60,20 @@ def get_user_timezone_info(user: User, db: Session) -> UserTimezoneInfo:
 @router.get("/timezones/me", response_model=UserTimezoneInfo)
 async def get_my_timezone_info(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's timezone information"""
-    return get_user_timezone_info(current_user, db)
+    return await get_user_timezone_info(current_user, db)
 
 
 @router.get("/timezones/user/{user_id}", response_model=UserTimezoneInfo)
 async def get_user_timezone(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get timezone information for a specific user"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -80,14 +81,14 @@ async def get_user_timezone(
             detail=f"User {user_id} not found"
         )
 
-    return get_user_timezone_info(user, db)
+    return await get_user_timezone_info(user, db)
 
 
 @router.post("/overlap/project", response_model=TeamOverlapResponse)
 async def calculate_project_team_overlap(
     request: ProjectTeamRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Calculate timezone overlap for a project team
@@ -98,7 +99,7 @@ async def calculate_project_team_overlap(
     - Optionally: pending applicants
     """
     # Get project
-    project = db.query(Project).filter(Project.id == request.project_id).first()
+    project = await db.get(Project, request.project_id)
 
     if not project:
         raise HTTPException(
@@ -109,10 +110,12 @@ async def calculate_project_team_overlap(
     # Check if user has access to this project
     # (Owner, or accepted/pending applicant)
     is_owner = project.owner_id == current_user.id
-    user_application = db.query(Application).filter(
-        Application.project_id == request.project_id,
-        Application.applicant_id == current_user.id
-    ).first()
+    user_application = await db.scalar(
+        select(Application).where(
+            Application.project_id == request.project_id,
+            Application.applicant_id == current_user.id
+        ).limit(1)
+    )
 
     if not is_owner and not user_application:
         raise HTTPException(
@@ -124,20 +127,24 @@ async def calculate_project_team_overlap(
     team_user_ids = {project.owner_id}
 
     # Add accepted applicants
-    accepted_applications = db.query(Application).filter(
-        Application.project_id == request.project_id,
-        Application.status == "accepted"
-    ).all()
+    accepted_applications = (await db.scalars(
+        select(Application).where(
+            Application.project_id == request.project_id,
+            Application.status == "accepted"
+        )
+    )).all()
 
     for app in accepted_applications:
         team_user_ids.add(app.applicant_id)
 
     # Optionally add pending applicants
     if request.include_applicants:
-        pending_applications = db.query(Application).filter(
-            Application.project_id == request.project_id,
-            Application.status == "pending"
-        ).all()
+        pending_applications = (await db.scalars(
+            select(Application).where(
+                Application.project_id == request.project_id,
+                Application.status == "pending"
+            )
+        )).all()
 
         for app in pending_applications:
             team_user_ids.add(app.applicant_id)
@@ -145,10 +152,10 @@ async def calculate_project_team_overlap(
     # Get timezone info for all team members
     user_timezones = []
     for user_id in team_user_ids:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if user:
             try:
-                user_tz_info = get_user_timezone_info(user, db)
+                user_tz_info = await get_user_timezone_info(user, db)
                 user_timezones.append(user_tz_info)
             except Exception as e:
                 logger.warning(f"Could not get timezone info for user {user_id}: {e}")
@@ -183,7 +190,7 @@ async def calculate_project_team_overlap(
 async def calculate_custom_team_overlap(
     request: CustomTeamRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Calculate timezone overlap for a custom list of users
@@ -200,10 +207,10 @@ async def calculate_custom_team_overlap(
     # Get timezone info for all users
     user_timezones = []
     for user_id in user_ids:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.get(User, user_id)
         if user:
             try:
-                user_tz_info = get_user_timezone_info(user, db)
+                user_tz_info = await get_user_timezone_info(user, db)
                 user_timezones.append(user_tz_info)
             except Exception as e:
                 logger.warning(f"Could not get timezone info for user {user_id}: {e}")
@@ -237,10 +244,10 @@ async def calculate_custom_team_overlap(
 async def get_user_current_hour(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get the current local hour for a specific user (for status display)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -248,7 +255,7 @@ async def get_user_current_hour(
             detail=f"User {user_id} not found"
         )
 
-    profile = db.query(Profile).filter(Profile.user_id == user_id).first()
+    profile = await db.scalar(select(Profile).where(Profile.user_id == user_id))
 
     if not profile:
         raise HTTPException(
@@ -282,10 +289,10 @@ async def get_user_current_hour(
 async def get_user_working_status(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get whether a user is currently in working hours (for presence indicators)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
 
     if not user:
         raise HTTPException(
@@ -293,7 +300,7 @@ async def get_user_working_status(
             detail=f"User {user_id} not found"
         )
 
-    profile = db.query(Profile).filter(Profile.user_id == user_id).first()
+    profile = await db.scalar(select(Profile).where(Profile.user_id == user_id))
 
     if not profile:
         return {
@@ -2,11 +2,11 @@
 Escrow API endpoints - Handles escrow fund management
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import logging
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.models.models import Escrow, User, Project, Payment
 from app.schemas.schemas import (
     EscrowCreate, EscrowResponse, EscrowRelease,
@@ -24,14 +24,14 @@ logger = logging.getLogger(__name__)
 async def create_escrow(
     escrow_data: EscrowCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create escrow (usually called automatically after payment)
     Manual creation allowed for admins
     """
     # Verify payment exists
-    payment = db.query(Payment).filter(Payment.id == escrow_data.payment_id).first()
+    payment = await db.get(Payment, escrow_data.payment_id)
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -47,12 +47,13 @@ async def create_escrow(
         )
 
     try:
-        escrow_service = EscrowService(db)
-        escrow = escrow_service.create_escrow(
-            payment_id=escrow_data.payment_id,
-            project_id=escrow_data.project_id,
-            amount=escrow_data.amount,
-            release_condition=escrow_data.release_condition
+        escrow = await db.run_sync(
+            lambda session: EscrowService(session).create_escrow(
+                payment_id=escrow_data.payment_id,
+                project_id=escrow_data.project_id,
+                amount=escrow_data.amount,
+                release_condition=escrow_data.release_condition
+            )
         )
         return escrow
 
@@ -72,27 +73,29 @@ async def create_escrow(
 @router.get("/", response_model=List[EscrowResponse])
 async def list_escrows(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List all escrows for current user
     """
-    escrow_service = EscrowService(db)
-    escrows = escrow_service.get_user_escrows(current_user.id)
+    escrows = await db.run_sync(
+        lambda session: EscrowService(session).get_user_escrows(current_user.id)
+    )
     return escrows
 
 
 @router.get("/held", response_model=List[EscrowResponse])
 async def list_held_escrows(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     List all held escrows where user is payee
     Useful for seeing pending payments awaiting release
     """
-    escrow_service = EscrowService(db)
-    escrows = escrow_service.get_held_escrows_for_user(current_user.id)
+    escrows = await db.run_sync(
+        lambda session: EscrowService(session).get_held_escrows_for_user(current_user.id)
+    )
     return escrows
 
 
@@ -100,14 +103,13 @@ async def list_held_escrows(
 async def get_escrow(
     escrow_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get escrow details
     User must be involved in the payment
     """
-    escrow_service = EscrowService(db)
-    escrow = escrow_service.get_escrow_by_id(escrow_id)
+    escrow = await db.get(Escrow, escrow_id)
 
     if not escrow:
         raise HTTPException(
@@ -116,7 +118,7 @@ async def get_escrow(
         )
 
     # Verify user has access
-    payment = db.query(Payment).filter(Payment.id == escrow.payment_id).first()
+    payment = await db.get(Payment, escrow.payment_id)
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -137,14 +139,13 @@ async def release_escrow(
     escrow_id: int,
     release_data: EscrowRelease,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Release escrowed funds to payee
     Can be triggered by project owner after proof verification
     """
-    escrow_service = EscrowService(db)
-    escrow = escrow_service.get_escrow_by_id(escrow_id)
+    escrow = await db.get(Escrow, escrow_id)
 
     if not escrow:
         raise HTTPException(
@@ -153,7 +154,7 @@ async def release_escrow(
         )
 
     # Verify user is the payer (project owner)
-    payment = db.query(Payment).filter(Payment.id == escrow.payment_id).first()
+    payment = await db.get(Payment, escrow.payment_id)
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -167,9 +168,11 @@ async def release_escrow(
         )
 
     try:
-        released_escrow = escrow_service.release_escrow(
-            escrow_id=escrow_id,
-            proof_id=release_data.proof_id
+        released_escrow = await db.run_sync(
+            lambda session: EscrowService(session).release_escrow(
+                escrow_id=escrow_id,
+                proof_id=release_data.proof_id
+            )
         )
 
         # Create notifications
@@ -184,7 +187,7 @@ async def release_escrow(
             notification_data={"escrow_id": escrow_id, "payment_id": payment.id}
         )
         db.add(notification)
-        db.commit()
+        await db.commit()
 
         return released_escrow
 
@@ -206,14 +209,13 @@ async def dispute_escrow(
     escrow_id: int,
     dispute_data: EscrowDispute,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Open a dispute for escrowed funds
     Can be done by payer or payee
     """
-    escrow_service = EscrowService(db)
-    escrow = escrow_service.get_escrow_by_id(escrow_id)
+    escrow = await db.get(Escrow, escrow_id)
 
     if not escrow:
         raise HTTPException(
@@ -222,7 +224,7 @@ async def dispute_escrow(
         )
 
     # Verify user is involved in the payment
-    payment = db.query(Payment).filter(Payment.id == escrow.payment_id).first()
+    payment = await db.get(Payment, escrow.payment_id)
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -236,9 +238,11 @@ async def dispute_escrow(
         )
 
     try:
-        disputed_escrow = escrow_service.dispute_escrow(
-            escrow_id=escrow_id,
-            reason=dispute_data.reason
+        disputed_escrow = await db.run_sync(
+            lambda session: EscrowService(session).dispute_escrow(
+                escrow_id=escrow_id,
+                reason=dispute_data.reason
+            )
         )
 
         # Create notifications for both parties
@@ -263,7 +267,7 @@ async def dispute_escrow(
             notification_data={"escrow_id": escrow_id, "payment_id": payment.id}
         )
         db.add(payee_notification)
-        db.commit()
+        await db.commit()
 
         return disputed_escrow
 
@@ -285,15 +289,14 @@ async def refund_escrow(
     escrow_id: int,
     refund_data: EscrowRefund,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Refund escrowed funds to payer
     Can be done by payer or admin
     Note: This also triggers a Stripe refund
     """
-    escrow_service = EscrowService(db)
-    escrow = escrow_service.get_escrow_by_id(escrow_id)
+    escrow = await db.get(Escrow, escrow_id)
 
     if not escrow:
         raise HTTPException(
@@ -302,7 +305,7 @@ async def refund_escrow(
         )
 
     # Verify user is payer or admin
-    payment = db.query(Payment).filter(Payment.id == escrow.payment_id).first()
+    payment = await db.get(Payment, escrow.payment_id)
     if not payment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -318,16 +321,19 @@ async def refund_escrow(
 
     try:
         # Refund through Stripe first
-        payment_service = PaymentService(db)
-        payment_service.refund_payment(
-            payment_id=payment.id,
-            reason=refund_data.reason
+        await db.run_sync(
+            lambda session: PaymentService(session).refund_payment(
+                payment_id=payment.id,
+                reason=refund_data.reason
+            )
         )
 
         # Then update escrow status
-        refunded_escrow = escrow_service.refund_escrow(
-            escrow_id=escrow_id,
-            reason=refund_data.reason
+        refunded_escrow = await db.run_sync(
+            lambda session: EscrowService(session).refund_escrow(
+                escrow_id=escrow_id,
+                reason=refund_data.reason
+            )
         )
 
         # Notify both parties
@@ -352,7 +358,7 @@ async def refund_escrow(
             notification_data={"escrow_id": escrow_id, "payment_id": payment.id}
         )
         db.add(payee_notification)
-        db.commit()
+        await db.commit()
 
         return refunded_escrow
 
@@ -373,26 +379,27 @@ async def refund_escrow(
 async def get_project_escrows(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all escrows for a project
     User must be project owner or involved in payments
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    escrow_service = EscrowService(db)
-    escrows = escrow_service.get_project_escrows(project_id)
+    escrows = await db.run_sync(
+        lambda session: EscrowService(session).get_project_escrows(project_id)
+    )
 
     # Filter to only show escrows user is involved in
     user_escrows = []
     for escrow in escrows:
-        payment = db.query(Payment).filter(Payment.id == escrow.payment_id).first()
+        payment = await db.get(Payment, escrow.payment_id)
         if payment and (payment.payer_id == current_user.id or payment.payee_id == current_user.id or project.owner_id == current_user.id):
             user_escrows.append(escrow)
 
@@ -0,0 +1,97 @@
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Optional, Tuple
+import re
+from app.core.file_storage import file_store, is_digest
+from app.core.response_cache import etag_matches
+from app.services.uploads import MEDIA_TYPES
+
+router = APIRouter(prefix="/files", tags=["files"])
+
+_SINGLE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$", re.IGNORECASE)
+
+
+def _byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) inclusive for a single-range `Range` header.
+
+    None means serve the whole file - another unit, a malformed header or
+    several ranges, which a server may ignore. Raises ValueError when the
+    range can't be satisfied.
+    """
+    match = _SINGLE_RANGE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        suffix = int(last)  # Last `suffix` bytes
+        if suffix == 0:
+            raise ValueError("Empty suffix range")
+        start, end = max(0, size - suffix), size - 1
+    if start >= size:
+        raise ValueError("Range starts past the end of the file")
+    return start, end
+
+
+@router.api_route("/{name}", methods=["GET", "HEAD"])
+def get_file(name: str, request: Request):
+    """
+    Serve an uploaded file by `<sha256>.<extension>`.
+
+    The digest is the ETag - blobs never change, so responses are cacheable
+    forever. Supports If-None-Match, single byte ranges and If-Range.
+    """
+    digest, _, extension = name.partition(".")
+    media_type = MEDIA_TYPES.get(extension)
+    size = file_store.size(digest) if media_type and is_digest(digest) else None
+    if size is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found"
+        )
+
+    etag = f'"{digest}"'
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "X-Content-Type-Options": "nosniff",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # A stale If-Range (another ETag, or a date) gets the whole file
+    if range_header and (if_range is None or if_range.strip() == etag):
+        try:
+            byte_range = _byte_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"}
+            )
+
+    if byte_range:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    else:
+        start, end = 0, size - 1
+        status_code = status.HTTP_200_OK
+    headers["Content-Length"] = str(end - start + 1)
+
+    if request.method == "HEAD" or end < start:
+        return Response(status_code=status_code, media_type=media_type, headers=headers)
+    return StreamingResponse(
+        file_store.iter_range(digest, start, end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers
+    )
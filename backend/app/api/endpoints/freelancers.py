@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
-from typing import List, Optional
+from sqlalchemy import or_, and_, func, select
+from typing import List, Literal, Optional
 from datetime import datetime
-from app.db.database import get_db
-from app.models.models import User, Profile, PortfolioItem, UserRole, ProofOfBuild, ProofStatus, ProofApproval, ApprovalStatus
+from app.db.database import get_db, get_read_db
+from app.models.models import (
+    User, Profile, PortfolioItem, UserRole, ProofOfBuild, ProofType, UserProofStats, FeaturedFreelancer
+)
 from app.schemas.schemas import (
     PortfolioItemCreate,
     PortfolioItemUpdate,
@@ -15,6 +17,10 @@ from app.schemas.schemas import (
     ProfileResponse
 )
 from app.api.dependencies import get_current_user
+from app.services.proof_stats import get_user_proof_stats, proof_metrics_cache
+from app.db.profile_search import profile_search_match
+from app.api.pagination import keyset_page, set_next_cursor, split_page
+from app.services.skill_index import normalize_skills, profiles_with_skills, profiles_with_verified_skills
 
 router = APIRouter(prefix="/freelancers", tags=["freelancers"])
 
@@ -196,8 +202,8 @@ def verify_freelancer_skill(
             detail="Profile not found"
         )
 
-    # Get or initialize verified_skills
-    verified_skills = profile.verified_skills or []
+    # Get or initialize verified_skills (a copy, so the reassignment below is detected as a change)
+    verified_skills = list(profile.verified_skills or [])
 
     # Check if skill already exists in verified_skills
     skill_found = False
@@ -231,9 +237,47 @@ def verify_freelancer_skill(
 
 # ================== Freelancer Search Endpoints ==================
 
+def _portfolio_counts_subquery():
+    """Portfolio item count per profile"""
+    return select(
+        PortfolioItem.profile_id,
+        func.count(PortfolioItem.id).label("portfolio_count")
+    ).group_by(PortfolioItem.profile_id).subquery()
+
+
+def _verified_skills_list(profile: Profile) -> List[dict]:
+    """verified_skills entries in the response format (skips malformed entries)"""
+    return [vs for vs in (profile.verified_skills or []) if isinstance(vs, dict)]
+
+
+def _freelancer_response(profile: Profile, user: User, portfolio_count: int, **proof_metrics) -> FreelancerSearchResponse:
+    return FreelancerSearchResponse(
+        user_id=user.id,
+        profile_id=profile.id,
+        first_name=profile.first_name,
+        last_name=profile.last_name,
+        bio=profile.bio,
+        avatar_url=profile.avatar_url,
+        skills=profile.skills or [],
+        verified_skills=_verified_skills_list(profile),
+        location=profile.location,
+        hourly_rate=profile.hourly_rate,
+        timezone=profile.timezone,
+        average_rating=profile.average_rating,
+        total_reviews=profile.total_reviews,
+        completed_projects=profile.completed_projects,
+        portfolio_items_count=portfolio_count,
+        github_username=profile.github_username,
+        huggingface_username=profile.huggingface_username,
+        **proof_metrics
+    )
+
+
 @router.get("/search", response_model=List[FreelancerSearchResponse])
 def search_freelancers(
+    response: Response,
     skills: Optional[str] = Query(None, description="Comma-separated list of skills"),
+    skills_match: Literal["any", "all"] = Query("any", description="Match any or all of the listed skills"),
     location: Optional[str] = Query(None, description="Location filter"),
     min_hourly_rate: Optional[float] = Query(None, ge=0),
     max_hourly_rate: Optional[float] = Query(None, ge=0),
@@ -244,26 +288,37 @@ def search_freelancers(
     min_verified_proofs: Optional[int] = Query(None, ge=0, description="Minimum number of verified proofs"),
     min_verified_percentage: Optional[float] = Query(None, ge=0, le=100, description="Minimum verified proof percentage"),
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Ignored when cursor is given"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Search for freelancers with filters"""
-    # Start with freelancers only
-    query = db.query(Profile, User).join(User, Profile.user_id == User.id).filter(
+    """Search for freelancers with filters (keyset pagination via cursor / X-Next-Cursor)"""
+    portfolio_counts = _portfolio_counts_subquery()
+
+    # Start with freelancers only; proof counts come from the user_proof_stats rollup
+    query = db.query(
+        Profile,
+        User,
+        func.coalesce(portfolio_counts.c.portfolio_count, 0),
+        func.coalesce(UserProofStats.total_proofs, 0),
+        func.coalesce(UserProofStats.verified_proofs, 0),
+        func.coalesce(UserProofStats.projects_with_proofs, 0)
+    ).join(User, Profile.user_id == User.id).outerjoin(
+        portfolio_counts, portfolio_counts.c.profile_id == Profile.id
+    ).outerjoin(
+        UserProofStats, UserProofStats.user_id == User.id
+    ).filter(
         User.role == UserRole.FREELANCER,
         User.is_active == True
     )
 
     # Apply filters
     if skills:
-        skill_list = [s.strip() for s in skills.split(",")]
-        # Filter profiles that have any of the specified skills
-        skill_filters = []
-        for skill in skill_list:
-            skill_filters.append(func.json_contains(Profile.skills, f'"{skill}"'))
-        if skill_filters:
-            query = query.filter(or_(*skill_filters))
+        skill_list = normalize_skills(skills.split(","))
+        # Indexed lookup in profile_skills for any/all of the specified skills
+        if skill_list:
+            query = query.filter(Profile.id.in_(profiles_with_skills(skill_list, match_all=skills_match == "all")))
 
     if location:
         query = query.filter(Profile.location.ilike(f"%{location}%"))
@@ -280,88 +335,49 @@ def search_freelancers(
     if min_rating is not None:
         query = query.filter(Profile.average_rating >= min_rating)
 
-    if search_query:
-        search_pattern = f"%{search_query}%"
+    # Proof and verification filters run in SQL so every page holds `limit` qualifying rows
+    if verified_skills_only:
+        query = query.filter(Profile.id.in_(profiles_with_verified_skills()))
+
+    if min_verified_proofs:
+        query = query.filter(UserProofStats.verified_proofs >= min_verified_proofs)
+
+    if min_verified_percentage:
         query = query.filter(
-            or_(
-                Profile.first_name.ilike(search_pattern),
-                Profile.last_name.ilike(search_pattern),
-                Profile.bio.ilike(search_pattern)
-            )
+            UserProofStats.total_proofs > 0,
+            UserProofStats.verified_proofs * 100.0 >= UserProofStats.total_proofs * min_verified_percentage
         )
 
+    order = [
+        (func.coalesce(Profile.average_rating, 0), True),
+        (func.coalesce(Profile.completed_projects, 0), True),
+        (Profile.id, True)
+    ]
+    if search_query:
+        # Full-text index match on name and bio, most relevant first
+        query, rank = profile_search_match(query, db.get_bind().dialect.name, search_query)
+        if rank is not None:
+            order.insert(0, rank)
+
     # Apply pagination
-    results = query.order_by(Profile.average_rating.desc(), Profile.completed_projects.desc()).offset(offset).limit(limit).all()
+    results, next_cursor = split_page(keyset_page(query, order, limit, cursor, offset).all(), order, limit)
+    set_next_cursor(response, next_cursor)
 
     # Build response
-    response = []
-    for profile, user in results:
-        # Count portfolio items
-        portfolio_count = db.query(PortfolioItem).filter(PortfolioItem.profile_id == profile.id).count()
-
-        # Convert verified_skills to proper format
-        verified_skills_list = []
-        if profile.verified_skills:
-            for vs in profile.verified_skills:
-                if isinstance(vs, dict):
-                    verified_skills_list.append(vs)
-
-        # Skip if verified_skills_only is True and user has no verified skills
-        if verified_skills_only and not any(vs.get("verified", False) for vs in verified_skills_list):
-            continue
-
-        # Calculate proof metrics
-        total_proofs = db.query(func.count(ProofOfBuild.id)).filter(
-            ProofOfBuild.user_id == user.id
-        ).scalar() or 0
-
-        verified_proofs = db.query(func.count(ProofOfBuild.id)).filter(
-            ProofOfBuild.user_id == user.id,
-            ProofOfBuild.status == ProofStatus.VERIFIED
-        ).scalar() or 0
-
+    freelancers = []
+    for profile, user, portfolio_count, total_proofs, verified_proofs, projects_with_proofs in results:
         verified_percentage = (verified_proofs / total_proofs * 100) if total_proofs > 0 else 0
 
-        projects_with_proofs = db.query(
-            func.count(func.distinct(ProofOfBuild.project_id))
-        ).filter(
-            ProofOfBuild.user_id == user.id,
-            ProofOfBuild.project_id.isnot(None)
-        ).scalar() or 0
-
-        # Apply proof metric filters
-        if min_verified_proofs is not None and verified_proofs < min_verified_proofs:
-            continue
-
-        if min_verified_percentage is not None and verified_percentage < min_verified_percentage:
-            continue
-
-        badges = _calculate_badges(total_proofs, verified_percentage, projects_with_proofs)
-
-        response.append(FreelancerSearchResponse(
-            user_id=user.id,
-            profile_id=profile.id,
-            first_name=profile.first_name,
-            last_name=profile.last_name,
-            bio=profile.bio,
-            avatar_url=profile.avatar_url,
-            skills=profile.skills or [],
-            verified_skills=verified_skills_list,
-            location=profile.location,
-            hourly_rate=profile.hourly_rate,
-            timezone=profile.timezone,
-            average_rating=profile.average_rating,
-            total_reviews=profile.total_reviews,
-            completed_projects=profile.completed_projects,
-            portfolio_items_count=portfolio_count,
-            github_username=profile.github_username,
-            huggingface_username=profile.huggingface_username,
+        freelancers.append(_freelancer_response(
+            profile,
+            user,
+            portfolio_count,
             total_proofs=total_proofs,
             verified_percentage=round(verified_percentage, 1),
-            badges=badges
+            badges=_calculate_badges(total_proofs, verified_percentage, projects_with_proofs)
         ))
 
-    return response
+    return freelancers
 
 
 @router.get("/featured", response_model=List[FreelancerSearchResponse])
@@ -371,50 +387,26 @@ def get_featured_freelancers(
     db: Session = Depends(get_db)
 ):
     """Get featured freelancers (top-rated with verified skills)"""
-    # Get top freelancers with at least one verified skill
-    query = db.query(Profile, User).join(User, Profile.user_id == User.id).filter(
-        User.role == UserRole.FREELANCER,
-        User.is_active == True,
-        Profile.average_rating >= 4.0,
-        Profile.total_reviews > 0
+    # Served from the precomputed leaderboard: the first `limit` entries of its
+    # rank index, with portfolio counts looked up for just those profiles
+    portfolio_count = select(func.count(PortfolioItem.id)).where(
+        PortfolioItem.profile_id == Profile.id
+    ).correlate(Profile).scalar_subquery()
+
+    query = db.query(Profile, User, portfolio_count).select_from(FeaturedFreelancer).join(
+        Profile, Profile.id == FeaturedFreelancer.profile_id
+    ).join(
+        User, User.id == FeaturedFreelancer.user_id
     ).order_by(
-        Profile.average_rating.desc(),
-        Profile.completed_projects.desc()
+        FeaturedFreelancer.average_rating.desc(),
+        FeaturedFreelancer.completed_projects.desc(),
+        FeaturedFreelancer.profile_id.desc()
     ).limit(limit)
 
-    results = query.all()
-
-    response = []
-    for profile, user in results:
-        portfolio_count = db.query(PortfolioItem).filter(PortfolioItem.profile_id == profile.id).count()
-
-        verified_skills_list = []
-        if profile.verified_skills:
-            for vs in profile.verified_skills:
-                if isinstance(vs, dict):
-                    verified_skills_list.append(vs)
-
-        response.append(FreelancerSearchResponse(
-            user_id=user.id,
-            profile_id=profile.id,
-            first_name=profile.first_name,
-            last_name=profile.last_name,
-            bio=profile.bio,
-            avatar_url=profile.avatar_url,
-            skills=profile.skills or [],
-            verified_skills=verified_skills_list,
-            location=profile.location,
-            hourly_rate=profile.hourly_rate,
-            timezone=profile.timezone,
-            average_rating=profile.average_rating,
-            total_reviews=profile.total_reviews,
-            completed_projects=profile.completed_projects,
-            portfolio_items_count=portfolio_count,
-            github_username=profile.github_username,
-            huggingface_username=profile.huggingface_username
-        ))
-
-    return response
+    return [
+        _freelancer_response(profile, user, portfolio_count)
+        for profile, user, portfolio_count in query.all()
+    ]
 
 
 # ================== Proof Metrics Endpoints ==================
@@ -434,41 +426,27 @@ def get_user_proof_metrics(
     - Projects with proofs
     - Average proofs per project
     - Recent proof activity
+
+    Cached per user until their proofs change; concurrent misses share one computation.
     """
-    # Total proofs created by user
-    total_proofs = db.query(func.count(ProofOfBuild.id)).filter(
-        ProofOfBuild.user_id == user_id
-    ).scalar() or 0
+    return proof_metrics_cache.get_or_compute(user_id, lambda: _compute_proof_metrics(db, user_id))
 
-    # Verified proofs
-    verified_proofs = db.query(func.count(ProofOfBuild.id)).filter(
-        ProofOfBuild.user_id == user_id,
-        ProofOfBuild.status == ProofStatus.VERIFIED
-    ).scalar() or 0
+
+def _compute_proof_metrics(db: Session, user_id: int) -> dict:
+    # Counts come from the user_proof_stats rollup (one primary-key read)
+    stats = get_user_proof_stats(db, user_id)
+    total_proofs = stats["total_proofs"]
+    verified_proofs = stats["verified_proofs"]
+    approved_proofs = stats["approved_proofs"]
+    projects_with_proofs = stats["projects_with_proofs"]
 
     # Calculate verified percentage
     verified_percentage = (verified_proofs / total_proofs * 100) if total_proofs > 0 else 0
 
-    # Approved proofs (proofs with approval records marked as approved)
-    approved_proofs = db.query(func.count(ProofApproval.id)).join(
-        ProofOfBuild, ProofApproval.proof_id == ProofOfBuild.id
-    ).filter(
-        ProofOfBuild.user_id == user_id,
-        ProofApproval.status == ApprovalStatus.APPROVED
-    ).scalar() or 0
-
-    # Projects with proofs
-    projects_with_proofs = db.query(
-        func.count(func.distinct(ProofOfBuild.project_id))
-    ).filter(
-        ProofOfBuild.user_id == user_id,
-        ProofOfBuild.project_id.isnot(None)
-    ).scalar() or 0
-
     # Average proofs per project
     avg_proofs_per_project = round(total_proofs / projects_with_proofs, 1) if projects_with_proofs > 0 else 0
 
-    # Recent proof activity (last 30 days)
+    # Recent proof activity (last 30 days) - time-windowed, so counted live
     from datetime import timedelta
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
 
@@ -478,14 +456,7 @@ def get_user_proof_metrics(
     ).scalar() or 0
 
     # Proof types breakdown
-    from app.models.models import ProofType
-    proof_types_breakdown = {}
-    for pt in ProofType:
-        count = db.query(func.count(ProofOfBuild.id)).filter(
-            ProofOfBuild.user_id == user_id,
-            ProofOfBuild.proof_type == pt
-        ).scalar() or 0
-        proof_types_breakdown[pt.value] = count
+    proof_types_breakdown = {pt.value: stats["proofs_by_type"].get(pt.value, 0) for pt in ProofType}
 
     return {
         "user_id": user_id,
@@ -15,6 +15,7 @@ from app.schemas.schemas import (
     MilestoneReviewRequest, MilestoneApprovalRequest
 )
 from app.api.dependencies import get_current_user
+import app.services.proof_stats  # noqa: F401 - keeps user_proof_stats in sync on every proof flush
 
 logger = logging.getLogger(__name__)
 
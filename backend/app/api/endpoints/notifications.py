@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
-from app.db.database import get_db
+from app.db.database import get_db, get_read_db
 from app.models.models import Notification, User
 from app.api.dependencies import get_current_user
 from datetime import datetime
@@ -12,7 +12,7 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 @router.get("/")
 def get_notifications(
     unread_only: bool = False,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all notifications for the current user"""
@@ -2,40 +2,37 @@
 Payment API endpoints - Handles Stripe payment processing
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-import stripe
 import logging
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.models.models import Payment, User, Project, PaymentStatus
 from app.schemas.schemas import (
     PaymentIntentCreate, PaymentConfirm, PaymentResponse
 )
 from app.api.dependencies import get_current_user
-from app.services.payment_service import PaymentService
+from app.services.payment_service import PaymentService, load_stripe
 from app.services.escrow_service import EscrowService
 from app.core.config import settings
 
 router = APIRouter(prefix="/payments", tags=["payments"])
 logger = logging.getLogger(__name__)
 
-# Configure Stripe
-stripe.api_key = settings.STRIPE_SECRET_KEY
-
 
 @router.post("/create-intent", status_code=status.HTTP_201_CREATED)
 async def create_payment_intent(
     payment_data: PaymentIntentCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a Stripe payment intent for a project
     User must be the project owner (payer)
     """
     # Verify project exists
-    project = db.query(Project).filter(Project.id == payment_data.project_id).first()
+    project = await db.get(Project, payment_data.project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -51,10 +48,12 @@ async def create_payment_intent(
 
     # Get accepted application to determine payee
     from app.models.models import Application, ApplicationStatus
-    accepted_app = db.query(Application).filter(
-        Application.project_id == payment_data.project_id,
-        Application.status == ApplicationStatus.ACCEPTED
-    ).first()
+    accepted_app = await db.scalar(
+        select(Application).where(
+            Application.project_id == payment_data.project_id,
+            Application.status == ApplicationStatus.ACCEPTED
+        ).limit(1)
+    )
 
     if not accepted_app:
         raise HTTPException(
@@ -63,13 +62,14 @@ async def create_payment_intent(
         )
 
     try:
-        payment_service = PaymentService(db)
-        payment, client_secret = payment_service.create_payment_intent(
-            project_id=payment_data.project_id,
-            amount=payment_data.amount,
-            payer_id=current_user.id,
-            payee_id=accepted_app.applicant_id,
-            metadata=payment_data.metadata
+        payment, client_secret = await db.run_sync(
+            lambda session: PaymentService(session).create_payment_intent(
+                project_id=payment_data.project_id,
+                amount=payment_data.amount,
+                payer_id=current_user.id,
+                payee_id=accepted_app.applicant_id,
+                metadata=payment_data.metadata
+            )
         )
 
         return {
@@ -97,14 +97,13 @@ async def create_payment_intent(
 async def confirm_payment(
     payment_data: PaymentConfirm,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Confirm a payment and move to PROCESSING/COMPLETED status
     User must be the payer
     """
-    payment_service = PaymentService(db)
-    payment = payment_service.get_payment_by_id(payment_data.payment_id)
+    payment = await db.get(Payment, payment_data.payment_id)
 
     if not payment:
         raise HTTPException(
@@ -120,9 +119,11 @@ async def confirm_payment(
         )
 
     try:
-        updated_payment = payment_service.confirm_payment(
-            payment_id=payment_data.payment_id,
-            payment_method_id=payment_data.payment_method_id
+        updated_payment = await db.run_sync(
+            lambda session: PaymentService(session).confirm_payment(
+                payment_id=payment_data.payment_id,
+                payment_method_id=payment_data.payment_method_id
+            )
         )
         return updated_payment
 
@@ -140,11 +141,12 @@ async def confirm_payment(
 
 
 @router.post("/webhook")
-async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
+async def stripe_webhook(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Handle Stripe webhook events
     This endpoint is called by Stripe to notify us of payment events
     """
+    stripe = load_stripe()
     payload = await request.body()
     sig_header = request.headers.get("stripe-signature")
 
@@ -159,25 +161,26 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
         logger.error("Invalid webhook signature")
         raise HTTPException(status_code=400, detail="Invalid signature")
 
-    payment_service = PaymentService(db)
-    escrow_service = EscrowService(db)
-
     # Handle the event
     if event["type"] == "payment_intent.succeeded":
         payment_intent = event["data"]["object"]
-        payment = payment_service.update_payment_from_webhook(
-            payment_intent["id"],
-            "succeeded"
+        payment = await db.run_sync(
+            lambda session: PaymentService(session).update_payment_from_webhook(
+                payment_intent["id"],
+                "succeeded"
+            )
         )
 
         if payment:
             # Create escrow when payment succeeds
             try:
-                escrow = escrow_service.create_escrow(
-                    payment_id=payment.id,
-                    project_id=payment.project_id,
-                    amount=payment.amount,
-                    release_condition="proof_verified"
+                escrow = await db.run_sync(
+                    lambda session: EscrowService(session).create_escrow(
+                        payment_id=payment.id,
+                        project_id=payment.project_id,
+                        amount=payment.amount,
+                        release_condition="proof_verified"
+                    )
                 )
                 logger.info(f"Escrow {escrow.id} created for payment {payment.id}")
 
@@ -203,16 +206,18 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
                     notification_data={"payment_id": payment.id, "escrow_id": escrow.id}
                 )
                 db.add(payee_notification)
-                db.commit()
+                await db.commit()
 
             except Exception as e:
                 logger.error(f"Failed to create escrow: {str(e)}")
 
     elif event["type"] == "payment_intent.payment_failed":
         payment_intent = event["data"]["object"]
-        payment = payment_service.update_payment_from_webhook(
-            payment_intent["id"],
-            "payment_failed"
+        payment = await db.run_sync(
+            lambda session: PaymentService(session).update_payment_from_webhook(
+                payment_intent["id"],
+                "payment_failed"
+            )
         )
 
         if payment:
@@ -226,7 +231,7 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
                 notification_data={"payment_id": payment.id}
             )
             db.add(notification)
-            db.commit()
+            await db.commit()
 
     return {"status": "success"}
 
@@ -234,16 +239,17 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
 @router.get("/", response_model=List[PaymentResponse])
 async def list_payments(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all payments for current user (as payer or payee)
     """
-    payment_service = PaymentService(db)
-    payments = payment_service.get_user_payments(
-        user_id=current_user.id,
-        as_payer=True,
-        as_payee=True
+    payments = await db.run_sync(
+        lambda session: PaymentService(session).get_user_payments(
+            user_id=current_user.id,
+            as_payer=True,
+            as_payee=True
+        )
     )
     return payments
 
@@ -252,14 +258,13 @@ async def list_payments(
 async def get_payment(
     payment_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get payment details
     User must be payer or payee
     """
-    payment_service = PaymentService(db)
-    payment = payment_service.get_payment_by_id(payment_id)
+    payment = await db.get(Payment, payment_id)
 
     if not payment:
         raise HTTPException(
@@ -281,13 +286,13 @@ async def get_payment(
 async def get_project_payments(
     project_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all payments for a project
     User must be project owner or involved in payments
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -295,8 +300,9 @@ async def get_project_payments(
         )
 
     # Verify user has access
-    payment_service = PaymentService(db)
-    payments = payment_service.get_project_payments(project_id)
+    payments = await db.run_sync(
+        lambda session: PaymentService(session).get_project_payments(project_id)
+    )
 
     # Filter to only show payments user is involved in
     user_payments = [
@@ -313,14 +319,13 @@ async def refund_payment(
     amount: float = None,
     reason: str = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Refund a payment (full or partial)
     Only project owner (payer) can request refund
     """
-    payment_service = PaymentService(db)
-    payment = payment_service.get_payment_by_id(payment_id)
+    payment = await db.get(Payment, payment_id)
 
     if not payment:
         raise HTTPException(
@@ -336,10 +341,12 @@ async def refund_payment(
         )
 
     try:
-        refunded_payment = payment_service.refund_payment(
-            payment_id=payment_id,
-            amount=amount,
-            reason=reason
+        refunded_payment = await db.run_sync(
+            lambda session: PaymentService(session).refund_payment(
+                payment_id=payment_id,
+                amount=amount,
+                reason=reason
+            )
         )
         return refunded_payment
 
@@ -1,13 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.db.database import get_db
+from typing import List, Literal, Optional, Tuple
+from app.db.database import get_db, get_read_db
 from app.models.models import Project, User, ProjectStatus, ProofOfBuild, Application, ApplicationStatus
 from app.schemas.schemas import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectFilter, ProofOfBuildResponse
 from app.api.dependencies import get_current_user, get_current_user_optional
+from app.services.skill_index import normalize_skills, projects_with_skills
+from app.api.pagination import NEXT_CURSOR_HEADER, keyset_page, split_page
+from app.core.response_cache import cached_json_response
+from app.services.project_cache import (
+    PROJECT_LIST_TAG, caller_class, detail_cache_key, list_cache_key, project_response_cache, project_tag
+)
+from app.services.project_recommender import recommend_projects
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+_project_list = TypeAdapter(List[ProjectResponse])
+
 
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 def create_project(
@@ -35,18 +45,20 @@ def create_project(
     return new_project
 
 
-@router.get("/", response_model=List[ProjectResponse])
-def get_projects(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=100),
-    category: Optional[str] = None,
-    status: Optional[ProjectStatus] = None,
-    min_budget: Optional[float] = None,
-    max_budget: Optional[float] = None,
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user_optional)
-):
-    """Get all projects with filters (public endpoint - authentication optional)"""
+def query_projects(
+    db: Session,
+    current_user: Optional[User],
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    category: Optional[str],
+    status: Optional[ProjectStatus],
+    min_budget: Optional[float],
+    max_budget: Optional[float],
+    skills: List[str],
+    skills_match: str
+) -> Tuple[List[Project], Optional[str]]:
+    """One page of the project list and the cursor of the next page (uncached)"""
     query = db.query(Project)
 
     # Apply filters
@@ -66,27 +78,103 @@ def get_projects(
         query = query.filter(Project.budget >= min_budget)
     if max_budget:
         query = query.filter(Project.budget <= max_budget)
+    if skills:
+        query = query.filter(Project.id.in_(projects_with_skills(skills, match_all=skills_match == "all")))
 
-    projects = query.order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
-    return projects
+    order = [(Project.created_at, True), (Project.id, True)]
+    return split_page(keyset_page(query, order, limit, cursor, skip).all(), order, limit)
+
+
+@router.get("/", response_model=List[ProjectResponse])
+def get_projects(
+    request: Request,
+    skip: int = Query(0, ge=0, description="Ignored when cursor is given"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    category: Optional[str] = None,
+    status: Optional[ProjectStatus] = None,
+    min_budget: Optional[float] = None,
+    max_budget: Optional[float] = None,
+    skills: Optional[str] = Query(None, description="Comma-separated list of required skills"),
+    skills_match: Literal["any", "all"] = Query("any", description="Match any or all of the listed skills"),
+    # The primary, not a replica - a lagging page would be cached for the whole TTL
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """Get all projects with filters (public endpoint - authentication optional)
+
+    Newest first; pass the X-Next-Cursor header of a page as `cursor` to get the next one.
+    Responses carry an ETag - send it back as If-None-Match to get 304 when nothing changed.
+    """
+    skill_list = normalize_skills(skills.split(",")) if skills else []
+    key = list_cache_key(caller_class(current_user), {
+        "skip": 0 if cursor else skip,
+        "limit": limit,
+        "cursor": cursor,
+        "category": category,
+        "status": status.value if status else None,
+        "min_budget": min_budget or None,
+        "max_budget": max_budget or None,
+        "skills": skill_list,
+        "skills_match": skills_match if skill_list else None,
+    })
+
+    def render():
+        projects, next_cursor = query_projects(
+            db, current_user, skip, limit, cursor, category, status, min_budget, max_budget, skill_list, skills_match
+        )
+        body = _project_list.dump_json(_project_list.validate_python(projects, from_attributes=True))
+        return body, ({NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {})
+
+    cached = project_response_cache.get_or_compute(key, (PROJECT_LIST_TAG,), render)
+    return cached_json_response(request, cached)
+
+
+@router.get("/recommended", response_model=List[ProjectResponse])
+def get_recommended_projects(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the open projects that best match the current freelancer (skills, category, experience)
+
+    Projects the freelancer already applied to are left out.
+    """
+    from app.models.models import UserRole
+
+    if current_user.role not in [UserRole.FREELANCER, UserRole.AGENT]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only freelancers and agents get project recommendations"
+        )
+
+    return recommend_projects(db, current_user, limit)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project(
     project_id: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
-    """Get a specific project by ID (public endpoint - authentication optional)"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    """Get a specific project by ID (public endpoint - authentication optional)
 
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
+    The response carries an ETag - send it back as If-None-Match to get 304 when nothing changed.
+    """
+    def render():
+        project = db.query(Project).filter(Project.id == project_id).first()
 
-    return project
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+
+        return ProjectResponse.model_validate(project).model_dump_json().encode(), {}
+
+    cached = project_response_cache.get_or_compute(detail_cache_key(project_id), (project_tag(project_id),), render)
+    return cached_json_response(request, cached)
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
@@ -1,22 +1,23 @@
 """
 Reviews API endpoints - Handles post-project feedback and ratings
 """
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from typing import List, Optional
 import logging
 
-from app.db.database import get_db
+from app.db.database import get_async_db, get_async_read_db
 from app.models.models import Review, User, Project, Application, ApplicationStatus, Profile
 from app.schemas.schemas import ReviewCreate, ReviewResponse, ReviewSummary
 from app.api.dependencies import get_current_user
+from app.api.pagination import keyset_page, set_next_cursor, split_page
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 logger = logging.getLogger(__name__)
 
 
-def update_user_rating(user_id: int, db: Session):
+async def update_user_rating(user_id: int, db: AsyncSession):
     """
     Update user profile with average rating and total reviews
 
@@ -24,30 +25,35 @@ def update_user_rating(user_id: int, db: Session):
         user_id: ID of the user to update
         db: Database session
     """
-    result = db.query(
-        func.avg(Review.rating),
-        func.count(Review.id)
-    ).filter(Review.reviewee_id == user_id).first()
+    # Flush pending review changes so the aggregate sees them (autoflush is off)
+    await db.flush()
 
-    profile = db.query(Profile).filter(Profile.user_id == user_id).first()
+    result = (await db.execute(
+        select(
+            func.avg(Review.rating),
+            func.count(Review.id)
+        ).where(Review.reviewee_id == user_id)
+    )).first()
+
+    profile = await db.scalar(select(Profile).where(Profile.user_id == user_id))
     if profile:
         profile.average_rating = float(result[0]) if result[0] else 0.0
         profile.total_reviews = result[1] or 0
-        db.commit()
+        await db.commit()
 
 
 @router.post("/", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
 async def create_review(
     review_data: ReviewCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Create a review after project completion
     User must be involved in the project (as owner or worker)
     """
     # Verify project exists
-    project = db.query(Project).filter(Project.id == review_data.project_id).first()
+    project = await db.get(Project, review_data.project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -55,7 +61,7 @@ async def create_review(
         )
 
     # Verify reviewee exists
-    reviewee = db.query(User).filter(User.id == review_data.reviewee_id).first()
+    reviewee = await db.get(User, review_data.reviewee_id)
     if not reviewee:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -71,11 +77,13 @@ async def create_review(
 
     # Verify reviewer was involved in the project
     is_owner = project.owner_id == current_user.id
-    is_worker = db.query(Application).filter(
-        Application.project_id == review_data.project_id,
-        Application.applicant_id == current_user.id,
-        Application.status == ApplicationStatus.ACCEPTED
-    ).first() is not None
+    is_worker = await db.scalar(
+        select(Application.id).where(
+            Application.project_id == review_data.project_id,
+            Application.applicant_id == current_user.id,
+            Application.status == ApplicationStatus.ACCEPTED
+        ).limit(1)
+    ) is not None
 
     if not (is_owner or is_worker):
         raise HTTPException(
@@ -85,11 +93,13 @@ async def create_review(
 
     # Verify reviewee was involved in the project
     reviewee_is_owner = project.owner_id == review_data.reviewee_id
-    reviewee_is_worker = db.query(Application).filter(
-        Application.project_id == review_data.project_id,
-        Application.applicant_id == review_data.reviewee_id,
-        Application.status == ApplicationStatus.ACCEPTED
-    ).first() is not None
+    reviewee_is_worker = await db.scalar(
+        select(Application.id).where(
+            Application.project_id == review_data.project_id,
+            Application.applicant_id == review_data.reviewee_id,
+            Application.status == ApplicationStatus.ACCEPTED
+        ).limit(1)
+    ) is not None
 
     if not (reviewee_is_owner or reviewee_is_worker):
         raise HTTPException(
@@ -98,11 +108,13 @@ async def create_review(
         )
 
     # Prevent duplicate reviews
-    existing_review = db.query(Review).filter(
-        Review.project_id == review_data.project_id,
-        Review.reviewer_id == current_user.id,
-        Review.reviewee_id == review_data.reviewee_id
-    ).first()
+    existing_review = await db.scalar(
+        select(Review).where(
+            Review.project_id == review_data.project_id,
+            Review.reviewer_id == current_user.id,
+            Review.reviewee_id == review_data.reviewee_id
+        ).limit(1)
+    )
 
     if existing_review:
         raise HTTPException(
@@ -129,10 +141,10 @@ async def create_review(
     db.add(review)
 
     # Update reviewee's average rating
-    update_user_rating(review_data.reviewee_id, db)
+    await update_user_rating(review_data.reviewee_id, db)
 
-    db.commit()
-    db.refresh(review)
+    await db.commit()
+    await db.refresh(review)
 
     # Create notification for reviewee
     from app.models.models import Notification
@@ -145,7 +157,7 @@ async def create_review(
         notification_data={"review_id": review.id, "project_id": project.id, "rating": review_data.rating}
     )
     db.add(notification)
-    db.commit()
+    await db.commit()
 
     return review
 
@@ -153,24 +165,30 @@ async def create_review(
 @router.get("/user/{user_id}", response_model=List[ReviewResponse])
 async def get_user_reviews(
     user_id: int,
-    skip: int = 0,
-    limit: int = 20,
-    db: Session = Depends(get_db)
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get all reviews for a user (as reviewee)
     Public endpoint - anyone can see reviews
+    Newest first; `cursor` takes the X-Next-Cursor header of the previous page
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
-    reviews = db.query(Review).filter(
-        Review.reviewee_id == user_id
-    ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
+    order = [(Review.created_at, True), (Review.id, True)]
+    rows = (await db.execute(
+        keyset_page(select(Review).where(Review.reviewee_id == user_id), order, limit, cursor, skip)
+    )).all()
+    reviews, next_cursor = split_page(rows, order, limit)
+    set_next_cursor(response, next_cursor)
 
     return reviews
 
@@ -178,25 +196,27 @@ async def get_user_reviews(
 @router.get("/user/{user_id}/summary", response_model=ReviewSummary)
 async def get_review_summary(
     user_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get review summary statistics for a user
     Public endpoint
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
-    summary = db.query(
-        func.avg(Review.rating).label("average_rating"),
-        func.count(Review.id).label("total_reviews"),
-        func.min(Review.rating).label("min_rating"),
-        func.max(Review.rating).label("max_rating")
-    ).filter(Review.reviewee_id == user_id).first()
+    summary = (await db.execute(
+        select(
+            func.avg(Review.rating).label("average_rating"),
+            func.count(Review.id).label("total_reviews"),
+            func.min(Review.rating).label("min_rating"),
+            func.max(Review.rating).label("max_rating")
+        ).where(Review.reviewee_id == user_id)
+    )).first()
 
     return {
         "average_rating": float(summary.average_rating or 0),
@@ -209,22 +229,24 @@ async def get_review_summary(
 @router.get("/project/{project_id}", response_model=List[ReviewResponse])
 async def get_project_reviews(
     project_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all reviews for a project
     Public endpoint
     """
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
 
-    reviews = db.query(Review).filter(
-        Review.project_id == project_id
-    ).order_by(Review.created_at.desc()).all()
+    reviews = (await db.scalars(
+        select(Review).where(
+            Review.project_id == project_id
+        ).order_by(Review.created_at.desc())
+    )).all()
 
     return reviews
 
@@ -234,14 +256,16 @@ async def get_reviews_given(
     skip: int = 0,
     limit: int = 20,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all reviews given by current user
     """
-    reviews = db.query(Review).filter(
-        Review.reviewer_id == current_user.id
-    ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
+    reviews = (await db.scalars(
+        select(Review).where(
+            Review.reviewer_id == current_user.id
+        ).order_by(Review.created_at.desc()).offset(skip).limit(limit)
+    )).all()
 
     return reviews
 
@@ -251,14 +275,16 @@ async def get_reviews_received(
     skip: int = 0,
     limit: int = 20,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all reviews received by current user
     """
-    reviews = db.query(Review).filter(
-        Review.reviewee_id == current_user.id
-    ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
+    reviews = (await db.scalars(
+        select(Review).where(
+            Review.reviewee_id == current_user.id
+        ).order_by(Review.created_at.desc()).offset(skip).limit(limit)
+    )).all()
 
     return reviews
 
@@ -266,13 +292,13 @@ async def get_reviews_received(
 @router.get("/{review_id}", response_model=ReviewResponse)
 async def get_review(
     review_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a specific review
     Public endpoint
     """
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = await db.get(Review, review_id)
     if not review:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -286,13 +312,13 @@ async def get_review(
 async def delete_review(
     review_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete a review
     Only the reviewer can delete their own review
     """
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = await db.get(Review, review_id)
 
     if not review:
         raise HTTPException(
@@ -308,12 +334,12 @@ async def delete_review(
         )
 
     reviewee_id = review.reviewee_id
-    db.delete(review)
+    await db.delete(review)
 
     # Update reviewee's rating after deletion
-    update_user_rating(reviewee_id, db)
+    await update_user_rating(reviewee_id, db)
 
-    db.commit()
+    await db.commit()
 
     return None
 
@@ -323,13 +349,13 @@ async def update_review(
     review_id: int,
     review_data: ReviewCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update a review
     Only the reviewer can update their own review
     """
-    review = db.query(Review).filter(Review.id == review_id).first()
+    review = await db.get(Review, review_id)
 
     if not review:
         raise HTTPException(
@@ -356,9 +382,9 @@ async def update_review(
     review.comment = review_data.comment
 
     # Update reviewee's average rating
-    update_user_rating(review.reviewee_id, db)
+    await update_user_rating(review.reviewee_id, db)
 
-    db.commit()
-    db.refresh(review)
+    await db.commit()
+    await db.refresh(review)
 
     return review
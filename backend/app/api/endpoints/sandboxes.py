@@ -21,7 +21,7 @@ from app.schemas.schemas import (
     SandboxCollaboratorResponse,
 )
 from app.api.dependencies import get_current_user
-from app.services.sandbox_service import sandbox_service
+from app.services.sandbox_service import get_sandbox_service
 
 logger = logging.getLogger(__name__)
 
@@ -101,7 +101,7 @@ def create_sandbox(
     if not files:
         # Create starter template
         language = sandbox_data.language.value
-        template = sandbox_service.get_language_template(language)
+        template = get_sandbox_service().get_language_template(language)
 
         file_ext = {
             "python": "py",
@@ -265,7 +265,7 @@ async def delete_sandbox(
 
     # Terminate container if exists
     if sandbox.container_id:
-        await sandbox_service.terminate_sandbox_container(sandbox.container_id)
+        await get_sandbox_service().terminate_sandbox_container(sandbox.container_id)
 
     db.delete(sandbox)
     db.commit()
@@ -322,7 +322,7 @@ async def execute_code(
         code = file_data["content"]
 
     # Execute
-    success, output, error, duration_ms = await sandbox_service.execute_code(
+    success, output, error, duration_ms = await get_sandbox_service().execute_code(
         code=code,
         language=sandbox.language.value,
         timeout=execute_request.timeout,
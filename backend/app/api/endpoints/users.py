@@ -6,6 +6,10 @@ from app.schemas.schemas import (
     ProfileResponse, ProfileUpdate, UserResponse, DashboardStats
 )
 from app.api.dependencies import get_current_user
+from app.core.config import settings
+from app.core.file_storage import UploadTooLarge
+from app.services.dashboard_stats import get_user_dashboard_stats
+from app.services.uploads import AVATAR_TYPES, RESUME_TYPES, store_upload
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -100,58 +104,57 @@ def get_dashboard_stats(
     db: Session = Depends(get_db)
 ):
     """Get dashboard statistics for current user"""
-    from app.models.models import Application, Project, ProjectStatus, ApplicationStatus
-    
-    profile = db.query(Profile).filter(Profile.user_id == current_user.id).first()
-    
-    # Get active projects
+    # Precomputed counters - one primary-key read (see app.services.dashboard_stats)
+    stats = get_user_dashboard_stats(db, current_user.id)
+
     if current_user.role.value == "business":
-        active_projects = db.query(Project).filter(
-            Project.owner_id == current_user.id,
-            Project.status == ProjectStatus.IN_PROGRESS
-        ).count()
+        active_projects = stats["owned_active_projects"]
     else:
         # For freelancers, count accepted applications
-        active_projects = db.query(Application).filter(
-            Application.applicant_id == current_user.id,
-            Application.status == ApplicationStatus.ACCEPTED
-        ).count()
-    
-    # Get pending applications
-    pending_applications = db.query(Application).filter(
-        Application.applicant_id == current_user.id,
-        Application.status == ApplicationStatus.PENDING
-    ).count()
-    
+        active_projects = stats["accepted_applications"]
+
     return DashboardStats(
-        total_earnings=profile.total_earnings if profile else 0,
+        total_earnings=stats["total_earnings"],
         active_projects=active_projects,
-        completed_projects=profile.completed_projects if profile else 0,
-        pending_applications=pending_applications,
-        average_rating=profile.average_rating if profile else 0,
-        total_reviews=profile.total_reviews if profile else 0
+        completed_projects=stats["completed_projects"],
+        pending_applications=stats["pending_applications"],
+        average_rating=stats["average_rating"],
+        total_reviews=stats["total_reviews"]
     )
 
 
+async def _store_profile_file(file: UploadFile, allowed_types, max_bytes: int) -> str:
+    try:
+        return await store_upload(file, allowed_types, max_bytes)
+    except UploadTooLarge as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large (max {e.max_bytes} bytes)"
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.post("/me/profile/avatar")
 async def upload_avatar(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Upload profile avatar (placeholder - implement S3 upload in production)"""
-    # In production, upload to S3 and store URL
-    # For now, just return success
-    
+    """Upload profile avatar (JPEG, PNG, GIF or WebP, up to AVATAR_MAX_BYTES)"""
+    url = await _store_profile_file(file, AVATAR_TYPES, settings.AVATAR_MAX_BYTES)
+
     profile = db.query(Profile).filter(Profile.user_id == current_user.id).first()
     if not profile:
         profile = Profile(user_id=current_user.id)
         db.add(profile)
-    
-    # Placeholder URL - in production, upload to S3
-    profile.avatar_url = f"https://placeholder-url.com/avatars/{current_user.id}"
+
+    profile.avatar_url = url
     db.commit()
-    
+
     return {"message": "Avatar uploaded successfully", "url": profile.avatar_url}
 
 
@@ -161,14 +164,15 @@ async def upload_resume(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Upload resume (placeholder - implement S3 upload in production)"""
+    """Upload resume (PDF or Word, up to RESUME_MAX_BYTES)"""
+    url = await _store_profile_file(file, RESUME_TYPES, settings.RESUME_MAX_BYTES)
+
     profile = db.query(Profile).filter(Profile.user_id == current_user.id).first()
     if not profile:
         profile = Profile(user_id=current_user.id)
         db.add(profile)
-    
-    # Placeholder URL - in production, upload to S3
-    profile.resume_url = f"https://placeholder-url.com/resumes/{current_user.id}"
+
+    profile.resume_url = url
     db.commit()
-    
+
     return {"message": "Resume uploaded successfully", "url": profile.resume_url}
@@ -18,6 +18,7 @@ from app.models.models import (
     ProofType, ProofStatus
 )
 from app.core.config import settings
+import app.services.proof_stats  # noqa: F401 - keeps user_proof_stats in sync on every proof flush
 
 logger = logging.getLogger(__name__)
 
@@ -0,0 +1,42 @@
+"""
+Keyset pagination for list endpoints - the HTTP side of app.db.pagination
+
+Endpoints page with `keyset_page` / `split_page` and return the next page's
+cursor as the `X-Next-Cursor` response header (list response bodies are
+unchanged); clients pass it back as `?cursor=`.
+
+    order = [(Project.created_at, True), (Project.id, True)]
+    stmt = keyset_page(query, order, limit, cursor, offset=skip)
+    projects, next_cursor = split_page(stmt.all(), order, limit)
+    set_next_cursor(response, next_cursor)
+
+Declare `limit` as Query(..., ge=1) - a page needs at least one row.
+"""
+from typing import Optional
+
+from fastapi import HTTPException, Response, status
+
+from app.db import pagination
+from app.db.pagination import InvalidCursor, OrderKey, decode_cursor, encode_cursor, split_page  # noqa: F401
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def invalid_cursor_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor"
+    )
+
+
+def keyset_page(stmt, order: OrderKey, limit: int, cursor: Optional[str] = None, offset: int = 0):
+    """app.db.pagination.keyset_page, answering a bad cursor with 400"""
+    try:
+        return pagination.keyset_page(stmt, order, limit, cursor, offset)
+    except InvalidCursor:
+        raise invalid_cursor_error()
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
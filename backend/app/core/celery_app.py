@@ -14,7 +14,8 @@ celery_app = Celery(
     "remote_works",
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=["app.tasks.ai_tasks", "app.tasks.email_tasks"]
+    include=["app.tasks.ai_tasks", "app.tasks.email_tasks", "app.tasks.leaderboard_tasks", "app.tasks.match_tasks",
+             "app.tasks.dashboard_tasks"]
 )
 
 # Configure Celery
@@ -27,6 +28,9 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    # Publishing from a web request fails fast instead of stalling on an unreachable broker
+    broker_connection_timeout=2,
+    broker_transport_options={"socket_connect_timeout": 2},
 )
 
 # Periodic tasks schedule
@@ -41,4 +45,14 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.ai_tasks.cleanup_old_summaries",
         "schedule": crontab(hour=0, minute=0, day_of_week=0),  # Sunday midnight
     },
+    # Rebuild the featured-freelancer leaderboard every 15 minutes
+    "refresh-featured-leaderboard": {
+        "task": "app.tasks.leaderboard_tasks.refresh_featured_leaderboard",
+        "schedule": crontab(minute="*/15"),
+    },
+    # Reconcile /users/me/stats counters every hour
+    "reconcile-dashboard-stats": {
+        "task": "app.tasks.dashboard_tasks.reconcile_dashboard_stats",
+        "schedule": crontab(minute=30),
+    },
 }
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 import os
 import json
 
@@ -13,6 +13,21 @@ class Settings(BaseSettings):
     # Database
     # Default to SQLite for easy local development
     DATABASE_URL: str = "sqlite:///./remoteworks.db"
+    # Optional read replicas - JSON list or comma-separated URLs. Read-heavy GET
+    # endpoints send their SELECTs here; writes always use DATABASE_URL
+    DATABASE_REPLICA_URLS: Union[str, List[str]] = []
+
+    # Connection pool - unset values fall back to the per-backend defaults.
+    # With DB_POOL_ADAPTIVE the pool is sized from DB_MAX_CONNECTIONS shared
+    # across WEB_CONCURRENCY workers, and overflow is tuned from checkout waits
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_ADAPTIVE: bool = False
+    DB_POOL_MIN_SIZE: int = 2
+    DB_MAX_CONNECTIONS: int = 60  # Per engine, across all workers
+    DB_POOL_TARGET_WAIT_MS: float = 50.0
+    WEB_CONCURRENCY: int = 1  # Worker processes (same variable uvicorn/gunicorn read)
 
     # Security
     # Default secret key for development (change in production!)
@@ -20,6 +35,18 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Password hashing - changing BCRYPT_ROUNDS rehashes each user's password on next login
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # Hashes waiting for a worker before /login returns 503
+    TOKEN_CACHE_MAX_SIZE: int = 10000  # Verified JWTs kept in memory until they expire (0 disables)
+    # Authenticated-user cache: "memory" (per process), "redis" (shared) or "none".
+    # A worker only evicts users changed through its own sessions, so "memory" would
+    # let other workers keep a deactivated or re-roled user for the whole TTL - with
+    # WEB_CONCURRENCY > 1 it is refused (logged, cache disabled); use "redis" there
+    USER_CACHE_BACKEND: str = "memory"
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
 
     # CORS - Support both string (JSON) and list format
     BACKEND_CORS_ORIGINS: Union[str, List[str]] = ["http://localhost:3000"]
@@ -39,6 +66,16 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str = ""
     AWS_BUCKET_NAME: str = ""
     AWS_REGION: str = "us-east-1"
+    AWS_S3_ENDPOINT_URL: str = ""  # S3-compatible store (MinIO, R2, ...); empty for AWS
+
+    # Uploaded files (avatars, resumes) - content-addressed by SHA-256.
+    # FILE_STORAGE_BACKEND: "local" (under FILE_STORAGE_DIR) or "s3" (AWS_BUCKET_NAME)
+    FILE_STORAGE_BACKEND: str = "local"
+    FILE_STORAGE_DIR: str = "./uploads"
+    FILE_BASE_URL: str = ""  # Prepended to stored file URLs, e.g. https://api.remote-works.io
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    AVATAR_MAX_BYTES: int = 5 * 1024 * 1024
+    RESUME_MAX_BYTES: int = 10 * 1024 * 1024
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -61,10 +98,37 @@ class Settings(BaseSettings):
 
     # Proof-of-Build
     PROOF_SIGNATURE_KEY: str = "proof-signature-key-change-in-production"  # Key for signing certificates
+    # /freelancers/{id}/proof-metrics responses cached per process, evicted on proof writes
+    PROOF_METRICS_CACHE_TTL_SECONDS: int = 60
+    PROOF_METRICS_CACHE_MAX_SIZE: int = 10000
+
+    # Application re-scoring after skill changes runs on a background thread in the
+    # committing process; set to queue it to a Celery worker instead (needs a running worker)
+    MATCH_RESCORE_CELERY: bool = False
+
+    # Project recommendations - per-process index of open projects behind /projects/recommended,
+    # updated on project writes in this process and fully rebuilt after this many seconds
+    PROJECT_INDEX_REFRESH_SECONDS: int = 300
+    # GET /projects/ and /projects/{id} responses cached per process, invalidated on project writes (0 disables)
+    PROJECT_CACHE_TTL_SECONDS: int = 30
+    PROJECT_CACHE_MAX_SIZE: int = 5000
 
     # Environment
     ENVIRONMENT: str = "development"
 
+    # Observability - per-route Prometheus metrics served at /metrics
+    METRICS_ENABLED: bool = True
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 10.0  # Background DB ping behind /health/ready
+    DIAGNOSTICS_CACHE_TTL_SECONDS: int = 30
+    # N+1 detector for dev/test runs - logs statements repeated within a request.
+    # QUERY_BUDGET_STRICT raises when a route runs more statements than its budget.
+    # QUERY_BUDGETS - JSON object keyed by "METHOD /route/template"
+    QUERY_INSPECTOR_ENABLED: bool = False
+    QUERY_INSPECTOR_REPEAT_THRESHOLD: int = 5
+    QUERY_BUDGET_STRICT: bool = False
+    QUERY_BUDGET_DEFAULT: int = 30
+    QUERY_BUDGETS: Union[str, Dict[str, int]] = {}
+
     # Frontend URL (for production CORS)
     FRONTEND_URL: str = "http://localhost:3000"
 
@@ -72,6 +136,26 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = True
 
+    @property
+    def replica_urls(self) -> List[str]:
+        """Parse read replica URLs from string (JSON or comma-separated) or list"""
+        if isinstance(self.DATABASE_REPLICA_URLS, str):
+            try:
+                urls = json.loads(self.DATABASE_REPLICA_URLS)
+            except json.JSONDecodeError:
+                urls = self.DATABASE_REPLICA_URLS.split(",")
+        else:
+            urls = self.DATABASE_REPLICA_URLS
+
+        return [url.strip() for url in urls if url and url.strip()]
+
+    @property
+    def query_budgets(self) -> Dict[str, int]:
+        """Parse per-route query budgets from a JSON string or dict"""
+        if isinstance(self.QUERY_BUDGETS, str):
+            return json.loads(self.QUERY_BUDGETS) if self.QUERY_BUDGETS.strip() else {}
+        return self.QUERY_BUDGETS
+
     @property
     def cors_origins(self) -> List[str]:
         """Parse CORS origins from string or list and auto-include www/non-www variants"""
@@ -0,0 +1,177 @@
+"""
+Content-addressed blob storage for uploaded files (avatars, resumes)
+
+A blob is stored under the hex SHA-256 of its bytes, so identical uploads
+share one copy and a blob never changes once written - its digest doubles as
+a strong ETag. Uploads are copied from the source file object in
+UPLOAD_CHUNK_SIZE chunks and hashed as they stream, so memory stays at one
+chunk whatever the file size; the copy stops at the first chunk past the
+size limit. Request bodies over the limit are refused earlier, before the
+multipart parser spools them, by app.core.upload_limits.
+
+Backends (FILE_STORAGE_BACKEND):
+  local - files under FILE_STORAGE_DIR, fanned out as ab/cd/<digest> (default)
+  s3    - objects under `blobs/<digest>` in AWS_BUCKET_NAME; AWS_S3_ENDPOINT_URL
+          points it at any S3-compatible store (MinIO, R2, ...)
+
+Both backends stage the upload in a local temporary file while hashing -
+the key isn't known until the last byte - then publish it under its digest
+unless that blob already exists.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class UploadTooLarge(Exception):
+    """The upload exceeded its size limit"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class StoredBlob(NamedTuple):
+    digest: str
+    size: int
+    created: bool  # False when an identical blob was already stored
+
+
+def is_digest(value: str) -> bool:
+    return len(value) == 64 and all(c in "0123456789abcdef" for c in value)
+
+
+def _stage(source: BinaryIO, max_bytes: int, staging_dir: str, chunk_size: int):
+    """Copy `source` into a temporary file, hashing as it goes -> (path, digest, size)"""
+    sha256 = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(dir=staging_dir, prefix="upload-")
+    try:
+        with os.fdopen(fd, "wb") as staged:
+            while True:
+                chunk = source.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(max_bytes)
+                sha256.update(chunk)
+                staged.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path, sha256.hexdigest(), size
+
+
+class LocalFileStore:
+    """Blobs as files on local disk"""
+
+    def __init__(self, root: str, chunk_size: int):
+        self.root = os.path.abspath(root)
+        self.chunk_size = chunk_size
+        self._staging = os.path.join(self.root, "tmp")
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def save(self, source: BinaryIO, max_bytes: int) -> StoredBlob:
+        os.makedirs(self._staging, exist_ok=True)
+        staged, digest, size = _stage(source, max_bytes, self._staging, self.chunk_size)
+        path = self._path(digest)
+        if os.path.exists(path):
+            os.unlink(staged)
+            return StoredBlob(digest, size, False)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Atomic publish - concurrent uploads of the same bytes both land on identical content
+        os.replace(staged, path)
+        return StoredBlob(digest, size, True)
+
+    def size(self, digest: str) -> Optional[int]:
+        try:
+            return os.path.getsize(self._path(digest))
+        except FileNotFoundError:
+            return None
+
+    def iter_range(self, digest: str, start: int, end: int) -> Iterator[bytes]:
+        """Bytes start..end (inclusive) in chunks"""
+        with open(self._path(digest), "rb") as blob:
+            blob.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = blob.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+class S3FileStore:
+    """Blobs as objects in an S3-compatible bucket"""
+
+    KEY_PREFIX = "blobs/"
+
+    def __init__(self, bucket: str, chunk_size: int, endpoint_url: Optional[str] = None, region: Optional[str] = None):
+        import boto3
+
+        self.bucket = bucket
+        self.chunk_size = chunk_size
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url or None,
+            region_name=region or None,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+        )
+
+    def _key(self, digest: str) -> str:
+        return f"{self.KEY_PREFIX}{digest}"
+
+    def save(self, source: BinaryIO, max_bytes: int) -> StoredBlob:
+        staged, digest, size = _stage(source, max_bytes, tempfile.gettempdir(), self.chunk_size)
+        try:
+            if self.size(digest) is not None:
+                return StoredBlob(digest, size, False)
+            # Managed transfer - multipart from the staged file for large bodies
+            self.client.upload_file(staged, self.bucket, self._key(digest))
+            return StoredBlob(digest, size, True)
+        finally:
+            os.unlink(staged)
+
+    def size(self, digest: str) -> Optional[int]:
+        from botocore.exceptions import ClientError
+
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=self._key(digest))["ContentLength"]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def iter_range(self, digest: str, start: int, end: int) -> Iterator[bytes]:
+        """Bytes start..end (inclusive) in chunks"""
+        body = self.client.get_object(
+            Bucket=self.bucket, Key=self._key(digest), Range=f"bytes={start}-{end}"
+        )["Body"]
+        try:
+            yield from body.iter_chunks(self.chunk_size)
+        finally:
+            body.close()
+
+
+def _create_file_store():
+    backend_name = settings.FILE_STORAGE_BACKEND.lower()
+    if backend_name == "s3":
+        return S3FileStore(
+            settings.AWS_BUCKET_NAME, settings.UPLOAD_CHUNK_SIZE,
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL, region=settings.AWS_REGION
+        )
+    return LocalFileStore(settings.FILE_STORAGE_DIR, settings.UPLOAD_CHUNK_SIZE)
+
+
+file_store = _create_file_store()
@@ -0,0 +1,55 @@
+"""
+Bounded in-process LRU with per-entry expiry
+
+The storage behind the memory user cache (app.core.user_cache), the response
+cache (app.core.response_cache) and the proof-metrics cache
+(app.services.proof_stats). Thread-safe; entries are private to the process.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional
+
+
+class MemoryBackend:
+    """Per-process LRU with per-entry expiry"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: int):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> Optional[int]:
+        return len(self._entries)
+
+    def values(self) -> List:
+        """Snapshot of the stored values (expired ones included until they're evicted)"""
+        with self._lock:
+            return [value for _, value in self._entries.values()]
@@ -0,0 +1,183 @@
+"""
+Prometheus request metrics
+
+PrometheusMiddleware records, per route template (e.g. /projects/{project_id}):
+  - request latency, count (by status) and response size
+  - requests in flight
+  - DB statements and DB time per request, from SQLAlchemy cursor events
+
+Connection pool stats from app.db.pool_metrics are exported alongside.
+Scraped from GET /metrics.
+"""
+import contextvars
+import time
+from typing import Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, HistogramMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+
+from app.db.pool_metrics import get_pool_metrics
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Request latency", ["method", "route"], buckets=LATENCY_BUCKETS
+)
+REQUEST_COUNT = Counter("http_requests_total", "Requests served", ["method", "route", "status"])
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "Requests currently being served")
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "Response body size", ["method", "route"], buckets=SIZE_BUCKETS
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "DB statements executed per request", ["method", "route"],
+    buckets=QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_duration_seconds", "Time spent in DB statements per request", ["method", "route"],
+    buckets=LATENCY_BUCKETS
+)
+
+
+class RequestDBStats:
+    """Mutable per-request accumulator - shared with threadpool/greenlet copies of the context"""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+_request_db_stats: contextvars.ContextVar[Optional[RequestDBStats]] = contextvars.ContextVar(
+    "request_db_stats", default=None
+)
+
+
+def current_request_db_stats() -> Optional[RequestDBStats]:
+    return _request_db_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += time.perf_counter() - started
+
+
+@event.listens_for(Engine, "handle_error")
+def _on_cursor_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def route_template(scope) -> str:
+    """The matched route's path template, so /projects/1 and /projects/2 share a series"""
+    route = scope.get("route")
+    if route is None:
+        app = scope.get("app")
+        for candidate in getattr(getattr(app, "router", None), "routes", []):
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    if route is None:
+        return "unmatched"
+    return getattr(route, "path_format", None) or getattr(route, "path", "unmatched")
+
+
+class PrometheusMiddleware:
+    """Pure ASGI middleware (keeps contextvars and streaming responses intact)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        db_stats = RequestDBStats()
+        token = _request_db_stats.set(db_stats)
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+            _request_db_stats.reset(token)
+
+            method = scope["method"]
+            route = route_template(scope)
+            REQUEST_LATENCY.labels(method, route).observe(elapsed)
+            REQUEST_COUNT.labels(method, route, str(status_code)).inc()
+            RESPONSE_SIZE.labels(method, route).observe(response_size)
+            REQUEST_DB_QUERIES.labels(method, route).observe(db_stats.queries)
+            REQUEST_DB_TIME.labels(method, route).observe(db_stats.seconds)
+
+
+class PoolMetricsCollector:
+    """Exports app.db.pool_metrics snapshots at scrape time"""
+
+    def collect(self):
+        pools = get_pool_metrics()
+
+        gauges = {
+            "checked_out": GaugeMetricFamily("db_pool_checked_out", "Connections in use", labels=["pool"]),
+            "overflow": GaugeMetricFamily("db_pool_overflow", "Overflow connections open", labels=["pool"]),
+            "size": GaugeMetricFamily("db_pool_size", "Configured pool size", labels=["pool"]),
+            "max_overflow": GaugeMetricFamily("db_pool_max_overflow", "Current overflow limit", labels=["pool"]),
+        }
+        counters = {
+            "timeouts": CounterMetricFamily("db_pool_checkout_timeouts", "Checkout timeouts", labels=["pool"]),
+            "recycles": CounterMetricFamily("db_pool_recycles", "Connections recycled", labels=["pool"]),
+            "invalidations": CounterMetricFamily("db_pool_invalidations", "Connections invalidated", labels=["pool"]),
+        }
+        waits = HistogramMetricFamily("db_pool_checkout_wait_seconds", "Time waiting for a connection", labels=["pool"])
+
+        for name, snapshot in pools.items():
+            for key, family in list(gauges.items()) + list(counters.items()):
+                if key in snapshot:
+                    family.add_metric([name], snapshot[key])
+            if "checkout_wait_ms_histogram" in snapshot:
+                buckets = [
+                    ("+Inf" if le == "+Inf" else str(float(le) / 1000), count)
+                    for le, count in snapshot["checkout_wait_ms_histogram"].items()
+                ]
+                waits.add_metric([name], buckets, snapshot["checkout_wait_ms_sum"] / 1000)
+
+        yield from gauges.values()
+        yield from counters.values()
+        yield waits
+
+
+REGISTRY.register(PoolMetricsCollector())
+
+
+def metrics_payload():
+    """(body, content type) for the /metrics endpoint"""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
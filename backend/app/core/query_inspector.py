@@ -0,0 +1,129 @@
+"""
+N+1 query detector for development and test runs (opt-in)
+
+With QUERY_INSPECTOR_ENABLED, every request's SQL statements are counted and
+grouped by shape (literals and IN-lists normalised away). A shape executed
+QUERY_INSPECTOR_REPEAT_THRESHOLD times or more in one request is logged as a
+suspected N+1, with the endpoint and the application call site(s).
+
+With QUERY_BUDGET_STRICT, a request that executes more statements than its
+route's budget raises QueryBudgetExceeded. Starlette's TestClient re-raises
+app exceptions, so any pytest test that hits the route fails:
+
+    QUERY_INSPECTOR_ENABLED=true QUERY_BUDGET_STRICT=true pytest
+
+Budgets come from QUERY_BUDGETS ({"GET /api/v1/freelancers/search": 5, ...}) with
+QUERY_BUDGET_DEFAULT for routes not listed.
+"""
+import contextvars
+import logging
+import re
+import traceback
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+APP_DIR = str(Path(__file__).resolve().parent.parent)
+_SKIP_DIRS = (str(Path(APP_DIR) / "db"), __file__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request runs more statements than its budget"""
+
+
+class RequestQueries:
+    """Statements seen during one request"""
+
+    def __init__(self):
+        self.total = 0
+        self.shapes: Counter = Counter()
+        self.call_sites: Dict[str, Counter] = defaultdict(Counter)
+
+
+_request_queries: contextvars.ContextVar[Optional[RequestQueries]] = contextvars.ContextVar(
+    "request_queries", default=None
+)
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a SQL statement so repeated executions with different values compare equal"""
+    shape = _IN_LIST.sub("IN (...)", statement)
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _call_site() -> str:
+    """Innermost application frame that isn't DB plumbing"""
+    for frame in reversed(traceback.extract_stack()):
+        if frame.filename.startswith(APP_DIR) and not frame.filename.startswith(_SKIP_DIRS):
+            return f"{Path(frame.filename).relative_to(Path(APP_DIR).parent)}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    queries = _request_queries.get()
+    if queries is None:
+        return
+    shape = statement_shape(statement)
+    queries.total += 1
+    queries.shapes[shape] += 1
+    queries.call_sites[shape][_call_site()] += 1
+
+
+def route_budget(route_key: str) -> int:
+    return settings.query_budgets.get(route_key, settings.QUERY_BUDGET_DEFAULT)
+
+
+class QueryInspectorMiddleware:
+    """Pure ASGI middleware that reports repeated statements and enforces query budgets"""
+
+    def __init__(self, app):
+        self.app = app
+        if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries()
+        token = _request_queries.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_queries.reset(token)
+
+        route_key = f"{scope['method']} {route_template(scope)}"
+        self._report(route_key, queries)
+
+        budget = route_budget(route_key)
+        if settings.QUERY_BUDGET_STRICT and queries.total > budget:
+            raise QueryBudgetExceeded(
+                f"{route_key} executed {queries.total} statements (budget {budget})"
+            )
+
+    def _report(self, route_key: str, queries: RequestQueries):
+        threshold = settings.QUERY_INSPECTOR_REPEAT_THRESHOLD
+        for shape, count in queries.shapes.most_common():
+            if count < threshold:
+                break
+            sites = ", ".join(f"{site} (x{n})" for site, n in queries.call_sites[shape].most_common(3))
+            logger.warning(
+                f"Possible N+1 in {route_key}: statement repeated {count}x "
+                f"({queries.total} total) at {sites}: {shape[:200]}"
+            )
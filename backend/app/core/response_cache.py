@@ -0,0 +1,146 @@
+"""
+Serialized-response cache for public GET endpoints
+
+Stores the JSON body (plus any response headers) of an endpoint under a key
+built from its normalized inputs, so a hit skips both the query and the
+pydantic serialization. Every entry carries a strong ETag - a hash of the
+body - and `cached_json_response` answers a matching If-None-Match with 304.
+
+Invalidation is by tag: each entry records the version of its tags when its
+computation started, and bumping a tag (`invalidate_tags`) makes every entry
+recorded under an older version a miss. A computation that races with an
+invalidation is served to its callers but never stored. Versions of tags no
+cached entry or running computation refers to are pruned, so per-object tags
+(project:<id>) don't accumulate.
+
+Concurrent misses for one key share a single computation (SingleFlight).
+The cache is per process; the TTL bounds how long another worker's writes
+can go unseen.
+"""
+import hashlib
+import threading
+from collections import Counter
+from typing import Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+from app.core.memory_cache import MemoryBackend
+from app.core.singleflight import SingleFlight
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    headers: Dict[str, str]
+    tag_versions: Tuple[Tuple[str, int], ...]
+
+
+def strong_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 specifies for it)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+# Tag versions kept before the first prune
+PRUNE_MIN_TAGS = 1024
+
+
+class ResponseCache:
+    """Tagged TTL cache of serialized responses with request coalescing"""
+
+    def __init__(self, max_size: int, ttl: int):
+        self.ttl = ttl
+        self._entries = MemoryBackend(max_size)
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._tag_versions: Dict[str, int] = {}
+        self._in_flight_tags: Counter = Counter()  # Tags of running computations - never pruned
+        self._prune_at = PRUNE_MIN_TAGS
+        self.hits = 0
+        self.misses = 0
+
+    def _current_versions(self, tags: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        # Caller holds _lock
+        return tuple((tag, self._tag_versions.get(tag, 0)) for tag in tags)
+
+    def _versions(self, tags: Iterable[str]) -> Tuple[Tuple[str, int], ...]:
+        with self._lock:
+            return self._current_versions(tags)
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        tags: Tuple[str, ...],
+        compute: Callable[[], Tuple[bytes, Dict[str, str]]]
+    ) -> CachedResponse:
+        """Cached response for `key`, or compute() -> (body, headers) once for all concurrent callers"""
+        if self.ttl <= 0:
+            body, headers = compute()
+            return CachedResponse(body, strong_etag(body), headers, ())
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.tag_versions == self._versions(tags):
+            with self._lock:
+                self.hits += 1
+            return entry
+
+        def load() -> CachedResponse:
+            with self._lock:
+                self._in_flight_tags.update(tags)
+                versions = self._current_versions(tags)
+            try:
+                body, headers = compute()
+                fresh = CachedResponse(body, strong_etag(body), headers, versions)
+                with self._lock:
+                    if versions == self._current_versions(tags):
+                        self._entries.set(key, fresh, self.ttl)
+                return fresh
+            finally:
+                with self._lock:
+                    for tag in tags:
+                        self._in_flight_tags[tag] -= 1
+                        if not self._in_flight_tags[tag]:
+                            del self._in_flight_tags[tag]
+
+        with self._lock:
+            self.misses += 1
+        return self._flight.do(key, load)
+
+    def invalidate_tags(self, *tags: str):
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            if len(self._tag_versions) > self._prune_at:
+                self._prune_tag_versions()
+
+    def _prune_tag_versions(self):
+        # Caller holds _lock. A tag nothing refers to can restart at version 0:
+        # no stored entry carries an older version of it to wrongly match
+        referenced = {tag for entry in self._entries.values() for tag, _ in entry.tag_versions}
+        referenced.update(self._in_flight_tags)
+        self._tag_versions = {tag: version for tag, version in self._tag_versions.items() if tag in referenced}
+        self._prune_at = max(PRUNE_MIN_TAGS, 2 * len(self._tag_versions))
+
+    def clear(self):
+        self._entries.clear()
+
+
+def cached_json_response(request: Request, cached: CachedResponse) -> Response:
+    """200 with the cached body, or 304 when the client already has this ETag"""
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": "no-cache",  # Clients may store it but must revalidate
+        "Vary": "Authorization",
+        **cached.headers,
+    }
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
@@ -1,10 +1,32 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
+import asyncio
+import hashlib
+import threading
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min/max pinned to the policy so needs_update() flags hashes made with any other cost
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt releases the GIL, so a small thread pool gives real parallelism while
+# keeping hashing off the event loop and off the request threadpool
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE)
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password hashing queue is full"""
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -17,6 +39,35 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True if the hash was made with a different cost than the current policy"""
+    return pwd_context.needs_update(hashed_password)
+
+
+async def _run_hashing(fn, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        future = _hash_executor.submit(fn, *args)
+    except BaseException:
+        _hash_slots.release()
+        raise
+    # Free the slot when the hash finishes, not when the caller stops waiting - a
+    # cancelled request (client gone, timeout) leaves its hash running in the pool
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the bounded hashing pool - raises PasswordHashingBusy when saturated"""
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the bounded hashing pool - raises PasswordHashingBusy when saturated"""
+    return await _run_hashing(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
@@ -39,10 +90,46 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+# Verified claims by token digest, each kept only until the token's exp
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> Optional[dict]:
-    """Decode and verify a JWT token"""
+    """Decode and verify a JWT token
+
+    Verified payloads are cached (LRU, keyed by SHA-256 of the token) until the
+    token expires, so repeated requests with the same token skip the signature
+    check and JSON parsing. Invalid tokens are never cached.
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    with _token_cache_lock:
+        entry = _token_cache.get(digest)
+        if entry:
+            expires_at, payload = entry
+            if expires_at > now:
+                _token_cache.move_to_end(digest)
+                return dict(payload)
+            del _token_cache[digest]
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+
+    exp = payload.get("exp")
+    if settings.TOKEN_CACHE_MAX_SIZE > 0 and isinstance(exp, (int, float)):
+        with _token_cache_lock:
+            _token_cache[digest] = (exp, dict(payload))
+            while len(_token_cache) > settings.TOKEN_CACHE_MAX_SIZE:
+                _token_cache.popitem(last=False)
+
+    return payload
+
+
+def clear_token_cache():
+    """Drop all cached token payloads (e.g. after rotating SECRET_KEY)"""
+    with _token_cache_lock:
+        _token_cache.clear()
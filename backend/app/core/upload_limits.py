@@ -0,0 +1,86 @@
+"""
+Request body limits for upload routes, enforced before the body is parsed
+
+FastAPI reads a multipart body in full - spooling file parts to disk - before
+the endpoint (or any dependency) runs, so a size check in the endpoint comes
+too late to stop a multi-GB upload. This middleware answers 413 from the
+Content-Length header alone, and counts the bytes of bodies sent without one
+(chunked), aborting as soon as they pass the limit.
+
+Limits are keyed by path suffix, so a route matches under every prefix it is
+mounted at (/users/... and /api/v1/users/...).
+"""
+from typing import Dict, Optional
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+# Room for the multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class BodyTooLarge(Exception):
+    pass
+
+
+class UploadLimitMiddleware:
+    """Pure ASGI middleware that caps POST body sizes on the configured paths"""
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    def _limit_for(self, path: str) -> Optional[int]:
+        for suffix, limit in self.limits.items():
+            if path.rstrip("/").endswith(suffix):
+                return limit
+        return None
+
+    async def __call__(self, scope, receive, send):
+        limit = self._limit_for(scope["path"]) if scope["type"] == "http" and scope["method"] == "POST" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        try:
+            declared = int(content_length) if content_length is not None else None
+        except ValueError:
+            declared = None
+        if declared is not None and declared > limit:
+            await self._reject(scope, receive, send, limit)
+            return
+
+        received = 0
+        exceeded = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise BodyTooLarge()
+            return message
+
+        async def guarded_send(message):
+            # Once over the limit, drop whatever the app answers (FastAPI turns the abort into a 400)
+            if not exceeded:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except BodyTooLarge:
+            pass
+        if exceeded:
+            await self._reject(scope, receive, send, limit)
+
+    @staticmethod
+    async def _reject(scope, receive, send, limit: int):
+        response = JSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={"detail": f"File too large (max {limit - MULTIPART_OVERHEAD} bytes)"},
+            headers={"Connection": "close"},
+        )
+        await response(scope, receive, send)
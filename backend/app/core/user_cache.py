@@ -0,0 +1,252 @@
+"""
+Authenticated-user cache for get_current_user / get_current_user_optional
+
+Caches the column values of a User row by user id for USER_CACHE_TTL_SECONDS,
+so an authenticated request no longer needs a SELECT on users. A cache hit is
+attached to the request's session with `merge(load=False)`, which issues no
+SQL - relationships (profile, ...) still lazy-load as before, and endpoints
+that modify `current_user` and commit keep working.
+
+Backends:
+  memory - bounded per-process LRU (default); single worker only - another
+           worker would never see this one's evictions
+  redis  - shared across workers via REDIS_URL
+  none   - disabled
+
+Secrets (password hash, OAuth access tokens) are never cached; they load on
+first access like any unloaded column. Any flushed change to a User row -
+including is_active and role - evicts that user, and bulk UPDATE/DELETE on
+users clears the cache.
+"""
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import DateTime, Enum, event
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.core.memory_cache import MemoryBackend
+from app.models.models import User
+
+logger = logging.getLogger(__name__)
+
+# Columns that must never leave the database
+UNCACHED_COLUMNS = {"hashed_password", "github_access_token", "huggingface_access_token"}
+
+CACHED_COLUMNS = [c for c in User.__table__.columns if c.key not in UNCACHED_COLUMNS]
+
+
+class RedisBackend:
+    """Shared cache - JSON values under `user-cache:<id>` with a Redis TTL"""
+
+    KEY_PREFIX = "user-cache:"
+
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25)
+
+    def get(self, user_id: int) -> Optional[Dict]:
+        raw = self.client.get(f"{self.KEY_PREFIX}{user_id}")
+        return _decode(json.loads(raw)) if raw else None
+
+    def set(self, user_id: int, values: Dict, ttl: int):
+        self.client.setex(f"{self.KEY_PREFIX}{user_id}", ttl, json.dumps(_encode(values)))
+
+    def delete(self, user_id: int):
+        self.client.delete(f"{self.KEY_PREFIX}{user_id}")
+
+    def clear(self):
+        for key in self.client.scan_iter(f"{self.KEY_PREFIX}*"):
+            self.client.delete(key)
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+def _encode(values: Dict) -> Dict:
+    encoded = {}
+    for key, value in values.items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif hasattr(value, "value"):  # Enum member
+            value = value.value
+        encoded[key] = value
+    return encoded
+
+
+def _decode(values: Dict) -> Dict:
+    decoded = dict(values)
+    for column in CACHED_COLUMNS:
+        value = decoded.get(column.key)
+        if value is None:
+            continue
+        if isinstance(column.type, Enum) and column.type.enum_class:
+            decoded[column.key] = column.type.enum_class(value)
+        elif isinstance(column.type, DateTime):
+            decoded[column.key] = datetime.fromisoformat(value)
+    return decoded
+
+
+class UserCache:
+    """TTL cache of User rows with hit-rate and time-saved accounting"""
+
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.hit_time_ms = 0.0
+        self.miss_time_ms = 0.0
+
+    def get_user(self, db: Session, user_id: int) -> Optional[User]:
+        """Return the user attached to `db`, from the cache when possible"""
+        start = time.perf_counter()
+        values = None
+        try:
+            values = self.backend.get(user_id)
+        except Exception as e:
+            self._record_error(e)
+
+        if values is not None:
+            user = db.merge(_detached_user(values), load=False)
+            db.expire(user, list(UNCACHED_COLUMNS))  # load secrets on access, not from cache
+            self._record("hit", start)
+            return user
+
+        user = db.query(User).filter(User.id == user_id).first()
+        if user:
+            try:
+                self.backend.set(user_id, _snapshot(user), self.ttl)
+            except Exception as e:
+                self._record_error(e)
+        self._record("miss", start)
+        return user
+
+    def invalidate(self, user_id: int):
+        try:
+            self.backend.delete(user_id)
+        except Exception as e:
+            self._record_error(e)
+
+    def clear(self):
+        try:
+            self.backend.clear()
+        except Exception as e:
+            self._record_error(e)
+
+    def _record(self, outcome: str, start: float):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+                self.hit_time_ms += elapsed_ms
+            else:
+                self.misses += 1
+                self.miss_time_ms += elapsed_ms
+
+    def _record_error(self, error: Exception):
+        with self._lock:
+            self.errors += 1
+        logger.warning(f"User cache backend error: {error}")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            avg_hit_ms = self.hit_time_ms / self.hits if self.hits else 0.0
+            avg_miss_ms = self.miss_time_ms / self.misses if self.misses else 0.0
+            saved_ms = self.hits * (avg_miss_ms - avg_hit_ms) if self.misses else None
+            return {
+                "backend": type(self.backend).__name__,
+                "ttl_seconds": self.ttl,
+                "entries": self.backend.size(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "avg_hit_ms": round(avg_hit_ms, 3),
+                "avg_miss_ms": round(avg_miss_ms, 3),
+                # Estimated from the average miss (DB lookup) cost
+                "time_saved_ms": round(saved_ms, 1) if saved_ms is not None else None,
+            }
+
+
+def _snapshot(user: User) -> Dict:
+    return {column.key: getattr(user, column.key) for column in CACHED_COLUMNS}
+
+
+def _detached_user(values: Dict) -> User:
+    """Build a detached User from cached values without running validators"""
+    user = User.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        set_committed_value(user, key, value)
+    make_transient_to_detached(user)
+    return user
+
+
+def _create_user_cache() -> Optional[UserCache]:
+    backend_name = settings.USER_CACHE_BACKEND.lower()
+    if backend_name == "none" or settings.USER_CACHE_TTL_SECONDS <= 0:
+        return None
+    if backend_name == "redis":
+        backend = RedisBackend(settings.REDIS_URL)
+    elif settings.WEB_CONCURRENCY > 1:
+        logger.error(
+            f"USER_CACHE_BACKEND=memory can't be shared by {settings.WEB_CONCURRENCY} workers - "
+            "they would serve users changed elsewhere until the TTL runs out. "
+            "User cache disabled; set USER_CACHE_BACKEND=redis"
+        )
+        return None
+    else:
+        backend = MemoryBackend(settings.USER_CACHE_MAX_SIZE)
+    return UserCache(backend, settings.USER_CACHE_TTL_SECONDS)
+
+
+user_cache = _create_user_cache()
+
+
+def load_user(db: Session, user_id: int) -> Optional[User]:
+    """Load a user by id through the cache (or straight from the DB when disabled)"""
+    if user_cache is None:
+        return db.query(User).filter(User.id == user_id).first()
+    return user_cache.get_user(db, user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_users(session, flush_context):
+    if user_cache is None:
+        return
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            user_cache.invalidate(obj.id)
+            session.info.setdefault("user_cache_evict", set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    # Evict again once committed, in case another request re-cached the
+    # pre-commit row between our flush and commit
+    for user_id in session.info.pop("user_cache_evict", ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session):
+    session.info.pop("user_cache_evict", None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_bulk_user_writes(orm_execute_state):
+    if user_cache is None:
+        return
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and any(
+        mapper.class_ is User for mapper in orm_execute_state.all_mappers
+    ):
+        user_cache.clear()
@@ -1,46 +1,226 @@
-from sqlalchemy import create_engine, event, text
+from sqlalchemy import create_engine, event, text, Select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine, pool_limits
+import itertools
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
-# Configure engine with appropriate settings for SQLite or PostgreSQL
-connect_args = {}
-pool_size = 5
-max_overflow = 10
-
-if settings.DATABASE_URL.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
-    pool_size = 1  # SQLite doesn't support connection pooling
-    max_overflow = 0
-elif "supabase" in settings.DATABASE_URL or "pooler" in settings.DATABASE_URL:
-    # Special configuration for Supabase pooler with extended timeouts for cloud environments
-    connect_args = {
-        "connect_timeout": 30,  # Increased from 10 to handle cloud environment latency
-        "options": "-c statement_timeout=30000",  # 30 second statement timeout
-        "client_encoding": "utf8",  # Set encoding directly as parameter
-    }
+
+def _connect_options(database_url: str):
+    """Driver connect args and pool limits for SQLite, the Supabase pooler or plain PostgreSQL"""
+    connect_args = {}
     pool_size = 5
-    max_overflow = 10  # Allow some overflow for burst traffic
+    max_overflow = 10
+
+    if database_url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+        pool_size = 1  # SQLite doesn't support connection pooling
+        max_overflow = 0
+    elif "supabase" in database_url or "pooler" in database_url:
+        # Special configuration for Supabase pooler with extended timeouts for cloud environments
+        connect_args = {
+            "connect_timeout": 30,  # Increased from 10 to handle cloud environment latency
+            "options": "-c statement_timeout=30000",  # 30 second statement timeout
+            "client_encoding": "utf8",  # Set encoding directly as parameter
+        }
+        pool_size = 5
+        max_overflow = 10  # Allow some overflow for burst traffic
+
+    return connect_args, pool_size, max_overflow
+
+
+def _pool_options(database_url: str):
+    """
+    Pool limits for one engine.
+
+    Per-backend defaults from `_connect_options`, overridden by DB_POOL_SIZE /
+    DB_MAX_OVERFLOW, or - with DB_POOL_ADAPTIVE - sized from the connection
+    budget per worker. Returns (pool_size, max_overflow, adaptive, overflow_ceiling).
+    """
+    _, pool_size, max_overflow = _connect_options(database_url)
+
+    if database_url.startswith("sqlite"):
+        return pool_size, max_overflow, False, max_overflow
+
+    if settings.DB_POOL_ADAPTIVE:
+        pool_size, ceiling = pool_limits(
+            settings.WEB_CONCURRENCY, settings.DB_MAX_CONNECTIONS, settings.DB_POOL_MIN_SIZE
+        )
+        # Start half-way and let the tuner move overflow between 0 and the ceiling
+        return pool_size, ceiling // 2, True, ceiling
+
+    if settings.DB_POOL_SIZE is not None:
+        pool_size = settings.DB_POOL_SIZE
+    if settings.DB_MAX_OVERFLOW is not None:
+        max_overflow = settings.DB_MAX_OVERFLOW
+    return pool_size, max_overflow, False, max_overflow
+
+
+def _create_engine(database_url: str, name: str = "primary"):
+    connect_args, _, _ = _connect_options(database_url)
+    pool_size, max_overflow, adaptive, ceiling = _pool_options(database_url)
+
+    # Add pool_recycle to prevent stale connections
+    db_engine = create_engine(
+        database_url,
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,  # Test connections before using them
+        connect_args=connect_args,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=300,  # Recycle connections after 5 minutes
+        pool_timeout=settings.DB_POOL_TIMEOUT,  # Wait for a connection from the pool
+        echo=settings.ENVIRONMENT == "development"  # Log SQL queries in development
+    )
+    instrument_engine(db_engine, name, adaptive, ceiling, settings.DB_POOL_TARGET_WAIT_MS)
+    return db_engine
+
+
+def _async_database_url(database_url: str):
+    """Translate the sync DATABASE_URL into its async driver equivalent
+
+    psycopg2 -> asyncpg for PostgreSQL, pysqlite -> aiosqlite for SQLite.
+    asyncpg does not understand libpq's ``sslmode`` query parameter, so it is
+    stripped from the URL and returned separately as the ``ssl`` connect arg.
+    """
+    url = make_url(database_url)
+    ssl = None
+
+    if url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    elif url.get_backend_name() == "postgresql":
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        if sslmode and sslmode not in ("disable", "allow"):
+            ssl = "require"
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+
+    return url, ssl
+
+
+def _create_async_engine(database_url: str, name: str = "primary_async"):
+    """Async engine for `async def` endpoints - same pool limits as the sync engine"""
+    pool_size, max_overflow, adaptive, ceiling = _pool_options(database_url)
+    async_url, ssl = _async_database_url(database_url)
+    connect_args = {}
+
+    if database_url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+    elif "supabase" in database_url or "pooler" in database_url:
+        connect_args = {
+            "timeout": 30,
+            "server_settings": {"statement_timeout": "30000"},
+            # The Supabase pooler runs PgBouncer in transaction mode, which
+            # breaks asyncpg's named prepared statements
+            "statement_cache_size": 0,
+        }
+        async_url = async_url.update_query_dict({"prepared_statement_cache_size": "0"})
+
+    if ssl:
+        connect_args["ssl"] = ssl
+
+    db_engine = create_async_engine(
+        async_url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=300,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        echo=settings.ENVIRONMENT == "development"
+    )
+    instrument_engine(db_engine.sync_engine, name, adaptive, ceiling, settings.DB_POOL_TARGET_WAIT_MS)
+    return db_engine
+
+
+if "supabase" in settings.DATABASE_URL or "pooler" in settings.DATABASE_URL:
     logger.info("Using Supabase pooler configuration with extended timeouts")
 
-# Add pool_recycle to prevent stale connections
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # Test connections before using them
-    connect_args=connect_args,
-    pool_size=pool_size,
-    max_overflow=max_overflow,
-    pool_recycle=300,  # Recycle connections after 5 minutes
-    pool_timeout=30,  # Wait up to 30 seconds for a connection from the pool
-    echo=settings.ENVIRONMENT == "development"  # Log SQL queries in development
-)
+engine = _create_engine(settings.DATABASE_URL)
+async_engine = _create_async_engine(settings.DATABASE_URL)
+
+# Read replicas (optional) - only used by the read-routed sessions below
+replica_engines = [
+    _create_engine(url, f"replica_{i}") for i, url in enumerate(settings.replica_urls)
+]
+async_replica_engines = [
+    _create_async_engine(url, f"replica_{i}_async") for i, url in enumerate(settings.replica_urls)
+]
+if replica_engines:
+    logger.info(f"Routing read-only queries across {len(replica_engines)} replica(s)")
+
+_replica_counter = itertools.count()
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to a read replica and everything else to the primary.
+
+    - One replica is picked (round-robin) per session, so all reads in a request
+      see the same snapshot.
+    - INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, raw text() statements and
+      flushes always go to the primary.
+    - Once the session has flushed a write, every later statement in it goes
+      to the primary as well (read-your-writes).
+    - With no replicas configured it behaves exactly like a normal Session.
+    """
+
+    def __init__(self, primary=None, replicas=(), **kwargs):
+        kwargs["bind"] = kwargs.get("bind") or primary
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replicas[next(_replica_counter) % len(replicas)] if replicas else None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is None or self._flushing or self.info.get("use_primary"):
+            return self.primary
+        if isinstance(clause, Select) and clause._for_update_arg is None:
+            return self.replica
+        return self.primary
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_to_primary(session, flush_context):
+    """Keep read-your-writes: after the first write, stop reading from the replica"""
+    session.info["use_primary"] = True
+
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-routed sessions for read-heavy GET endpoints that tolerate replica lag
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    primary=engine,
+    replicas=replica_engines,
+    autocommit=False,
+    autoflush=False
+)
+
+# expire_on_commit=False: attributes of committed objects stay loaded, since a
+# lazy refresh would need to await and cannot happen during response serialization
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    primary=async_engine.sync_engine,
+    replicas=[e.sync_engine for e in async_replica_engines],
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
@@ -53,6 +233,27 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for getting an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db():
+    """Dependency for a session that reads from a replica when one is configured"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db():
+    """Async variant of get_read_db"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
 def init_db(max_retries=3, retry_delay=2):
     """Initialize database tables and types with retry logic for cloud environments
 
@@ -104,6 +305,13 @@ def init_db(max_retries=3, retry_delay=2):
             Base.metadata.create_all(bind=engine)
             logger.info("Database tables created successfully")
 
+            # Full-text index for freelancer search (expression index / FTS5 table)
+            from app.db.profile_search import ensure_profile_search_index
+            try:
+                ensure_profile_search_index(engine)
+            except Exception as e:
+                logger.warning(f"Could not create profile search index: {e}")
+
             return True
 
         except Exception as e:
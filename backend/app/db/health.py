@@ -0,0 +1,138 @@
+"""
+Cheap health and diagnostics helpers
+
+- DatabaseHealth: a background task pings the primary every
+  HEALTH_CHECK_INTERVAL_SECONDS; readiness probes read the cached result, so
+  probes never take a pool connection themselves.
+- table_row_counts: per-table row counts from catalog statistics
+  (pg_class.reltuples, sqlite_stat1) instead of COUNT(*) scans, with an
+  opt-in exact mode.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseHealth:
+    """Last result of the background `SELECT 1` ping"""
+
+    def __init__(self, async_engine, interval: float):
+        self.async_engine = async_engine
+        self.interval = interval
+        self.connected: Optional[bool] = None
+        self.latency_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self):
+        start = time.perf_counter()
+        try:
+            async with self.async_engine.connect() as conn:
+                await asyncio.wait_for(conn.execute(text("SELECT 1")), timeout=self.interval)
+            self.connected = True
+            self.error = None
+        except Exception as e:
+            if self.connected is not False:
+                logger.error(f"Health check failed: {str(e)}")
+            self.connected = False
+            self.error = str(e)
+        self.latency_ms = (time.perf_counter() - start) * 1000
+        self.checked_at = time.time()
+
+    async def _run(self):
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def ready(self) -> bool:
+        # A ping older than three intervals means the checker itself is stuck
+        fresh = self.checked_at is not None and time.time() - self.checked_at < self.interval * 3
+        return bool(self.connected) and fresh
+
+    def status(self) -> Dict:
+        return {
+            "status": "healthy" if self.ready else "unhealthy",
+            "database": "connected" if self.ready else ("unknown" if self.connected is None else "disconnected"),
+            "db_latency_ms": round(self.latency_ms, 2) if self.latency_ms is not None else None,
+            "checked_seconds_ago": round(time.time() - self.checked_at, 1) if self.checked_at else None,
+            "error": self.error,
+        }
+
+
+def _postgres_estimates(db: Session) -> Dict[str, int]:
+    rows = db.execute(text(
+        "SELECT c.relname, c.reltuples::bigint FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE c.relkind IN ('r', 'p') AND n.nspname = current_schema()"
+    ))
+    # reltuples is -1 for tables that have never been vacuumed/analyzed
+    return {name: count for name, count in rows if count >= 0}
+
+
+def _sqlite_estimates(db: Session, tables: List[str]) -> Dict[str, int]:
+    estimates = {}
+    has_stat1 = db.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    )).first()
+    if has_stat1:
+        # The first number in each stat row is the row count of the table/index
+        for table, stat in db.execute(text("SELECT tbl, stat FROM sqlite_stat1")):
+            count = int(stat.split()[0])
+            estimates[table] = max(estimates.get(table, 0), count)
+
+    # Not analyzed: MAX(rowid) is an index lookup and an upper bound on the count
+    for table in tables:
+        if table not in estimates:
+            try:
+                estimates[table] = db.execute(text(f'SELECT MAX(rowid) FROM "{table}"')).scalar() or 0
+            except Exception:
+                pass  # WITHOUT ROWID tables
+    return estimates
+
+
+def table_row_counts(db: Session, tables: List[str], exact: bool = False) -> Dict[str, Dict]:
+    """Row count per table - catalog estimates by default, COUNT(*) when exact"""
+    estimates = {}
+    if not exact:
+        if settings.DATABASE_URL.startswith("sqlite"):
+            estimates = _sqlite_estimates(db, tables)
+        elif "postgresql" in settings.DATABASE_URL:
+            estimates = _postgres_estimates(db)
+
+    counts = {}
+    for table in tables:
+        if table in estimates:
+            counts[table] = {"rows": estimates[table], "estimate": True}
+            continue
+        if not exact:
+            counts[table] = {"rows": None, "estimate": True}
+            continue
+        try:
+            rows = db.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar()
+            counts[table] = {"rows": rows, "estimate": False}
+        except Exception as e:
+            counts[table] = {"rows": None, "error": str(e)[:30]}
+    return counts
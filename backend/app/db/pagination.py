@@ -0,0 +1,146 @@
+"""
+Keyset (cursor) pagination for list queries
+
+A page is ordered by a fixed key - e.g. (created_at DESC, id DESC) - and the
+next page starts strictly after the last row's key, so the database seeks
+straight to it instead of counting past `offset` rows, and rows inserted
+meanwhile don't shift later pages.
+
+The key of the last row is encoded as an opaque cursor string that the API
+layer returns as the `X-Next-Cursor` header (app.api.pagination); clients pass
+it back as `?cursor=`. Without a cursor, `offset`/`skip` still works as before.
+
+    order = [(Project.created_at, True), (Project.id, True)]
+    stmt = keyset_page(query, order, limit, cursor, offset=skip)
+    projects, next_cursor = split_page(stmt.all(), order, limit)
+
+`limit` must be at least 1.
+
+The last key column must be unique (normally the primary key) and key
+columns should be non-null - wrap nullable ones in coalesce().
+
+On SQLite datetimes are text in more than one format - CURRENT_TIMESTAMP
+writes 'YYYY-MM-DD HH:MM:SS', bound values carry '.ffffff' - and text
+comparison puts the same instant on both sides of a cursor. DateTime keys
+are therefore ordered and compared as julianday() there; other backends
+compile them unchanged.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, and_, literal, or_, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+# (expression, descending)
+OrderKey = Sequence[Tuple[Any, bool]]
+
+
+class InvalidCursor(ValueError):
+    """A cursor that is malformed or was issued for a different ordering"""
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(values: Sequence) -> str:
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List:
+    """Key values from a cursor; InvalidCursor if it is malformed or for a different ordering"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("wrong key size")
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid pagination cursor")
+
+
+class _time_ordered(FunctionElement):
+    """A datetime expression in a form that compares in time order"""
+    name = "time_ordered"
+    inherit_cache = True
+
+
+@compiles(_time_ordered)
+def _compile_time_ordered(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(_time_ordered, "sqlite")
+def _compile_time_ordered_sqlite(element, compiler, **kw):
+    return f"julianday({compiler.process(element.clauses, **kw)})"
+
+
+def _sort_key(expr):
+    return _time_ordered(expr) if isinstance(expr.type, DateTime) else expr
+
+
+def _sort_value(expr, value):
+    bound = literal(value, expr.type)
+    return _time_ordered(bound) if isinstance(expr.type, DateTime) else bound
+
+
+def _after(order: OrderKey, values: Sequence):
+    """Rows strictly after `values` in `order`"""
+    keys = [_sort_key(expr) for expr, _ in order]
+    bounds = [_sort_value(expr, value) for (expr, _), value in zip(order, values)]
+    directions = {descending for _, descending in order}
+    if len(directions) == 1:
+        # Row-value comparison - a single index range scan on PostgreSQL
+        left, right = tuple_(*keys), tuple_(*bounds)
+        return left < right if directions.pop() else left > right
+
+    clauses = []
+    for i, (_, descending) in enumerate(order):
+        equal_prefix = [keys[j] == bounds[j] for j in range(i)]
+        clauses.append(and_(*equal_prefix, keys[i] < bounds[i] if descending else keys[i] > bounds[i]))
+    return or_(*clauses)
+
+
+def keyset_page(stmt, order: OrderKey, limit: int, cursor: Optional[str] = None, offset: int = 0):
+    """
+    Order, seek and limit a Query or Select for one page.
+
+    The key expressions are appended as extra result columns (stripped again by
+    `split_page`) and one extra row is fetched to tell whether a next page exists.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    stmt = stmt.order_by(*[
+        _sort_key(expr).desc() if descending else _sort_key(expr).asc() for expr, descending in order
+    ])
+    if cursor:
+        stmt = stmt.filter(_after(order, decode_cursor(cursor, len(order))))
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt.add_columns(*[expr for expr, _ in order]).limit(limit + 1)
+
+
+def split_page(rows: Sequence, order: OrderKey, limit: int) -> Tuple[List, Optional[str]]:
+    """(items, next_cursor) from the rows of a `keyset_page` statement"""
+    size = len(order)
+    items = [row[0] if len(row) == size + 1 else tuple(row[:-size]) for row in rows[:limit]]
+    next_cursor = encode_cursor(rows[limit - 1][-size:]) if len(rows) > limit else None
+    return items, next_cursor
+
@@ -0,0 +1,237 @@
+"""
+Connection pool instrumentation and adaptive sizing
+
+Every engine created in app.db.database uses one of the instrumented pool
+classes below. They record how long each checkout waited for a connection,
+count checkout timeouts, and - through pool events - count connects,
+invalidations (pre-ping failures and disconnects) and recycles.
+
+In adaptive mode the pool's overflow limit is tuned from the observed
+checkout waits, between 0 and the ceiling computed by `pool_limits`.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+# Checkout wait histogram bucket upper bounds, in milliseconds
+WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+# Adaptive tuning
+TUNE_INTERVAL_SECONDS = 15.0
+TUNE_MIN_SAMPLES = 20
+
+
+class PoolStats:
+    """Counters and checkout-wait histogram for one engine's pool"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)  # last bucket is +Inf
+        self.wait_sum_ms = 0.0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.recycles = 0
+        self.recent_waits_ms = deque(maxlen=2000)
+
+    def observe_wait(self, wait_ms: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_sum_ms += wait_ms
+            self.recent_waits_ms.append(wait_ms)
+            for i, bound in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.bucket_counts[i] += 1
+                    break
+            else:
+                self.bucket_counts[-1] += 1
+
+    def increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def recent_wait_percentile(self, pct: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self.recent_waits_ms)
+        if len(samples) < TUNE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100.0))]
+
+    def histogram(self) -> Dict[str, int]:
+        """Cumulative bucket counts keyed by upper bound ("le"), Prometheus style"""
+        with self._lock:
+            counts = list(self.bucket_counts)
+        cumulative = {}
+        running = 0
+        for bound, count in zip(WAIT_BUCKETS_MS + ["+Inf"], counts):
+            running += count
+            cumulative[str(bound)] = running
+        return cumulative
+
+
+class _InstrumentedPoolMixin:
+    """Times `_do_get` (the wait for a free connection) and runs the adaptive tuner"""
+
+    stats: PoolStats = None
+    adaptive: bool = False
+    max_overflow_ceiling: int = 0
+    target_wait_ms: float = 50.0
+    _last_tune: float = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if self.stats:
+                self.stats.increment("timeouts")
+            raise
+        finally:
+            if self.stats:
+                self.stats.observe_wait((time.perf_counter() - start) * 1000)
+            if self.adaptive:
+                self._maybe_tune()
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep the stats and tuning state
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        new_pool.adaptive = self.adaptive
+        new_pool.max_overflow_ceiling = self.max_overflow_ceiling
+        new_pool.target_wait_ms = self.target_wait_ms
+        new_pool._max_overflow = self._max_overflow
+        return new_pool
+
+    def _maybe_tune(self):
+        now = time.monotonic()
+        if now - self._last_tune < TUNE_INTERVAL_SECONDS:
+            return
+        self._last_tune = now
+
+        p95 = self.stats.recent_wait_percentile(95)
+        if p95 is None:
+            return
+
+        current = self._max_overflow
+        if p95 > self.target_wait_ms and current < self.max_overflow_ceiling:
+            # Requests are queueing for connections - allow more overflow
+            new = min(self.max_overflow_ceiling, current + max(1, self.max_overflow_ceiling // 4))
+        elif p95 < self.target_wait_ms / 4 and self.overflow() < current and current > 0:
+            # Waits are negligible and the overflow headroom is unused - give it back
+            new = current - 1
+        else:
+            return
+
+        # QueuePool reads _max_overflow on every checkout; lowering it below the
+        # current overflow just closes the extra connections as they are returned
+        self._max_overflow = new
+        self.stats.recent_waits_ms.clear()
+        logger.info(f"Adaptive pool '{self.stats.name}': p95 wait {p95:.1f}ms, max_overflow {current} -> {new}")
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_registry: Dict[str, object] = {}
+
+
+def instrument_engine(engine, name: str, adaptive: bool = False, max_overflow_ceiling: int = 0,
+                      target_wait_ms: float = 50.0):
+    """Attach stats and pool event listeners to a (sync) engine and register it for reporting"""
+    pool = engine.pool
+    stats = PoolStats(name)
+
+    if isinstance(pool, _InstrumentedPoolMixin):
+        pool.stats = stats
+        pool.adaptive = adaptive
+        pool.max_overflow_ceiling = max_overflow_ceiling
+        pool.target_wait_ms = target_wait_ms
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.increment("connects")
+        if connection_record.info.pop("rw_invalidated", False):
+            return
+        if connection_record.info.get("rw_connected"):
+            # Same pool slot reconnecting without an invalidation: pool_recycle
+            stats.increment("recycles")
+        connection_record.info["rw_connected"] = True
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("invalidations")
+        connection_record.info["rw_invalidated"] = True
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("invalidations")
+        connection_record.info["rw_invalidated"] = True
+
+    _registry[name] = engine
+    return stats
+
+
+def _pool_snapshot(engine) -> Dict:
+    pool = engine.pool
+    snapshot = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        snapshot.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(0, pool.overflow()),
+            "max_overflow": pool._max_overflow,
+            "timeout_seconds": pool.timeout(),
+        })
+
+    stats = getattr(pool, "stats", None)
+    if stats:
+        snapshot.update({
+            "adaptive": pool.adaptive,
+            "checkouts": stats.checkouts,
+            "checkout_wait_ms_sum": round(stats.wait_sum_ms, 3),
+            "checkout_wait_ms_histogram": stats.histogram(),
+            "checkout_wait_ms_p95_recent": stats.recent_wait_percentile(95),
+            "timeouts": stats.timeouts,
+            "connects": stats.connects,
+            "invalidations": stats.invalidations,
+            "recycles": stats.recycles,
+        })
+
+    return snapshot
+
+
+def get_pool_metrics() -> Dict[str, Dict]:
+    """Current gauges and counters for every registered engine"""
+    return {name: _pool_snapshot(engine) for name, engine in _registry.items()}
+
+
+def pool_limits(worker_count: int, max_connections: int, min_size: int) -> List[int]:
+    """
+    Size one worker's pool from the connection budget shared by all workers.
+
+    Half of the per-worker share is kept as the steady pool, the rest is the
+    ceiling the adaptive tuner may grow overflow into.
+
+    Returns:
+        [pool_size, max_overflow_ceiling]
+    """
+    per_worker = max(1, max_connections // max(1, worker_count))
+    pool_size = min(per_worker, max(min_size, per_worker // 2))
+    return [pool_size, per_worker - pool_size]
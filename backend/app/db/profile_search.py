@@ -0,0 +1,143 @@
+"""
+Full-text search over freelancer profiles (first_name, last_name, bio)
+
+- PostgreSQL: GIN index on a weighted to_tsvector expression (names weight A,
+  bio weight B). The index is on the expression itself, so the database keeps
+  it current on every profile insert/update - no extra column or trigger.
+- SQLite: an external-content FTS5 table (profiles_fts) kept in sync with
+  profiles by insert/update/delete triggers.
+- Other backends fall back to ILIKE.
+
+Search terms are matched as prefixes ("pyth" finds "Python"), every term must
+match, and results are ordered by relevance (ts_rank_cd / bm25).
+"""
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Float, Integer, cast, func, literal_column, or_, text
+from sqlalchemy.orm import Query
+
+from app.models.models import Profile
+
+logger = logging.getLogger(__name__)
+
+# Terms beyond this are ignored - keeps pathological queries cheap
+MAX_SEARCH_TERMS = 8
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+PG_INDEX_NAME = "ix_profiles_search_vector"
+
+
+def _pg_tsvector_sql(prefix: str = "") -> str:
+    """The indexed expression - queries must use it verbatim to hit the GIN index"""
+    return (
+        f"setweight(to_tsvector('simple', coalesce({prefix}first_name, '') || ' ' || "
+        f"coalesce({prefix}last_name, '')), 'A') || "
+        f"setweight(to_tsvector('simple', coalesce({prefix}bio, '')), 'B')"
+    )
+
+
+PG_CREATE_INDEX = (
+    f"CREATE INDEX {{concurrently}} IF NOT EXISTS {PG_INDEX_NAME} "
+    f"ON profiles USING GIN (({_pg_tsvector_sql()}))"
+)
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS profiles_fts USING fts5("
+    "first_name, last_name, bio, content='profiles', content_rowid='id', prefix='2 3')",
+    """CREATE TRIGGER IF NOT EXISTS profiles_fts_ai AFTER INSERT ON profiles BEGIN
+        INSERT INTO profiles_fts(rowid, first_name, last_name, bio)
+        VALUES (new.id, new.first_name, new.last_name, new.bio);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS profiles_fts_ad AFTER DELETE ON profiles BEGIN
+        INSERT INTO profiles_fts(profiles_fts, rowid, first_name, last_name, bio)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.bio);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS profiles_fts_au AFTER UPDATE OF first_name, last_name, bio ON profiles BEGIN
+        INSERT INTO profiles_fts(profiles_fts, rowid, first_name, last_name, bio)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.bio);
+        INSERT INTO profiles_fts(rowid, first_name, last_name, bio)
+        VALUES (new.id, new.first_name, new.last_name, new.bio);
+    END""",
+]
+
+SQLITE_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS profiles_fts_au",
+    "DROP TRIGGER IF EXISTS profiles_fts_ad",
+    "DROP TRIGGER IF EXISTS profiles_fts_ai",
+    "DROP TABLE IF EXISTS profiles_fts",
+]
+
+
+def search_terms(search_query: str) -> List[str]:
+    """Word tokens of a user query; punctuation and operators are dropped"""
+    return _TERM.findall(search_query.lower())[:MAX_SEARCH_TERMS]
+
+
+def ensure_profile_search_index(engine, concurrently: bool = False):
+    """Create the full-text index for the engine's backend if it's missing (idempotent)"""
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        # CONCURRENTLY can't run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(PG_CREATE_INDEX.format(concurrently="CONCURRENTLY" if concurrently else "")))
+    elif dialect == "sqlite":
+        with engine.begin() as conn:
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'profiles_fts'"
+            )).first()
+            for statement in SQLITE_FTS_DDL:
+                conn.execute(text(statement))
+            if not exists:
+                # Index the rows that predate the table
+                conn.execute(text("INSERT INTO profiles_fts(profiles_fts) VALUES ('rebuild')"))
+                logger.info("Built profiles_fts full-text index")
+
+
+def profile_search_match(query: Query, dialect: str, search_query: str) -> Tuple[Query, Optional[Tuple]]:
+    """
+    Filter `query` (which selects Profile) to profiles matching every term.
+
+    Returns the filtered query and a relevance sort key - (expression,
+    descending) - or None when the backend can't rank (ILIKE fallback).
+    """
+    terms = search_terms(search_query)
+    if not terms:
+        return query, None
+
+    if dialect == "postgresql":
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        vector = literal_column(_pg_tsvector_sql("profiles."))
+        # ts_rank_cd is float4 - widen it so the rank round-trips exactly through a keyset cursor
+        rank = cast(func.ts_rank_cd(vector, tsquery), Float(precision=53))
+        return query.filter(vector.op("@@")(tsquery)), (rank, True)
+
+    if dialect == "sqlite":
+        # bm25 is lower-is-better; names weigh more than bio
+        matches = text(
+            "SELECT rowid AS profile_id, bm25(profiles_fts, 10.0, 10.0, 1.0) AS rank "
+            "FROM profiles_fts WHERE profiles_fts MATCH :fts_query"
+        ).bindparams(fts_query=" ".join(f'"{term}"*' for term in terms)).columns(
+            profile_id=Integer, rank=Float
+        ).subquery("profile_matches")
+        return query.join(matches, matches.c.profile_id == Profile.id), (matches.c.rank, False)
+
+    search_pattern = f"%{search_query}%"
+    return query.filter(
+        or_(
+            Profile.first_name.ilike(search_pattern),
+            Profile.last_name.ilike(search_pattern),
+            Profile.bio.ilike(search_pattern)
+        )
+    ), None
+
+
+def apply_profile_search(query: Query, dialect: str, search_query: str) -> Query:
+    """`profile_search_match`, ordered best match first"""
+    query, rank = profile_search_match(query, dialect, search_query)
+    if rank is not None:
+        expr, descending = rank
+        query = query.order_by(expr.desc() if descending else expr.asc())
+    return query
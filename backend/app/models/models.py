@@ -165,7 +165,7 @@ class Profile(Base):
     phone = Column(String, nullable=True)
     website = Column(String, nullable=True)
     linkedin = Column(String, nullable=True)
-    github_username = Column(String, nullable=True)  # GitHub profile
+    github_username = Column(String, nullable=True, index=True)  # GitHub profile (webhook lookups)
     huggingface_username = Column(String, nullable=True)  # Hugging Face profile
 
     # Freelancer specific
@@ -209,6 +209,30 @@ class Profile(Base):
     portfolio_items = relationship("PortfolioItem", back_populates="profile", cascade="all, delete-orphan")
 
 
+class ProfileSkill(Base):
+    """Normalized copy of Profile.skills (lowercased), maintained by app.services.skill_index"""
+    __tablename__ = "profile_skills"
+
+    profile_id = Column(Integer, ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True)
+
+    __table_args__ = (
+        Index('idx_profile_skills_skill', 'skill', 'profile_id'),
+    )
+
+
+class ProfileVerifiedSkill(Base):
+    """Skills marked verified in Profile.verified_skills (lowercased), maintained by app.services.skill_index"""
+    __tablename__ = "profile_verified_skills"
+
+    profile_id = Column(Integer, ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True)
+
+    __table_args__ = (
+        Index('idx_profile_verified_skills_skill', 'skill', 'profile_id'),
+    )
+
+
 class Project(Base):
     __tablename__ = "projects"
     
@@ -241,6 +265,24 @@ class Project(Base):
     certificates = relationship("BuildCertificate", back_populates="project", cascade="all, delete-orphan")
     milestones = relationship("Milestone", back_populates="project", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Status-filtered listings, newest first (keyset order created_at, id)
+        Index('idx_projects_status_created', 'status', 'created_at', 'id'),
+        Index('idx_projects_owner_status', 'owner_id', 'status'),
+    )
+
+
+class ProjectRequiredSkill(Base):
+    """Normalized copy of Project.required_skills (lowercased), maintained by app.services.skill_index"""
+    __tablename__ = "project_required_skills"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True)
+
+    __table_args__ = (
+        Index('idx_project_required_skills_skill', 'skill', 'project_id'),
+    )
+
 
 class Application(Base):
     __tablename__ = "applications"
@@ -264,6 +306,11 @@ class Application(Base):
     project = relationship("Project", back_populates="applications")
     applicant = relationship("User", back_populates="applications")
 
+    __table_args__ = (
+        Index('idx_applications_project_applicant_status', 'project_id', 'applicant_id', 'status'),
+        Index('idx_applications_applicant_status', 'applicant_id', 'status'),  # "my applications"
+    )
+
 
 class AgentAssignment(Base):
     __tablename__ = "agent_assignments"
@@ -302,6 +349,10 @@ class Review(Base):
     reviewer = relationship("User", foreign_keys=[reviewer_id], back_populates="reviews_given")
     reviewee = relationship("User", foreign_keys=[reviewee_id], back_populates="reviews_received")
 
+    __table_args__ = (
+        Index('idx_reviews_reviewee_created', 'reviewee_id', 'created_at'),
+    )
+
 
 class Payment(Base):
     __tablename__ = "payments"
@@ -382,6 +433,10 @@ class Notification(Base):
     # Relationships
     user = relationship("User", back_populates="notifications")
 
+    __table_args__ = (
+        Index('idx_notifications_user_read_created', 'user_id', 'is_read', 'created_at'),
+    )
+
 
 class ProjectBrief(Base):
     """AI-generated project briefs - Smart Project Brief feature"""
@@ -559,6 +614,11 @@ class ProofOfBuild(Base):
     artifacts = relationship("ProofArtifact", back_populates="proof", cascade="all, delete-orphan")
     approval = relationship("ProofApproval", back_populates="proof", uselist=False, cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('idx_proofs_user_status', 'user_id', 'status'),
+        Index('idx_proofs_project_created', 'project_id', 'created_at'),
+    )
+
 
 class ProofArtifact(Base):
     """Additional artifacts attached to proofs (screenshots, logs, test results)"""
@@ -725,6 +785,58 @@ class ProofApproval(Base):
     reviewer = relationship("User", foreign_keys=[reviewer_id])
 
 
+class UserProofStats(Base):
+    """Per-user proof-of-build rollup, refreshed in the same transaction as every
+    proof/approval write (see app.services.proof_stats)"""
+    __tablename__ = "user_proof_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_proofs = Column(Integer, default=0, nullable=False)
+    verified_proofs = Column(Integer, default=0, nullable=False)
+    approved_proofs = Column(Integer, default=0, nullable=False)
+    projects_with_proofs = Column(Integer, default=0, nullable=False)
+    proofs_by_type = Column(JSON, default={})  # {"commit": 3, "pull_request": 1, ...}
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class UserDashboardStats(Base):
+    """Per-user /users/me/stats counters, refreshed in the same transaction as every
+    project/application/profile write (see app.services.dashboard_stats)"""
+    __tablename__ = "user_dashboard_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    owned_active_projects = Column(Integer, default=0, nullable=False)  # Business: own projects in progress
+    pending_applications = Column(Integer, default=0, nullable=False)
+    accepted_applications = Column(Integer, default=0, nullable=False)  # Freelancer: active projects
+    # Mirrored from the profile
+    total_earnings = Column(Float, default=0.0, nullable=False)
+    completed_projects = Column(Integer, default=0, nullable=False)
+    average_rating = Column(Float, default=0.0, nullable=False)
+    total_reviews = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class FeaturedFreelancer(Base):
+    """Featured-freelancer leaderboard - eligible profiles with their ranking
+    keys, maintained by app.services.leaderboard"""
+    __tablename__ = "featured_freelancers"
+
+    profile_id = Column(Integer, ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    average_rating = Column(Float, nullable=False)
+    completed_projects = Column(Integer, default=0, nullable=False)
+    total_reviews = Column(Integer, default=0, nullable=False)
+
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Ranking order - the endpoint reads the first `limit` entries of this index
+        Index('idx_featured_freelancers_rank', 'average_rating', 'completed_projects', 'profile_id'),
+    )
+
+
 class SummaryType(str, enum.Enum):
     WEEKLY = "weekly"
     ON_DEMAND = "on_demand"
@@ -765,6 +877,10 @@ class ProjectMessage(Base):
     parent_message = relationship("ProjectMessage", remote_side=[id], foreign_keys=[parent_message_id])
     read_by = relationship("MessageReadStatus", back_populates="message", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('idx_project_messages_project_deleted_created', 'project_id', 'deleted_at', 'created_at'),
+    )
+
 
 class MessageReadStatus(Base):
     """Track read status of messages for real-time chat features"""
@@ -883,7 +999,7 @@ class PortfolioItem(Base):
     __tablename__ = "portfolio_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
+    profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False, index=True)
 
     # Item metadata
     item_type = Column(
@@ -9,19 +9,21 @@ Handles AI-powered project management features including:
 
 import os
 import json
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, desc
 import requests
-from openai import OpenAI
 
 from app.models.models import (
     Project, User, ProofOfBuild, ProjectMessage, AISummary,
     SummaryType, ProofStatus, ProjectStatus
 )
 from app.schemas.schemas import SummaryInsights
+from app.db.pagination import keyset_page, split_page
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +31,29 @@ logger = logging.getLogger(__name__)
 class AICopilotService:
     """Service for AI-powered project management and insights"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Union[Session, AsyncSession]):
         self.db = db
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         if not self.openai_api_key:
             logger.warning("OPENAI_API_KEY not set - AI features will be limited")
-        self.client = OpenAI(api_key=self.openai_api_key) if self.openai_api_key else None
+        self.client = None
+        if self.openai_api_key:
+            from openai import OpenAI  # Imported lazily - the SDK is slow to import
+            self.client = OpenAI(api_key=self.openai_api_key)
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")  # Default to cost-effective model
 
+    async def _run(self, fn: Callable[[Session], Any]) -> Any:
+        """
+        Run sync ORM code against the service's session.
+
+        API endpoints pass an AsyncSession, whose run_sync() hands `fn` a
+        regular Session while the I/O stays non-blocking; Celery tasks pass
+        a plain Session and `fn` is called directly.
+        """
+        if isinstance(self.db, AsyncSession):
+            return await self.db.run_sync(fn)
+        return fn(self.db)
+
     async def generate_project_summary(
         self,
         project_id: int,
@@ -63,7 +80,9 @@ class AICopilotService:
         start_time = datetime.utcnow()
 
         # Validate project exists
-        project = self.db.query(Project).filter(Project.id == project_id).first()
+        project = await self._run(
+            lambda session: session.query(Project).filter(Project.id == project_id).first()
+        )
         if not project:
             raise ValueError(f"Project {project_id} not found")
 
@@ -124,9 +143,13 @@ class AICopilotService:
             is_archived=False
         )
 
-        self.db.add(summary)
-        self.db.commit()
-        self.db.refresh(summary)
+        def _save(session: Session) -> AISummary:
+            session.add(summary)
+            session.commit()
+            session.refresh(summary)
+            return summary
+
+        await self._run(_save)
 
         logger.info(f"Generated summary {summary.id} for project {project_id} in {generation_time_ms}ms")
 
@@ -145,14 +168,16 @@ class AICopilotService:
 
         try:
             # Get proofs of build related to GitHub
-            proofs = self.db.query(ProofOfBuild).filter(
-                and_(
-                    ProofOfBuild.project_id == project.id,
-                    ProofOfBuild.verified_at >= start_date,
-                    ProofOfBuild.verified_at <= end_date,
-                    ProofOfBuild.status == ProofStatus.VERIFIED
-                )
-            ).all()
+            proofs = await self._run(
+                lambda session: session.query(ProofOfBuild).filter(
+                    and_(
+                        ProofOfBuild.project_id == project.id,
+                        ProofOfBuild.verified_at >= start_date,
+                        ProofOfBuild.verified_at <= end_date,
+                        ProofOfBuild.status == ProofStatus.VERIFIED
+                    )
+                ).all()
+            )
 
             for proof in proofs:
                 if proof.github_commit_hash:
@@ -193,18 +218,22 @@ class AICopilotService:
         messages_data = []
 
         try:
-            messages = self.db.query(ProjectMessage).filter(
-                and_(
-                    ProjectMessage.project_id == project_id,
-                    ProjectMessage.created_at >= start_date,
-                    ProjectMessage.created_at <= end_date,
-                    ProjectMessage.deleted_at.is_(None)
-                )
-            ).order_by(ProjectMessage.created_at).all()
+            messages = await self._run(
+                lambda session: session.query(ProjectMessage).filter(
+                    and_(
+                        ProjectMessage.project_id == project_id,
+                        ProjectMessage.created_at >= start_date,
+                        ProjectMessage.created_at <= end_date,
+                        ProjectMessage.deleted_at.is_(None)
+                    )
+                ).order_by(ProjectMessage.created_at).all()
+            )
 
             for msg in messages:
                 # Get sender info
-                sender = self.db.query(User).filter(User.id == msg.sender_id).first()
+                sender = await self._run(
+                    lambda session: session.query(User).filter(User.id == msg.sender_id).first()
+                )
                 sender_name = f"{sender.email}" if sender else "Unknown"
 
                 messages_data.append({
@@ -266,8 +295,9 @@ Generate a JSON response with the following structure:
 
 Focus on actionable insights and concrete progress indicators."""
 
-            # Call OpenAI
-            response = self.client.chat.completions.create(
+            # Call OpenAI (blocking HTTP call, keep it off the event loop)
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert AI Project Manager. Provide clear, actionable insights in JSON format."},
@@ -432,15 +462,18 @@ Focus on actionable insights and concrete progress indicators."""
         self,
         project_id: int,
         limit: int = 50,
-        offset: int = 0
-    ) -> List[ProjectMessage]:
-        """Get messages for a project"""
-        return self.db.query(ProjectMessage).filter(
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[ProjectMessage], Optional[str]]:
+        """Get a page of messages for a project (newest first) and the cursor for the next page"""
+        query = self.db.query(ProjectMessage).filter(
             and_(
                 ProjectMessage.project_id == project_id,
                 ProjectMessage.deleted_at.is_(None)
             )
-        ).order_by(desc(ProjectMessage.created_at)).offset(offset).limit(limit).all()
+        )
+        order = [(ProjectMessage.created_at, True), (ProjectMessage.id, True)]
+        return split_page(keyset_page(query, order, limit, cursor, offset).all(), order, limit)
 
     def mark_message_read(self, message_id: int, user_id: int):
         """Mark a message as read by a user"""
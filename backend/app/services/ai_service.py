@@ -4,9 +4,8 @@ Handles AI-powered features like Smart Project Briefs
 """
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Any
-from openai import OpenAI
-from anthropic import Anthropic
 
 
 class AIService:
@@ -19,11 +18,13 @@ class AIService:
         # Initialize OpenAI if API key is available
         openai_key = os.getenv("OPENAI_API_KEY")
         if openai_key:
+            from openai import OpenAI  # SDKs are imported lazily - they dominate cold start
             self.openai_client = OpenAI(api_key=openai_key)
 
         # Initialize Anthropic if API key is available
         anthropic_key = os.getenv("ANTHROPIC_API_KEY")
         if anthropic_key:
+            from anthropic import Anthropic
             self.anthropic_client = Anthropic(api_key=anthropic_key)
 
     def generate_project_brief(
@@ -167,5 +168,7 @@ Return ONLY the JSON object, no other text."""
             raise Exception(f"Anthropic API error: {str(e)}")
 
 
-# Singleton instance
-ai_service = AIService()
+@lru_cache(maxsize=None)
+def get_ai_service() -> AIService:
+    """Shared AIService instance, created on first use"""
+    return AIService()
@@ -0,0 +1,220 @@
+"""
+Dashboard counters - Keeps user_dashboard_stats in sync for /users/me/stats
+
+Every flush that creates, updates or deletes an Application (status or
+applicant), a Project (status or owner) or a Profile statistic recomputes the
+affected users' row on the flush's own connection, so the counters commit or
+roll back together with the write - escrow releases, application
+acceptance and review ratings included, without touching the call sites.
+
+The Celery beat job `app.tasks.dashboard_tasks.reconcile_dashboard_stats`
+recomputes every row with grouped queries and corrects drift from writes
+that bypass the ORM.
+
+Backfill / repair:
+    python -m app.services.dashboard_stats
+"""
+import logging
+from typing import Dict, Set
+
+from sqlalchemy import case, event, func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.models import (
+    Application, ApplicationStatus, Profile, Project, ProjectStatus, User, UserDashboardStats
+)
+
+logger = logging.getLogger(__name__)
+
+stats_table = UserDashboardStats.__table__
+
+COUNTER_COLUMNS = ("owned_active_projects", "pending_applications", "accepted_applications")
+PROFILE_COLUMNS = ("total_earnings", "completed_projects", "average_rating", "total_reviews")
+
+RECONCILE_BATCH_SIZE = 500  # Rows recomputed per reconcile transaction
+
+# Attributes whose change moves a counter
+_APPLICATION_ATTRS = ("status", "applicant_id")
+_PROJECT_ATTRS = ("status", "owner_id")
+
+
+def _application_counts():
+    return (
+        func.coalesce(func.sum(case((Application.status == ApplicationStatus.PENDING, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Application.status == ApplicationStatus.ACCEPTED, 1), else_=0)), 0),
+    )
+
+
+def _zeros() -> Dict:
+    return {
+        "owned_active_projects": 0,
+        "pending_applications": 0,
+        "accepted_applications": 0,
+        "total_earnings": 0.0,
+        "completed_projects": 0,
+        "average_rating": 0.0,
+        "total_reviews": 0,
+    }
+
+
+def _profile_values(total_earnings, completed_projects, average_rating, total_reviews) -> Dict:
+    return {
+        "total_earnings": total_earnings or 0.0,
+        "completed_projects": completed_projects or 0,
+        "average_rating": average_rating or 0.0,
+        "total_reviews": total_reviews or 0,
+    }
+
+
+def compute_user_dashboard_stats(conn, user_id: int) -> Dict:
+    """Counters for one user: one statement for the counts, one profile read"""
+    owned_active = select(func.count(Project.id)).where(
+        Project.owner_id == user_id, Project.status == ProjectStatus.IN_PROGRESS
+    ).scalar_subquery()
+    pending, accepted = _application_counts()
+    owned_active, pending, accepted = conn.execute(
+        select(owned_active, pending, accepted).where(Application.applicant_id == user_id)
+    ).one()
+
+    stats = _zeros()
+    stats.update(owned_active_projects=owned_active or 0, pending_applications=pending, accepted_applications=accepted)
+    profile = conn.execute(
+        select(Profile.total_earnings, Profile.completed_projects, Profile.average_rating, Profile.total_reviews)
+        .where(Profile.user_id == user_id)
+    ).first()
+    if profile:
+        stats.update(_profile_values(*profile))
+    return stats
+
+
+def _insert_missing_row(conn, user_id: int):
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        conn.execute(postgresql.insert(stats_table).values(user_id=user_id).on_conflict_do_nothing())
+    elif dialect == "sqlite":
+        conn.execute(sqlite.insert(stats_table).values(user_id=user_id).on_conflict_do_nothing())
+    elif conn.execute(select(stats_table.c.user_id).where(stats_table.c.user_id == user_id)).first() is None:
+        conn.execute(stats_table.insert().values(user_id=user_id))
+
+
+def refresh_user_dashboard_stats(conn, user_id: int) -> Dict:
+    """Recompute one user's counters on `conn` (inside the caller's transaction)"""
+    _insert_missing_row(conn, user_id)
+    # Row lock serialises concurrent writes for the same user on Postgres
+    conn.execute(select(stats_table.c.user_id).where(stats_table.c.user_id == user_id).with_for_update())
+    stats = compute_user_dashboard_stats(conn, user_id)
+    conn.execute(update(stats_table).where(stats_table.c.user_id == user_id).values(**stats, updated_at=func.now()))
+    return stats
+
+
+def get_user_dashboard_stats(db: Session, user_id: int) -> Dict:
+    """Counter values for a user - a single primary-key read (zeros when the user has no row)"""
+    row = db.get(UserDashboardStats, user_id)
+    if row is None:
+        return _zeros()
+    return {column: getattr(row, column) for column in COUNTER_COLUMNS + PROFILE_COLUMNS}
+
+
+def reconcile_dashboard_stats(db: Session) -> int:
+    """
+    Find drifted rows with grouped queries and recompute them; returns the
+    number of rows inserted or corrected.
+    """
+    expected: Dict[int, Dict] = {}
+
+    def row_for(user_id):
+        return expected.setdefault(user_id, _zeros())
+
+    for owner_id, count in db.execute(
+        select(Project.owner_id, func.count(Project.id))
+        .where(Project.status == ProjectStatus.IN_PROGRESS)
+        .group_by(Project.owner_id)
+    ):
+        row_for(owner_id)["owned_active_projects"] = count
+
+    pending, accepted = _application_counts()
+    for applicant_id, pending_count, accepted_count in db.execute(
+        select(Application.applicant_id, pending, accepted).group_by(Application.applicant_id)
+    ):
+        row = row_for(applicant_id)
+        row["pending_applications"] = pending_count
+        row["accepted_applications"] = accepted_count
+
+    for user_id, *profile in db.execute(
+        select(
+            Profile.user_id, Profile.total_earnings, Profile.completed_projects,
+            Profile.average_rating, Profile.total_reviews
+        )
+    ):
+        row_for(user_id).update(_profile_values(*profile))
+
+    current = {
+        row.user_id: {column: getattr(row, column) for column in COUNTER_COLUMNS + PROFILE_COLUMNS}
+        for row in db.execute(select(stats_table))
+    }
+
+    drifted = {user_id for user_id, stats in expected.items() if current.pop(user_id, None) != stats}
+    # Rows for users that no longer have any activity
+    drifted |= {user_id for user_id, existing in current.items() if existing != _zeros()}
+
+    # The grouped reads above can trail writes committed since; recompute each
+    # drifted row under its row lock rather than writing the snapshot, and
+    # commit in batches so the locks are held briefly
+    drifted = sorted(drifted)
+    for start in range(0, len(drifted), RECONCILE_BATCH_SIZE):
+        conn = db.connection()
+        for user_id in drifted[start:start + RECONCILE_BATCH_SIZE]:
+            refresh_user_dashboard_stats(conn, user_id)
+        db.commit()
+    db.commit()
+    return len(drifted)
+
+
+def _changed(session: Session, obj, attrs) -> bool:
+    if obj in session.new or obj in session.deleted:
+        return True
+    state = inspect(obj).attrs
+    return any(state[attr].history.has_changes() for attr in attrs)
+
+
+def _owners(obj, attr: str) -> Set[int]:
+    # Current and previous value, so moving a row between users refreshes both
+    history = inspect(obj).attrs[attr].history
+    return {uid for uid in [getattr(obj, attr), *(history.deleted or ())] if uid is not None}
+
+
+def _affected_user_ids(session: Session) -> Set[int]:
+    user_ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Application) and _changed(session, obj, _APPLICATION_ATTRS):
+            user_ids |= _owners(obj, "applicant_id")
+        elif isinstance(obj, Project) and _changed(session, obj, _PROJECT_ATTRS):
+            user_ids |= _owners(obj, "owner_id")
+        elif isinstance(obj, Profile) and _changed(session, obj, PROFILE_COLUMNS):
+            user_ids |= _owners(obj, "user_id")
+    # A user deleted in this flush takes their row with them (ON DELETE CASCADE)
+    return user_ids - {obj.id for obj in session.deleted if isinstance(obj, User)}
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed_dashboard_stats(session, flush_context):
+    user_ids = _affected_user_ids(session)
+    if not user_ids:
+        return
+    conn = session.connection()
+    # Fixed lock order - two transactions touching the same users can't deadlock
+    for user_id in sorted(user_ids):
+        refresh_user_dashboard_stats(conn, user_id)
+
+
+if __name__ == "__main__":
+    from app.db.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        corrected = reconcile_dashboard_stats(db)
+        logger.info(f"Reconciled dashboard stats: {corrected} row(s) inserted or corrected")
+    finally:
+        db.close()
@@ -1,20 +1,29 @@
 """Email notification service using MailerSend"""
+from functools import lru_cache
 from typing import Optional
 from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Try to import MailerSend - gracefully handle if not available
-try:
-    from mailersend import MailerSendClient, EmailBuilder
-    MAILERSEND_AVAILABLE = True
-    logger.info("MailerSend module loaded successfully")
-except ImportError as e:
-    logger.warning(f"MailerSend module not available: {e}. Email functionality will be disabled.")
-    MAILERSEND_AVAILABLE = False
-    MailerSendClient = None
-    EmailBuilder = None
+# MailerSend is imported when the service is first created, not at app startup
+MailerSendClient = None
+EmailBuilder = None
+MAILERSEND_AVAILABLE = False
+
+
+def _load_mailersend() -> bool:
+    """Import MailerSend on first use - gracefully handle if not available"""
+    global MailerSendClient, EmailBuilder, MAILERSEND_AVAILABLE
+    if MAILERSEND_AVAILABLE:
+        return True
+    try:
+        from mailersend import MailerSendClient, EmailBuilder
+        MAILERSEND_AVAILABLE = True
+        logger.info("MailerSend module loaded successfully")
+    except ImportError as e:
+        logger.warning(f"MailerSend module not available: {e}. Email functionality will be disabled.")
+    return MAILERSEND_AVAILABLE
 
 
 class EmailService:
@@ -28,7 +37,7 @@ class EmailService:
         self.frontend_url = settings.FRONTEND_URL
         self.client = None
 
-        if MAILERSEND_AVAILABLE and self.api_key:
+        if self.api_key and _load_mailersend():
             try:
                 # Initialize MailerSend client with API key
                 self.client = MailerSendClient(api_key=self.api_key)
@@ -37,10 +46,10 @@ class EmailService:
                 logger.error(f"Failed to initialize MailerSend client: {e}")
                 self.client = None
         else:
-            if not MAILERSEND_AVAILABLE:
-                logger.warning("Email service disabled: MailerSend not available")
-            elif not self.api_key:
+            if not self.api_key:
                 logger.warning("Email service disabled: No API key configured")
+            else:
+                logger.warning("Email service disabled: MailerSend not available")
 
     def _send_email(self, to_email: str, to_name: str, subject: str, html_content: str, text_content: str = None) -> bool:
         """
@@ -748,5 +757,7 @@ class EmailService:
         return self._send_email(recipient_email, recipient_name, subject, html_content, text_content)
 
 
-# Singleton instance
-email_service = EmailService()
+@lru_cache(maxsize=None)
+def get_email_service() -> EmailService:
+    """Shared EmailService instance, created on first use"""
+    return EmailService()
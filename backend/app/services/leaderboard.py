@@ -0,0 +1,114 @@
+"""
+Featured-freelancer leaderboard - Keeps featured_freelancers in sync with profiles
+
+featured_freelancers holds one row per eligible freelancer (active, rated at
+least FEATURED_MIN_RATING, with at least one review) together with its
+ranking keys, so /freelancers/featured reads the first `limit` entries of the
+rank index instead of filtering and sorting every profile.
+
+Entries are rewritten in the same flush whenever a profile's rating, review
+count or completed projects change (reviews.update_user_rating assigns both
+rating fields) or a user's role/active flag changes. The Celery beat job
+`app.tasks.leaderboard_tasks.refresh_featured_leaderboard` rebuilds the
+whole table periodically to repair drift from writes that bypass the ORM.
+
+Backfill / repair:
+    python -m app.services.leaderboard
+"""
+import logging
+from typing import Set
+
+from sqlalchemy import delete, event, func, insert, inspect, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.models import FeaturedFreelancer, Profile, User, UserRole
+
+logger = logging.getLogger(__name__)
+
+FEATURED_MIN_RATING = 4.0
+
+# Attributes that decide eligibility or rank
+_PROFILE_ATTRS = ("average_rating", "total_reviews", "completed_projects")
+_USER_ATTRS = ("role", "is_active")
+
+_COLUMNS = ["profile_id", "user_id", "average_rating", "completed_projects", "total_reviews"]
+
+
+def _eligible_profiles():
+    """Leaderboard rows for every eligible profile, in _COLUMNS order"""
+    return select(
+        Profile.id,
+        Profile.user_id,
+        Profile.average_rating,
+        func.coalesce(Profile.completed_projects, 0),
+        Profile.total_reviews
+    ).join(User, Profile.user_id == User.id).where(
+        User.role == UserRole.FREELANCER,
+        User.is_active == True,
+        Profile.average_rating >= FEATURED_MIN_RATING,
+        Profile.total_reviews > 0
+    )
+
+
+def refresh_leaderboard_entries(conn, profile_ids=(), user_ids=()):
+    """Re-derive the entries of the given profiles / users' profiles"""
+    profile_ids, user_ids = list(profile_ids), list(user_ids)
+    if not profile_ids and not user_ids:
+        return
+    conn.execute(delete(FeaturedFreelancer).where(or_(
+        FeaturedFreelancer.profile_id.in_(profile_ids),
+        FeaturedFreelancer.user_id.in_(user_ids)
+    )))
+    conn.execute(insert(FeaturedFreelancer).from_select(
+        _COLUMNS,
+        _eligible_profiles().where(or_(Profile.id.in_(profile_ids), Profile.user_id.in_(user_ids)))
+    ))
+
+
+def refresh_featured_leaderboard(db: Session) -> int:
+    """Rebuild the whole leaderboard in one transaction; returns the entry count"""
+    conn = db.connection()
+    conn.execute(delete(FeaturedFreelancer))
+    conn.execute(insert(FeaturedFreelancer).from_select(_COLUMNS, _eligible_profiles()))
+    db.commit()
+    return db.scalar(select(func.count()).select_from(FeaturedFreelancer))
+
+
+def _changed(session: Session, obj, attrs) -> bool:
+    if obj in session.new:
+        return True
+    state = inspect(obj).attrs
+    return any(state[attr].history.has_changes() for attr in attrs)
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed_leaderboard(session, flush_context):
+    profile_ids: Set[int] = set()
+    user_ids: Set[int] = set()
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Profile) and _changed(session, obj, _PROFILE_ATTRS):
+            profile_ids.add(obj.id)
+        elif isinstance(obj, User) and obj not in session.new and _changed(session, obj, _USER_ATTRS):
+            user_ids.add(obj.id)
+
+    # ON DELETE CASCADE covers PostgreSQL; SQLite doesn't enforce foreign keys by default
+    for obj in session.deleted:
+        if isinstance(obj, Profile):
+            profile_ids.add(obj.id)
+        elif isinstance(obj, User):
+            user_ids.add(obj.id)
+
+    if profile_ids or user_ids:
+        refresh_leaderboard_entries(session.connection(), profile_ids, user_ids)
+
+
+if __name__ == "__main__":
+    from app.db.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        count = refresh_featured_leaderboard(db)
+        logger.info(f"Rebuilt featured leaderboard with {count} entries")
+    finally:
+        db.close()
@@ -0,0 +1,298 @@
+"""
+Match scoring - Batch skill-overlap scores for applications
+
+An application's ai_match_score is the share of the project's required skills
+the applicant has (0-100), from the normalized skill tables, or
+NEUTRAL_SCORE when either side lists no skills. Scores are deterministic.
+
+Scoring works in batches: one project's applicants, or one freelancer's
+candidate projects, are loaded as a sparse (COO) skill matrix over their
+shared skill vocabulary and scored together with a single sparse
+matrix-vector product in NumPy - two queries per batch, however many rows.
+
+`rank_applicants` blends the skill score with rating and verified proofs
+for the project owner's ranked applicant view.
+
+When a project's required_skills or a profile's skills change, the affected
+applications are re-scored after commit on a background thread of the same
+process, with its own session - the committing request never waits for it.
+With MATCH_RESCORE_CELERY the work is queued to the Celery task
+`app.tasks.match_tasks.rescore_applications` instead (falling back to the
+thread when the broker can't be reached).
+
+Full re-score:
+    python -m app.services.match_scoring
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, event, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.models import Application, Profile, ProfileSkill, Project, ProjectRequiredSkill, UserProofStats
+
+logger = logging.getLogger(__name__)
+
+NEUTRAL_SCORE = 50.0
+
+# rank_applicants weights and shaping
+RANK_SKILL_WEIGHT = 0.5
+RANK_RATING_WEIGHT = 0.3
+RANK_PROOF_WEIGHT = 0.2
+RATING_PRIOR = 3.0
+RATING_PRIOR_WEIGHT = 5  # Reviews' worth of prior
+PROOF_SATURATION = 20  # Verified proofs at which the proof signal maxes out
+
+applications_table = Application.__table__
+
+# One worker - re-scores run in commit order and never pile up on the DB pool
+_rescore_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="match-rescore")
+
+
+def _skill_overlap(pairs: Sequence[Tuple[int, Optional[str]]], target_skills: Iterable[str]):
+    """
+    Score inputs for many owners against one skill set.
+
+    `pairs` are (owner_id, skill) rows - skill None for owners without skills.
+    Returns (owner ids, skills each owner shares with `target_skills`, skills
+    per owner), the overlap being the product of the owners' 0/1 skill matrix
+    with the target's indicator vector.
+    """
+    if not pairs:
+        return [], np.zeros(0), np.zeros(0)
+
+    owners = np.fromiter((owner_id for owner_id, _ in pairs), dtype=np.int64, count=len(pairs))
+    skills = np.array([skill for _, skill in pairs], dtype=object)
+    owner_ids, rows = np.unique(owners, return_inverse=True)
+    n = len(owner_ids)
+
+    present = np.not_equal(skills, None)
+    rows = rows.reshape(-1)[present]
+    if not len(rows):
+        return owner_ids.tolist(), np.zeros(n), np.zeros(n)
+
+    vocabulary, cols = np.unique(skills[present].astype(str), return_inverse=True)
+    target = np.isin(vocabulary, list(target_skills)).astype(np.float64)
+
+    matched = np.bincount(rows, weights=target[cols.reshape(-1)], minlength=n)
+    sizes = np.bincount(rows, minlength=n).astype(np.float64)
+    return owner_ids.tolist(), matched, sizes
+
+
+def _scores(matched: np.ndarray, required: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    scores = np.full(len(matched), NEUTRAL_SCORE)
+    np.divide(matched * 100.0, required, out=scores, where=valid & (required > 0))
+    return np.round(np.clip(scores, 0.0, 100.0), 2)
+
+
+def _profile_skills(db: Session, user_id: int) -> List[str]:
+    return db.scalars(
+        select(ProfileSkill.skill).join(Profile, Profile.id == ProfileSkill.profile_id)
+        .where(Profile.user_id == user_id)
+    ).all()
+
+
+def score_applicants(db: Session, project_id: int) -> Dict[int, float]:
+    """{applicant user id: score} for every application to `project_id`"""
+    required = db.scalars(
+        select(ProjectRequiredSkill.skill).where(ProjectRequiredSkill.project_id == project_id)
+    ).all()
+    pairs = db.execute(
+        select(Application.applicant_id, ProfileSkill.skill).select_from(Application)
+        .outerjoin(Profile, Profile.user_id == Application.applicant_id)
+        .outerjoin(ProfileSkill, ProfileSkill.profile_id == Profile.id)
+        .where(Application.project_id == project_id)
+    ).all()
+
+    user_ids, matched, sizes = _skill_overlap(pairs, required)
+    scores = _scores(matched, np.full(len(user_ids), float(len(required))), sizes > 0)
+    return dict(zip(user_ids, scores.tolist()))
+
+
+def score_candidate_projects(db: Session, user_id: int, project_ids: Iterable[int]) -> Dict[int, float]:
+    """{project id: score} of one freelancer against each of `project_ids`"""
+    project_ids = list(project_ids)
+    if not project_ids:
+        return {}
+    skills = _profile_skills(db, user_id)
+    pairs = db.execute(
+        select(Project.id, ProjectRequiredSkill.skill).select_from(Project)
+        .outerjoin(ProjectRequiredSkill, ProjectRequiredSkill.project_id == Project.id)
+        .where(Project.id.in_(project_ids))
+    ).all()
+
+    ids, matched, sizes = _skill_overlap(pairs, skills)
+    scores = _scores(matched, sizes, np.full(len(ids), bool(skills)))
+    return dict(zip(ids, scores.tolist()))
+
+
+def score_match(db: Session, user_id: int, project_id: int) -> float:
+    """Score of one freelancer for one project"""
+    return score_candidate_projects(db, user_id, [project_id]).get(project_id, NEUTRAL_SCORE)
+
+
+def rank_applicants(db: Session, project_id: int) -> List[Tuple[int, float]]:
+    """
+    (application id, rank score 0-100) for every applicant with a profile, best first.
+
+    One vectorized pass over three signals: skill overlap (the match score),
+    rating (Bayesian-averaged towards RATING_PRIOR so a single 5-star review
+    doesn't outrank a long record) and verified proofs (log-scaled, saturating
+    at PROOF_SATURATION).
+    """
+    rows = db.execute(
+        select(
+            Application.id, Application.applicant_id, Profile.average_rating, Profile.total_reviews,
+            UserProofStats.verified_proofs
+        ).select_from(Application)
+        .join(Profile, Profile.user_id == Application.applicant_id)
+        .outerjoin(UserProofStats, UserProofStats.user_id == Application.applicant_id)
+        .where(Application.project_id == project_id)
+    ).all()
+    if not rows:
+        return []
+
+    skill_scores = score_applicants(db, project_id)
+    application_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    skill = np.array([skill_scores.get(row[1], NEUTRAL_SCORE) for row in rows]) / 100.0
+    rating = np.array([row[2] or 0.0 for row in rows], dtype=np.float64)
+    reviews = np.array([row[3] or 0 for row in rows], dtype=np.float64)
+    proofs = np.array([row[4] or 0 for row in rows], dtype=np.float64)
+
+    rating_fit = (rating * reviews + RATING_PRIOR * RATING_PRIOR_WEIGHT) / (reviews + RATING_PRIOR_WEIGHT) / 5.0
+    proof_fit = np.minimum(np.log1p(proofs) / np.log1p(PROOF_SATURATION), 1.0)
+    scores = 100.0 * (RANK_SKILL_WEIGHT * skill + RANK_RATING_WEIGHT * rating_fit + RANK_PROOF_WEIGHT * proof_fit)
+
+    # Best first; ties go to the earlier application
+    order = np.lexsort((application_ids, -scores))
+    return [(int(application_ids[i]), round(float(scores[i]), 2)) for i in order]
+
+
+def _write_scores(db: Session, rows: List[Dict]) -> int:
+    if rows:
+        db.connection().execute(
+            update(applications_table).where(
+                applications_table.c.project_id == bindparam("p_id"),
+                applications_table.c.applicant_id == bindparam("u_id")
+            ).values(ai_match_score=bindparam("score")),
+            rows
+        )
+    return len(rows)
+
+
+def rescore_project_applications(db: Session, project_ids: Iterable[int]) -> int:
+    """Re-score every application to the given projects (not committed)"""
+    updated = 0
+    for project_id in project_ids:
+        updated += _write_scores(db, [
+            {"p_id": project_id, "u_id": user_id, "score": score}
+            for user_id, score in score_applicants(db, project_id).items()
+        ])
+    return updated
+
+
+def rescore_user_applications(db: Session, user_ids: Iterable[int]) -> int:
+    """Re-score every application made by the given users (not committed)"""
+    updated = 0
+    for user_id in user_ids:
+        project_ids = db.scalars(
+            select(Application.project_id).where(Application.applicant_id == user_id)
+        ).all()
+        updated += _write_scores(db, [
+            {"p_id": project_id, "u_id": user_id, "score": score}
+            for project_id, score in score_candidate_projects(db, user_id, project_ids).items()
+        ])
+    return updated
+
+
+def rescore_all_applications(db: Session) -> int:
+    """Re-score every application, one project batch at a time"""
+    project_ids = db.scalars(select(Application.project_id).distinct()).all()
+    updated = rescore_project_applications(db, project_ids)
+    db.commit()
+    return updated
+
+
+def rescore_applications(project_ids: Iterable[int], user_ids: Iterable[int]) -> int:
+    """Re-score the applications to `project_ids` and those made by `user_ids` in a session of its own"""
+    db = SessionLocal()
+    try:
+        updated = rescore_project_applications(db, project_ids)
+        updated += rescore_user_applications(db, user_ids)
+        db.commit()
+        return updated
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _rescore_in_background(project_ids: List[int], user_ids: List[int]):
+    try:
+        updated = rescore_applications(project_ids, user_ids)
+        logger.info(f"Re-scored {updated} application(s)")
+    except Exception as e:
+        logger.error(f"Error re-scoring applications: {e}")
+
+
+def _queue_celery_rescore(project_ids: List[int], user_ids: List[int]) -> bool:
+    # Imported here - the task module imports this one
+    from app.tasks.match_tasks import rescore_applications as rescore_task
+
+    try:
+        # No publish retries - an unreachable broker must not hold up the committing request
+        rescore_task.apply_async(kwargs={"project_ids": project_ids, "user_ids": user_ids}, retry=False)
+        return True
+    except Exception as e:
+        logger.error(f"Could not queue application re-score, running it in-process: {e}")
+        return False
+
+
+def _dispatch_rescore(project_ids: Set[int], user_ids: Set[int]):
+    project_ids, user_ids = sorted(project_ids), sorted(user_ids)
+    if settings.MATCH_RESCORE_CELERY and _queue_celery_rescore(project_ids, user_ids):
+        return
+    _rescore_executor.submit(_rescore_in_background, project_ids, user_ids)
+
+
+def _skills_changed(obj, attr: str) -> bool:
+    return inspect(obj).attrs[attr].history.has_changes()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_rescore_targets(session, flush_context):
+    # New projects/profiles have no scored applications yet
+    for obj in session.dirty:
+        if isinstance(obj, Project) and _skills_changed(obj, "required_skills"):
+            session.info.setdefault("match_rescore_projects", set()).add(obj.id)
+        elif isinstance(obj, Profile) and _skills_changed(obj, "skills"):
+            session.info.setdefault("match_rescore_users", set()).add(obj.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_committed_rescore(session):
+    project_ids = session.info.pop("match_rescore_projects", set())
+    user_ids = session.info.pop("match_rescore_users", set())
+    if project_ids or user_ids:
+        _dispatch_rescore(project_ids, user_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_rescore(session):
+    session.info.pop("match_rescore_projects", None)
+    session.info.pop("match_rescore_users", None)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        count = rescore_all_applications(db)
+        logger.info(f"Re-scored {count} application(s)")
+    finally:
+        db.close()
@@ -1,7 +1,6 @@
 """
 Payment Service - Handles Stripe integration and payment processing
 """
-import stripe
 from decimal import Decimal
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
@@ -11,13 +10,26 @@ from app.core.config import settings
 from app.models.models import Payment, PaymentStatus, User, Project
 from app.schemas.schemas import PaymentIntentCreate, PaymentConfirm
 
+# The Stripe SDK is slow to import, so it is loaded on first use
+stripe = None
+
+
+def load_stripe():
+    """Import and configure the Stripe SDK on first use"""
+    global stripe
+    if stripe is None:
+        import stripe as stripe_sdk
+        stripe_sdk.api_key = settings.STRIPE_SECRET_KEY
+        stripe = stripe_sdk
+    return stripe
+
 
 class PaymentService:
     """Service for handling payment operations with Stripe"""
 
     def __init__(self, db: Session):
         self.db = db
-        stripe.api_key = settings.STRIPE_SECRET_KEY
+        load_stripe()
 
     def calculate_fees(self, amount: float) -> tuple[float, float]:
         """
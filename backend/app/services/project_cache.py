@@ -0,0 +1,75 @@
+"""
+Project response cache - Cached GET /projects/ and /projects/{id} responses
+
+List pages are keyed by their normalized filters and the caller class
+(anonymous, freelancer or business - the classes see different default
+status filters) and tagged PROJECT_LIST_TAG; a project's detail response is
+tagged with its `project:<id>` tag.
+
+Any flush that creates, updates or deletes a Project - the project endpoints,
+application acceptance, milestone completion - invalidates the list tag and
+the project's own tag, and again on commit, in case another request cached
+the pre-commit state in between.
+"""
+import json
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.response_cache import ResponseCache
+from app.models.models import Project, User, UserRole
+
+PROJECT_LIST_TAG = "projects:list"
+
+project_response_cache = ResponseCache(settings.PROJECT_CACHE_MAX_SIZE, settings.PROJECT_CACHE_TTL_SECONDS)
+
+
+def project_tag(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def caller_class(user: Optional[User]) -> str:
+    if user is None:
+        return "anonymous"
+    if user.role in [UserRole.FREELANCER, UserRole.AGENT]:
+        return "freelancer"
+    return "business"
+
+
+def list_cache_key(caller: str, filters: Dict) -> str:
+    """Stable key for one list page - unset filters are dropped, values normalized by the caller"""
+    normalized = {name: value for name, value in filters.items() if value not in (None, "", [])}
+    return f"projects:list:{caller}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+def detail_cache_key(project_id: int) -> str:
+    return f"projects:detail:{project_id}"
+
+
+def invalidate_projects(project_ids):
+    project_response_cache.invalidate_tags(PROJECT_LIST_TAG, *[project_tag(pid) for pid in project_ids])
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_projects(session, flush_context):
+    project_ids = {
+        obj.id for obj in list(session.new) + list(session.dirty) + list(session.deleted)
+        if isinstance(obj, Project)
+    }
+    if project_ids:
+        invalidate_projects(project_ids)
+        session.info.setdefault("project_cache_evict", set()).update(project_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_projects(session):
+    project_ids = session.info.pop("project_cache_evict", None)
+    if project_ids:
+        invalidate_projects(project_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_projects(session):
+    session.info.pop("project_cache_evict", None)
@@ -0,0 +1,327 @@
+"""
+Project recommendations - In-memory index of open projects for /projects/recommended
+
+Every open project is held as a sparse feature vector - its normalized
+required skills, category and experience level. Inverted indexes (skill ->
+projects, category -> projects) produce a freelancer's candidates, the skill
+overlap is accumulated from the posting lists (a sparse dot product), and a
+heap keeps the top K by
+
+    score = 0.7 * share of the project's required skills the freelancer has
+          + 0.2 * category match (categories the freelancer has applied to)
+          + 0.1 * experience fit (project level at or below the freelancer's)
+
+newest first on ties.
+
+The index is per process. Project writes update it after commit, from values
+captured at flush time (nothing is re-read); writes made by other processes
+are picked up by the full rebuild every PROJECT_INDEX_REFRESH_SECONDS.
+"""
+import heapq
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+from app.models.models import Application, Profile, Project, ProjectStatus, User
+from app.services.skill_index import normalize_skills
+
+logger = logging.getLogger(__name__)
+
+EXPERIENCE_LEVELS = {"beginner": 0, "intermediate": 1, "expert": 2}
+
+SKILL_WEIGHT = 0.7
+CATEGORY_WEIGHT = 0.2
+EXPERIENCE_WEIGHT = 0.1
+
+# Project attributes that change a project's index entry
+_INDEXED_ATTRS = ("required_skills", "category", "experience_level", "status")
+
+
+class ProjectEntry(NamedTuple):
+    skills: frozenset
+    category: Optional[str]
+    level: Optional[int]
+    created: float  # Timestamp - newer wins ties
+
+
+def experience_rank(level) -> Optional[int]:
+    return EXPERIENCE_LEVELS.get(level.strip().lower()) if isinstance(level, str) else None
+
+
+def freelancer_experience_rank(completed_projects: Optional[int]) -> int:
+    completed = completed_projects or 0
+    return 2 if completed >= 10 else 1 if completed >= 3 else 0
+
+
+def project_entry(required_skills, category, experience_level, created_at) -> ProjectEntry:
+    return ProjectEntry(
+        skills=frozenset(normalize_skills(required_skills)),
+        category=category,
+        level=experience_rank(experience_level),
+        created=created_at.timestamp() if created_at else time.time(),
+    )
+
+
+def score_entry(entry: ProjectEntry, matched: int, categories: Set[str], level: int) -> float:
+    """Score of one project for a freelancer sharing `matched` of its required skills"""
+    skill_fit = matched / len(entry.skills) if entry.skills else 0.0
+    category_fit = 1.0 if entry.category in categories else 0.0
+    if entry.level is None or entry.level <= level:
+        experience_fit = 1.0
+    elif entry.level == level + 1:
+        experience_fit = 0.5
+    else:
+        experience_fit = 0.0
+    return SKILL_WEIGHT * skill_fit + CATEGORY_WEIGHT * category_fit + EXPERIENCE_WEIGHT * experience_fit
+
+
+class ProjectIndex:
+    """Open projects by skill and category, with heap-based top-K queries"""
+
+    def __init__(self, refresh_seconds: int):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[int, ProjectEntry] = {}
+        self._by_skill: Dict[str, Set[int]] = defaultdict(set)
+        self._by_category: Dict[str, Set[int]] = defaultdict(set)
+        self._built_at: Optional[float] = None
+        # Fallback for freelancers with few overlapping projects: per experience
+        # level, (-created, -id) newest first - an immutable snapshot from the last load
+        self._newest_by_level: Dict[Optional[int], Tuple[Tuple[float, int], ...]] = {}
+        self._applied_since_load: Dict[int, ProjectEntry] = {}  # Upserts the snapshot lacks
+        # Changes applied while a rebuild is loading, replayed onto the new snapshot
+        self._pending: Optional[List[Dict[int, Optional[ProjectEntry]]]] = None
+        self._rebuild_flight = SingleFlight()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _add(self, project_id: int, entry: ProjectEntry):
+        self._entries[project_id] = entry
+        for skill in entry.skills:
+            self._by_skill[skill].add(project_id)
+        if entry.category:
+            self._by_category[entry.category].add(project_id)
+
+    def _remove(self, project_id: int):
+        entry = self._entries.pop(project_id, None)
+        if entry is None:
+            return
+        for skill in entry.skills:
+            postings = self._by_skill.get(skill)
+            if postings is not None:
+                postings.discard(project_id)
+                if not postings:
+                    del self._by_skill[skill]
+        postings = self._by_category.get(entry.category)
+        if postings is not None:
+            postings.discard(project_id)
+            if not postings:
+                del self._by_category[entry.category]
+
+    def _apply(self, changes: Dict[int, Optional[ProjectEntry]]):
+        for project_id, entry in changes.items():
+            self._remove(project_id)
+            self._applied_since_load.pop(project_id, None)
+            if entry is not None:
+                self._add(project_id, entry)
+                self._applied_since_load[project_id] = entry
+
+    def apply(self, changes: Dict[int, Optional[ProjectEntry]]):
+        """Upsert (entry) or drop (None) projects"""
+        with self._lock:
+            self._apply(changes)
+            if self._pending is not None:
+                self._pending.append(changes)
+
+    def load(self, rows: Iterable[Tuple[int, ProjectEntry]]):
+        """Replace the whole index"""
+        # Build the new snapshot outside the lock; queries keep using the old one
+        fresh = ProjectIndex(self.refresh_seconds)
+        by_level = defaultdict(list)
+        for project_id, entry in rows:
+            fresh._add(project_id, entry)
+            by_level[entry.level].append((-entry.created, -project_id))
+        newest_by_level = {level: tuple(sorted(keys)) for level, keys in by_level.items()}
+
+        with self._lock:
+            self._entries, self._by_skill, self._by_category = fresh._entries, fresh._by_skill, fresh._by_category
+            self._newest_by_level = newest_by_level
+            self._applied_since_load = {}
+            for changes in self._pending or ():
+                self._apply(changes)
+            self._pending = None
+            self._built_at = time.monotonic()
+
+    def rebuild(self, db: Session) -> int:
+        """Reload every open project from the database"""
+        with self._lock:
+            self._pending = []
+        try:
+            rows = [
+                (project_id, project_entry(skills, category, level, created_at))
+                for project_id, skills, category, level, created_at in db.execute(
+                    select(
+                        Project.id, Project.required_skills, Project.category,
+                        Project.experience_level, Project.created_at
+                    ).where(Project.status == ProjectStatus.OPEN)
+                )
+            ]
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        self.load(rows)
+        logger.info(f"Project index rebuilt with {len(rows)} open projects")
+        return len(rows)
+
+    def ensure_fresh(self, db: Session):
+        """Rebuild when never built or older than refresh_seconds (one rebuild at a time)"""
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at > self.refresh_seconds:
+            self._rebuild_flight.do("rebuild", lambda: self.rebuild(db))
+
+    def top_k(self, skills: Iterable[str], categories: Iterable[str], level: int, k: int,
+              exclude: Iterable[int] = ()) -> List[int]:
+        """Ids of the `k` best-scoring projects, best first"""
+        skills, categories, exclude = set(skills), set(categories), set(exclude)
+        with self._lock:
+            matched: Dict[int, int] = defaultdict(int)
+            for skill in skills:
+                for project_id in self._by_skill.get(skill, ()):
+                    matched[project_id] += 1
+
+            candidates = set(matched)
+            for category in categories:
+                candidates.update(self._by_category.get(category, ()))
+            candidates -= exclude
+
+            entries = self._entries
+            best = heapq.nlargest(k, (
+                (score_entry(entries[pid], matched.get(pid, 0), categories, level), entries[pid].created, pid)
+                for pid in candidates
+            ))
+            newest_by_level = self._newest_by_level
+            recent = list(self._applied_since_load.items()) if len(best) < k else []
+
+        project_ids = [project_id for _, _, project_id in best]
+        if len(project_ids) < k:
+            # Too few overlapping projects - fill up outside the lock
+            project_ids += self._fallback(
+                newest_by_level, recent, level, k - len(project_ids), exclude | set(project_ids)
+            )
+        return project_ids
+
+    def _fallback(self, newest_by_level, recent: List[Tuple[int, ProjectEntry]], level: int, k: int,
+                  exclude: Set[int]) -> List[int]:
+        """
+        Up to `k` projects without skill or category overlap, in score order.
+
+        Those score on experience fit alone, so they are taken tier by tier
+        (fit 1.0, then 0.5, then 0), newest first within a tier, by merging the
+        per-level snapshot lists with the projects applied since the snapshot
+        (`recent`) - reading only as many entries as it returns.
+        """
+        levels = set(newest_by_level) | {entry.level for _, entry in recent}
+        tiers = [
+            {lvl for lvl in levels if lvl is None or lvl <= level},
+            {lvl for lvl in levels if lvl is not None and lvl == level + 1},
+            {lvl for lvl in levels if lvl is not None and lvl > level + 1},
+        ]
+        project_ids = []
+        seen = set(exclude)
+        for tier in tiers:
+            recent_keys = sorted((-entry.created, -pid) for pid, entry in recent if entry.level in tier)
+            lists = [newest_by_level.get(lvl, ()) for lvl in tier] + [recent_keys]
+            for negated_created, negated_id in heapq.merge(*lists):
+                project_id = -negated_id
+                if project_id in seen:
+                    continue
+                # Skip snapshot keys of projects closed or changed since (dict reads are safe without the lock)
+                entry = self._entries.get(project_id)
+                if entry is None or entry.level not in tier or entry.created != -negated_created:
+                    continue
+                seen.add(project_id)
+                project_ids.append(project_id)
+                if len(project_ids) == k:
+                    return project_ids
+        return project_ids
+
+
+project_index = ProjectIndex(settings.PROJECT_INDEX_REFRESH_SECONDS)
+
+
+def recommend_projects(db: Session, user: User, limit: int) -> List[Project]:
+    """Top `limit` open projects for `user`, excluding ones they already applied to"""
+    project_index.ensure_fresh(db)
+
+    profile = db.query(Profile).filter(Profile.user_id == user.id).first()
+    applied = db.execute(
+        select(Application.project_id, Project.category)
+        .join(Project, Project.id == Application.project_id)
+        .where(Application.applicant_id == user.id)
+    ).all()
+
+    project_ids = project_index.top_k(
+        skills=normalize_skills(profile.skills if profile else None),
+        categories={category for _, category in applied},
+        level=freelancer_experience_rank(profile.completed_projects if profile else 0),
+        k=limit,
+        exclude={project_id for project_id, _ in applied},
+    )
+    if not project_ids:
+        return []
+
+    # Re-check status - the index can trail writes made by other processes
+    projects = {
+        project.id: project
+        for project in db.query(Project).filter(Project.id.in_(project_ids), Project.status == ProjectStatus.OPEN)
+    }
+    return [projects[project_id] for project_id in project_ids if project_id in projects]
+
+
+def _flushed_entry(project: Project) -> Optional[ProjectEntry]:
+    # Read the flushed values from the instance state - no lazy loads inside a flush
+    values = inspect(project).dict
+    if values.get("status", ProjectStatus.OPEN) != ProjectStatus.OPEN:
+        return None
+    return project_entry(
+        values.get("required_skills"), values.get("category"),
+        values.get("experience_level"), values.get("created_at")
+    )
+
+
+def _record_change(session, project_id: int, entry: Optional[ProjectEntry]):
+    session.info.setdefault("project_index_changes", {})[project_id] = entry
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_project_index_changes(session, flush_context):
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, Project):
+            continue
+        state = inspect(obj)
+        if obj in session.new or any(state.attrs[attr].history.has_changes() for attr in _INDEXED_ATTRS):
+            _record_change(session, obj.id, _flushed_entry(obj))
+    for obj in session.deleted:
+        if isinstance(obj, Project):
+            _record_change(session, obj.id, None)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_project_index_changes(session):
+    changes = session.info.pop("project_index_changes", None)
+    if changes:
+        project_index.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_project_index_changes(session):
+    session.info.pop("project_index_changes", None)
@@ -0,0 +1,261 @@
+"""
+User proof stats rollup - Keeps user_proof_stats in sync with proofs_of_build
+
+Every flush that creates, updates or deletes a ProofOfBuild (or a ProofApproval)
+recomputes the affected users' row on the flush's own connection, so the rollup
+commits or rolls back together with the proof write. Covers the proof endpoints,
+GitHub webhook proofs and milestone approval without touching the call sites.
+
+The same hook evicts the user's entry in `proof_metrics_cache`, which holds
+/freelancers/{id}/proof-metrics responses and coalesces concurrent misses
+for one user into a single computation.
+
+Backfill / repair:
+    python -m app.services.proof_stats            # every user with proofs
+    python -m app.services.proof_stats --user-id 42
+"""
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from sqlalchemy import and_, distinct, event, func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.memory_cache import MemoryBackend
+from app.core.singleflight import SingleFlight
+from app.models.models import (
+    ApprovalStatus, ProofApproval, ProofOfBuild, ProofStatus, UserProofStats
+)
+
+logger = logging.getLogger(__name__)
+
+stats_table = UserProofStats.__table__
+
+
+def compute_user_proof_stats(conn, user_id: int) -> Dict:
+    """
+    Aggregate one user's proofs in two statements: a GROUP BY (proof_type,
+    status) pass for the totals and per-type breakdown, and one approval join
+    for approved proofs and distinct projects.
+    """
+    by_type = {}
+    total = verified = 0
+    rows = conn.execute(
+        select(ProofOfBuild.proof_type, ProofOfBuild.status, func.count(ProofOfBuild.id))
+        .where(ProofOfBuild.user_id == user_id)
+        .group_by(ProofOfBuild.proof_type, ProofOfBuild.status)
+    )
+    for proof_type, proof_status, count in rows:
+        by_type[proof_type.value] = by_type.get(proof_type.value, 0) + count
+        total += count
+        if proof_status == ProofStatus.VERIFIED:
+            verified += count
+
+    projects, approved = conn.execute(
+        select(func.count(distinct(ProofOfBuild.project_id)), func.count(ProofApproval.id))
+        .select_from(ProofOfBuild)
+        .outerjoin(ProofApproval, and_(
+            ProofApproval.proof_id == ProofOfBuild.id,
+            ProofApproval.status == ApprovalStatus.APPROVED
+        ))
+        .where(ProofOfBuild.user_id == user_id)
+    ).one()
+
+    return {
+        "total_proofs": total,
+        "verified_proofs": verified,
+        "approved_proofs": approved or 0,
+        "projects_with_proofs": projects or 0,
+        "proofs_by_type": by_type,
+    }
+
+
+class ProofMetricsCache:
+    """
+    Per-process cache of proof-metrics responses with request coalescing.
+
+    Entries are evicted when a flush touches the user's proofs (and again on
+    commit). A write that lands while the user's metrics are being computed
+    flags that computation, so its pre-write result isn't cached. Flags exist
+    only for computations in flight (one per user - SingleFlight), so the
+    bookkeeping stays bounded by concurrency.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.backend = MemoryBackend(max_size)
+        self.ttl = ttl
+        self.flight = SingleFlight()
+        self._invalidated_in_flight: Dict[int, bool] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, user_id: int, compute: Callable[[], Dict]) -> Dict:
+        if self.ttl <= 0:
+            return compute()
+        cached = self.backend.get(user_id)
+        if cached is not None:
+            return cached
+        return self.flight.do(user_id, lambda: self._compute(user_id, compute))
+
+    def _compute(self, user_id: int, compute: Callable[[], Dict]) -> Dict:
+        with self._lock:
+            self._invalidated_in_flight[user_id] = False
+        try:
+            metrics = compute()
+            with self._lock:
+                if not self._invalidated_in_flight[user_id]:
+                    self.backend.set(user_id, metrics, self.ttl)
+            return metrics
+        finally:
+            with self._lock:
+                self._invalidated_in_flight.pop(user_id, None)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            if user_id in self._invalidated_in_flight:
+                self._invalidated_in_flight[user_id] = True
+            self.backend.delete(user_id)
+
+
+proof_metrics_cache = ProofMetricsCache(
+    settings.PROOF_METRICS_CACHE_MAX_SIZE, settings.PROOF_METRICS_CACHE_TTL_SECONDS
+)
+
+
+def _insert_missing_row(conn, user_id: int):
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        conn.execute(postgresql.insert(stats_table).values(user_id=user_id).on_conflict_do_nothing())
+    elif dialect == "sqlite":
+        conn.execute(sqlite.insert(stats_table).values(user_id=user_id).on_conflict_do_nothing())
+    elif conn.execute(select(stats_table.c.user_id).where(stats_table.c.user_id == user_id)).first() is None:
+        conn.execute(stats_table.insert().values(user_id=user_id))
+
+
+def refresh_user_proof_stats(conn, user_id: int) -> Dict:
+    """Recompute one user's rollup row on `conn` (inside the caller's transaction)"""
+    _insert_missing_row(conn, user_id)
+    # Row lock serialises concurrent proof writes for the same user on Postgres
+    # (FOR UPDATE is dropped on SQLite, where writers are already serialised)
+    conn.execute(
+        select(stats_table.c.user_id).where(stats_table.c.user_id == user_id).with_for_update()
+    )
+    stats = compute_user_proof_stats(conn, user_id)
+    conn.execute(
+        update(stats_table).where(stats_table.c.user_id == user_id).values(**stats, updated_at=func.now())
+    )
+    return stats
+
+
+def rebuild_user_proof_stats(db: Session, user_id: Optional[int] = None) -> int:
+    """Recompute rollup rows for one user or for every user with proofs; returns users refreshed"""
+    if user_id is not None:
+        user_ids: Iterable[int] = [user_id]
+    else:
+        user_ids = db.execute(select(distinct(ProofOfBuild.user_id))).scalars().all()
+        # Users whose proofs were all deleted keep a stale row otherwise
+        stale = db.execute(
+            select(stats_table.c.user_id).where(stats_table.c.user_id.not_in(select(ProofOfBuild.user_id)))
+        ).scalars().all()
+        user_ids = list(user_ids) + list(stale)
+
+    conn = db.connection()
+    count = 0
+    for uid in user_ids:
+        refresh_user_proof_stats(conn, uid)
+        count += 1
+    db.commit()
+    return count
+
+
+def get_user_proof_stats(db: Session, user_id: int) -> Dict:
+    """Rollup values for a user (zeros when the user has no proofs)"""
+    row = db.get(UserProofStats, user_id)
+    if row is None:
+        return {
+            "total_proofs": 0,
+            "verified_proofs": 0,
+            "approved_proofs": 0,
+            "projects_with_proofs": 0,
+            "proofs_by_type": {},
+        }
+    return {
+        "total_proofs": row.total_proofs,
+        "verified_proofs": row.verified_proofs,
+        "approved_proofs": row.approved_proofs,
+        "projects_with_proofs": row.projects_with_proofs,
+        "proofs_by_type": row.proofs_by_type or {},
+    }
+
+
+def _affected_user_ids(session: Session) -> Set[int]:
+    user_ids = set()
+    proof_ids = set()
+
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, ProofOfBuild):
+            if obj.user_id is not None:
+                user_ids.add(obj.user_id)
+            # A proof moved to another user refreshes the previous owner too
+            history = inspect(obj).attrs.user_id.history
+            user_ids.update(uid for uid in history.deleted or () if uid is not None)
+        elif isinstance(obj, ProofApproval):
+            if obj in session.dirty and not session.is_modified(obj):
+                continue
+            if obj.proof_id is not None:
+                proof_ids.add(obj.proof_id)
+
+    if proof_ids:
+        user_ids.update(
+            session.connection().execute(
+                select(ProofOfBuild.user_id).where(ProofOfBuild.id.in_(proof_ids))
+            ).scalars()
+        )
+    return user_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed_proof_stats(session, flush_context):
+    if not any(
+        isinstance(obj, (ProofOfBuild, ProofApproval))
+        for obj in list(session.new) + list(session.dirty) + list(session.deleted)
+    ):
+        return
+
+    conn = session.connection()
+    for user_id in _affected_user_ids(session):
+        refresh_user_proof_stats(conn, user_id)
+        proof_metrics_cache.invalidate(user_id)
+        session.info.setdefault("proof_metrics_evict", set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed_proof_metrics(session):
+    # Evict again once committed, in case another request cached the
+    # pre-commit numbers between our flush and commit
+    for user_id in session.info.pop("proof_metrics_evict", ()):
+        proof_metrics_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_proof_metrics(session):
+    session.info.pop("proof_metrics_evict", None)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.db.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Rebuild the user_proof_stats rollup")
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's row")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        refreshed = rebuild_user_proof_stats(db, args.user_id)
+        logger.info(f"Rebuilt proof stats for {refreshed} user(s)")
+    finally:
+        db.close()
@@ -7,6 +7,7 @@ import json
 import tempfile
 import os
 import time
+from functools import cached_property, lru_cache
 from typing import Dict, Tuple, Optional
 from datetime import datetime
 import logging
@@ -37,12 +38,9 @@ class SandboxExecutionService:
         "typescript": "npx ts-node {file}",
     }
 
-    def __init__(self):
-        """Initialize the sandbox service"""
-        self.docker_available = self._check_docker_availability()
-
-    def _check_docker_availability(self) -> bool:
-        """Check if Docker is available"""
+    @cached_property
+    def docker_available(self) -> bool:
+        """Check (once, on first use) if Docker is available"""
         try:
             # Try to run a simple docker command
             import subprocess
@@ -376,5 +374,7 @@ console.log(`5 + 3 = ${result}`);
         return templates.get(language, "// No template available")
 
 
-# Global instance
-sandbox_service = SandboxExecutionService()
+@lru_cache(maxsize=None)
+def get_sandbox_service() -> SandboxExecutionService:
+    """Shared SandboxExecutionService instance, created on first use"""
+    return SandboxExecutionService()
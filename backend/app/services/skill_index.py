@@ -0,0 +1,144 @@
+"""
+Skill index - Normalized, indexed copies of the JSON skill lists
+
+Profile.skills, Profile.verified_skills and Project.required_skills stay the
+source of truth (API responses read them); profile_skills,
+profile_verified_skills and project_required_skills hold one lowercased row
+per skill so filters and match scoring run as indexed joins.
+
+Rows are rewritten in the same flush whenever a profile's or project's skill
+list is assigned, and removed when the profile/project is deleted. As with
+any JSON column, in-place mutation (`profile.skills.append(...)`) isn't
+tracked - assign a new list.
+
+Backfill / repair:
+    python -m app.services.skill_index
+"""
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, distinct, event, func, insert, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.models import Profile, ProfileSkill, ProfileVerifiedSkill, Project, ProjectRequiredSkill
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_skills(skills: Optional[Iterable]) -> List[str]:
+    """Distinct, trimmed, lowercased skill names (non-strings and blanks dropped)"""
+    normalized = {s.strip().lower() for s in (skills or []) if isinstance(s, str) and s.strip()}
+    return sorted(normalized)
+
+
+def _sync(conn, model, owner_column, owner_id: int, skills):
+    conn.execute(delete(model).where(owner_column == owner_id))
+    rows = [{owner_column.key: owner_id, "skill": skill} for skill in normalize_skills(skills)]
+    if rows:
+        conn.execute(insert(model), rows)
+
+
+def sync_profile_skills(conn, profile_id: int, skills):
+    _sync(conn, ProfileSkill, ProfileSkill.profile_id, profile_id, skills)
+
+
+def verified_skill_names(verified_skills: Optional[Iterable]) -> List[str]:
+    """Normalized names of the verified_skills entries marked verified"""
+    return normalize_skills(
+        vs.get("skill") for vs in (verified_skills or []) if isinstance(vs, dict) and vs.get("verified")
+    )
+
+
+def sync_profile_verified_skills(conn, profile_id: int, verified_skills):
+    _sync(conn, ProfileVerifiedSkill, ProfileVerifiedSkill.profile_id, profile_id,
+          verified_skill_names(verified_skills))
+
+
+def sync_project_skills(conn, project_id: int, skills):
+    _sync(conn, ProjectRequiredSkill, ProjectRequiredSkill.project_id, project_id, skills)
+
+
+def _owners_with_skills(model, owner_column, skills, match_all: bool):
+    skills = normalize_skills(skills)
+    query = select(owner_column).where(model.skill.in_(skills))
+    if match_all:
+        query = query.group_by(owner_column).having(func.count(distinct(model.skill)) == len(skills))
+    return query
+
+
+def profiles_with_skills(skills, match_all: bool = False):
+    """Subquery of profile ids having any (or, with match_all, every) of `skills`"""
+    return _owners_with_skills(ProfileSkill, ProfileSkill.profile_id, skills, match_all)
+
+
+def profiles_with_verified_skills():
+    """Subquery of profile ids with at least one verified skill"""
+    return select(ProfileVerifiedSkill.profile_id).distinct()
+
+
+def projects_with_skills(skills, match_all: bool = False):
+    """Subquery of project ids requiring any (or, with match_all, every) of `skills`"""
+    return _owners_with_skills(ProjectRequiredSkill, ProjectRequiredSkill.project_id, skills, match_all)
+
+
+def rebuild_skill_index(db: Session) -> Tuple[int, int]:
+    """Rewrite every skill-index row from the JSON columns"""
+    conn = db.connection()
+    conn.execute(delete(ProfileSkill))
+    conn.execute(delete(ProfileVerifiedSkill))
+    conn.execute(delete(ProjectRequiredSkill))
+
+    profiles = projects = 0
+    for profile_id, skills, verified_skills in db.execute(
+        select(Profile.id, Profile.skills, Profile.verified_skills)
+    ):
+        sync_profile_skills(conn, profile_id, skills)
+        sync_profile_verified_skills(conn, profile_id, verified_skills)
+        profiles += 1
+    for project_id, skills in db.execute(select(Project.id, Project.required_skills)):
+        sync_project_skills(conn, project_id, skills)
+        projects += 1
+    db.commit()
+    return profiles, projects
+
+
+def _skills_changed(session: Session, obj, attr: str) -> bool:
+    return obj in session.new or inspect(obj).attrs[attr].history.has_changes()
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_flushed_skills(session, flush_context):
+    conn = None
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Profile):
+            if _skills_changed(session, obj, "skills"):
+                conn = conn or session.connection()
+                sync_profile_skills(conn, obj.id, obj.skills)
+            if _skills_changed(session, obj, "verified_skills"):
+                conn = conn or session.connection()
+                sync_profile_verified_skills(conn, obj.id, obj.verified_skills)
+        elif isinstance(obj, Project) and _skills_changed(session, obj, "required_skills"):
+            conn = conn or session.connection()
+            sync_project_skills(conn, obj.id, obj.required_skills)
+
+    # ON DELETE CASCADE covers PostgreSQL; SQLite doesn't enforce foreign keys by default
+    for obj in session.deleted:
+        if isinstance(obj, Profile):
+            conn = conn or session.connection()
+            conn.execute(delete(ProfileSkill).where(ProfileSkill.profile_id == obj.id))
+            conn.execute(delete(ProfileVerifiedSkill).where(ProfileVerifiedSkill.profile_id == obj.id))
+        elif isinstance(obj, Project):
+            conn = conn or session.connection()
+            conn.execute(delete(ProjectRequiredSkill).where(ProjectRequiredSkill.project_id == obj.id))
+
+
+if __name__ == "__main__":
+    from app.db.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        profiles, projects = rebuild_skill_index(db)
+        logger.info(f"Rebuilt skill index for {profiles} profile(s) and {projects} project(s)")
+    finally:
+        db.close()
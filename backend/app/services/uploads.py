@@ -0,0 +1,57 @@
+"""
+Uploads - Avatar and resume files in the content-addressed file store
+
+An upload is accepted by its declared content type, streamed into the file
+store (app.core.file_storage) off the event loop and addressed by its
+SHA-256 digest. The returned URL names the digest plus an extension for the
+content type, which is what GET /files/{name} serves it as - identical
+files uploaded by different users are stored once.
+"""
+from typing import Dict
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.file_storage import UploadTooLarge, file_store
+
+# Accepted content type -> URL extension
+AVATAR_TYPES = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+RESUME_TYPES = {
+    "application/pdf": "pdf",
+    "application/msword": "doc",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "docx",
+}
+
+# URL extension -> served content type
+MEDIA_TYPES = {extension: content_type for content_type, extension in {**AVATAR_TYPES, **RESUME_TYPES}.items()}
+
+
+def file_url(digest: str, extension: str) -> str:
+    return f"{settings.FILE_BASE_URL}{settings.API_V1_STR}/files/{digest}.{extension}"
+
+
+async def store_upload(file: UploadFile, allowed_types: Dict[str, str], max_bytes: int) -> str:
+    """
+    Store `file` and return its URL.
+
+    Raises ValueError for a content type outside `allowed_types` and
+    UploadTooLarge once more than `max_bytes` have been read.
+    """
+    content_type = (file.content_type or "").split(";")[0].strip().lower()
+    extension = allowed_types.get(content_type)
+    if extension is None:
+        raise ValueError(f"Unsupported file type '{content_type}' - expected one of: {', '.join(allowed_types)}")
+
+    # The parser has already spooled the part and knows its size - skip the copy.
+    # Oversized request bodies are refused before parsing (app.core.upload_limits)
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLarge(max_bytes)
+
+    blob = await run_in_threadpool(file_store.save, file.file, max_bytes)
+    return file_url(blob.digest, extension)
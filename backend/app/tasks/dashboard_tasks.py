@@ -0,0 +1,30 @@
+"""
+Celery tasks for the /users/me/stats dashboard counters
+"""
+
+import logging
+
+from app.core.celery_app import celery_app
+from app.db.database import SessionLocal
+from app.services.dashboard_stats import reconcile_dashboard_stats as reconcile_counters
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.tasks.dashboard_tasks.reconcile_dashboard_stats")
+def reconcile_dashboard_stats():
+    """
+    Recompute user_dashboard_stats from the source tables and fix any drift.
+    Runs hourly; ORM writes keep the counters current in between.
+    """
+    db = SessionLocal()
+    try:
+        corrected = reconcile_counters(db)
+        logger.info(f"Dashboard stats reconciled: {corrected} row(s) corrected")
+        return {"corrected": corrected}
+    except Exception as e:
+        logger.error(f"Error reconciling dashboard stats: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
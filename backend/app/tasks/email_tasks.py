@@ -1,6 +1,6 @@
 """Celery tasks for sending email notifications"""
 from app.core.celery_app import celery_app
-from app.services.email_service import email_service
+from app.services.email_service import get_email_service
 from app.db.database import SessionLocal
 from app.models.models import User, CandidateProject, Profile
 import logging
@@ -62,7 +62,7 @@ def send_project_created_email(project_id: int):
         )
 
         # Send email
-        success = email_service.send_project_created_notification(
+        success = get_email_service().send_project_created_notification(
             candidate_email=candidate.email,
             candidate_name=candidate_name,
             agent_name=agent_name,
@@ -138,7 +138,7 @@ def send_project_updated_email(project_id: int, update_summary: str = None):
         )
 
         # Send email
-        success = email_service.send_project_updated_notification(
+        success = get_email_service().send_project_updated_notification(
             candidate_email=candidate.email,
             candidate_name=candidate_name,
             agent_name=agent_name,
@@ -214,7 +214,7 @@ def send_project_status_changed_email(project_id: int, old_status: str, new_stat
         )
 
         # Send email
-        success = email_service.send_project_status_changed_notification(
+        success = get_email_service().send_project_status_changed_notification(
             candidate_email=candidate.email,
             candidate_name=candidate_name,
             agent_name=agent_name,
@@ -0,0 +1,30 @@
+"""
+Celery tasks for the featured-freelancer leaderboard
+"""
+
+import logging
+
+from app.core.celery_app import celery_app
+from app.db.database import SessionLocal
+from app.services.leaderboard import refresh_featured_leaderboard as rebuild_leaderboard
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.tasks.leaderboard_tasks.refresh_featured_leaderboard")
+def refresh_featured_leaderboard():
+    """
+    Rebuild featured_freelancers from profiles.
+    Runs every 15 minutes; review writes keep it current in between.
+    """
+    db = SessionLocal()
+    try:
+        count = rebuild_leaderboard(db)
+        logger.info(f"Featured leaderboard refreshed: {count} entries")
+        return {"entries": count}
+    except Exception as e:
+        logger.error(f"Error refreshing featured leaderboard: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
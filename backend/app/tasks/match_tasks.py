@@ -0,0 +1,26 @@
+"""
+Celery tasks for application match scoring
+"""
+
+import logging
+from typing import List, Optional
+
+from app.core.celery_app import celery_app
+from app.services.match_scoring import rescore_applications as run_rescore
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="app.tasks.match_tasks.rescore_applications")
+def rescore_applications(project_ids: Optional[List[int]] = None, user_ids: Optional[List[int]] = None):
+    """
+    Re-score the applications to `project_ids` and those made by `user_ids`.
+    Queued after commit (MATCH_RESCORE_CELERY) whenever a project's required skills or a profile's skills change.
+    """
+    try:
+        updated = run_rescore(project_ids or [], user_ids or [])
+        logger.info(f"Re-scored {updated} application(s)")
+        return {"updated": updated}
+    except Exception as e:
+        logger.error(f"Error re-scoring applications: {str(e)}")
+        raise
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Project applicant listing: per-applicant lookups (before) vs one joined query (after)
+
+Seeds a throwaway database with freelancers and one project with many
+applications, then lists its applicants through the endpoint function:
+
+  before - the old loop: 2 queries (user, profile) per application, all at once
+  after  - one joined page (+ count), default and rank=true modes
+
+Usage:
+    python benchmarks/applicant_listing_benchmark.py [--applicants 500] [--limit 50] [--runs 20]
+"""
+import argparse
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, StatementCounter, _bulk_insert, create_benchmark_db, seed_freelancers, seed_projects
+
+from fastapi import Response
+from sqlalchemy import select
+
+from app.api.endpoints.applications import get_project_applicants_with_profiles
+from app.models.models import Application, Profile, Project, User
+from app.services.match_scoring import rescore_all_applications
+
+
+def legacy_listing(db, project_id: int, owner):
+    """The pre-join implementation's query pattern"""
+    applications = db.query(Application).filter(
+        Application.project_id == project_id
+    ).order_by(Application.ai_match_score.desc()).all()
+    for application in applications:
+        db.query(User).filter(User.id == application.applicant_id).first()
+        db.query(Profile).filter(Profile.user_id == application.applicant_id).first()
+    return applications
+
+
+def listing(rank: bool, limit: int):
+    def run(db, project_id: int, owner):
+        return get_project_applicants_with_profiles(
+            project_id, response=Response(), limit=limit, offset=0, cursor=None, rank=rank,
+            db=db, current_user=owner
+        )["applicants"]
+    return run
+
+
+def measure(name, fn, Session, counter, project_id: int, owner_id: int, runs: int) -> dict:
+    samples = []
+    statements = 0
+    for _ in range(runs):
+        with Session() as db:
+            owner = db.get(User, owner_id)
+            counter.reset()
+            start = time.perf_counter()
+            rows = fn(db, project_id, owner)
+            samples.append(time.perf_counter() - start)
+            statements = counter.count
+    return {"mode": name, "rows": len(rows), "statements": statements, **latency_summary(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--applicants", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    print_header(f"Applicant listing benchmark - {args.applicants} applicants, page size {args.limit}")
+    engine, Session = create_benchmark_db(args.database_url)
+    with Session() as db:
+        seed_freelancers(db, args.applicants)
+        seed_projects(db, 1)
+        project_id, owner_id = db.execute(select(Project.id, Project.owner_id)).one()
+        _bulk_insert(db, Application, [
+            {"project_id": project_id, "applicant_id": user_id} for user_id in range(1, args.applicants + 1)
+        ])
+        db.commit()
+        rescore_all_applications(db)
+    counter = StatementCounter(engine)
+
+    rows = [
+        measure("before (all)", legacy_listing, Session, counter, project_id, owner_id, args.runs),
+        measure("after (page)", listing(False, args.limit), Session, counter, project_id, owner_id, args.runs),
+        measure("after rank=true", listing(True, args.limit), Session, counter, project_id, owner_id, args.runs),
+    ]
+    print_table(rows, ["mode", "rows", "statements", "p50_ms", "p95_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Mixed-load latency benchmark: blocking Session vs AsyncSession on the event loop
+
+Simulates one uvicorn worker serving a mix of slow queries and fast point
+lookups. Fast requests arrive on a fixed schedule (open loop), so time spent
+waiting for a blocked event loop counts towards their latency.
+
+  before - `async def` handler running sync Session queries (old behaviour)
+  after  - `async def` handler awaiting AsyncSession queries (get_async_db)
+
+Usage:
+    python benchmarks/async_db_benchmark.py [--duration 10] [--slow-workers 4]
+"""
+import argparse
+import asyncio
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.database import _async_database_url
+
+
+def slow_statement(is_sqlite: bool):
+    """A query that keeps the database busy for a while without touching tables"""
+    if is_sqlite:
+        # sqlite3 releases the GIL while stepping, like a network wait would
+        return text(
+            "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 3000000) "
+            "SELECT count(*) FROM c"
+        )
+    return text("SELECT pg_sleep(0.25)")
+
+
+FAST_STATEMENT = text("SELECT 1")
+
+
+async def run_mode(mode: str, args) -> dict:
+    is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+    pool_kwargs = {"pool_size": args.slow_workers + 4, "max_overflow": 0}
+    connect_args = {"check_same_thread": False} if is_sqlite else {}
+
+    if mode == "before":
+        engine = create_engine(settings.DATABASE_URL, connect_args=connect_args, **pool_kwargs)
+        Session = sessionmaker(bind=engine)
+
+        async def execute(stmt):
+            with Session() as db:
+                return db.execute(stmt).scalar()
+    else:
+        url, ssl = _async_database_url(settings.DATABASE_URL)
+        if ssl:
+            connect_args["ssl"] = ssl
+        engine = create_async_engine(url, connect_args=connect_args, **pool_kwargs)
+        Session = async_sessionmaker(bind=engine)
+
+        async def execute(stmt):
+            async with Session() as db:
+                return (await db.execute(stmt)).scalar()
+
+    slow_stmt = slow_statement(is_sqlite)
+    deadline = time.perf_counter() + args.duration
+    fast_latencies = []
+    slow_done = 0
+
+    async def slow_worker():
+        nonlocal slow_done
+        while time.perf_counter() < deadline:
+            await execute(slow_stmt)
+            slow_done += 1
+            await asyncio.sleep(0)
+
+    async def fast_request(scheduled_at: float):
+        await execute(FAST_STATEMENT)
+        fast_latencies.append(time.perf_counter() - scheduled_at)
+
+    async def fast_generator():
+        interval = 1.0 / args.fast_rps
+        start = time.perf_counter()
+        tasks = []
+        i = 0
+        while True:
+            scheduled_at = start + i * interval
+            if scheduled_at >= deadline:
+                break
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(fast_request(scheduled_at)))
+            i += 1
+        await asyncio.gather(*tasks)
+
+    await asyncio.gather(fast_generator(), *(slow_worker() for _ in range(args.slow_workers)))
+
+    if mode == "before":
+        engine.dispose()
+    else:
+        await engine.dispose()
+
+    return {"mode": mode, "slow_queries": slow_done, **latency_summary(fast_latencies)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per mode")
+    parser.add_argument("--slow-workers", type=int, default=4, help="Concurrent slow-query loops")
+    parser.add_argument("--fast-rps", type=float, default=200.0, help="Arrival rate of fast requests")
+    args = parser.parse_args()
+
+    print_header("Async DB benchmark - fast request latency under mixed load")
+    print(f"Database: {settings.DATABASE_URL.split('@')[-1]}")
+    print(f"Duration: {args.duration}s per mode, {args.slow_workers} slow workers, {args.fast_rps} fast req/s")
+    print()
+
+    rows = [asyncio.run(run_mode(mode, args)) for mode in ("before", "after")]
+    print_table(rows, ["mode", "count", "p50_ms", "p95_ms", "p99_ms", "max_ms", "slow_queries"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+decode_token throughput: cold (signature verified every call) vs warm (cached)
+
+  cold - every call uses a token the cache has not seen
+  warm - the same handful of tokens repeated, as on a busy authenticated route
+
+Usage:
+    python benchmarks/decode_token_benchmark.py [--iterations 50000] [--tokens 100]
+"""
+import argparse
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+
+from app.core.security import clear_token_cache, create_access_token, decode_token
+
+
+def run(name: str, tokens, iterations: int) -> dict:
+    samples = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        token = tokens[i % len(tokens)]
+        t0 = time.perf_counter()
+        payload = decode_token(token)
+        samples.append(time.perf_counter() - t0)
+        assert payload is not None
+    elapsed = time.perf_counter() - start
+    return {"mode": name, "ops_per_s": iterations / elapsed, **latency_summary(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--tokens", type=int, default=100, help="Distinct tokens in the warm run")
+    args = parser.parse_args()
+
+    print_header("decode_token benchmark - cold vs warm cache")
+
+    cold_tokens = [create_access_token({"sub": str(i)}) for i in range(args.iterations)]
+    warm_tokens = [create_access_token({"sub": str(i)}) for i in range(args.tokens)]
+
+    clear_token_cache()
+    cold = run("cold", cold_tokens, args.iterations)
+
+    clear_token_cache()
+    for token in warm_tokens:
+        decode_token(token)
+    warm = run("warm", warm_tokens, args.iterations)
+
+    print_table([cold, warm], ["mode", "count", "ops_per_s", "p50_ms", "p99_ms", "max_ms"])
+    print()
+    print(f"Speed-up: {warm['ops_per_s'] / cold['ops_per_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Freelancer search: per-row count queries (before) vs joined aggregates (after)
+
+Seeds a throwaway database with freelancer profiles, portfolio items and
+proofs, then pages through /freelancers/search and /freelancers/featured
+(featured before = full filter + sort, after = leaderboard read).
+
+  before - the old loop: 1 portfolio count + 3 proof counts per result row
+  after  - the current endpoint functions (one statement per page)
+
+Usage:
+    python benchmarks/freelancer_search_benchmark.py [--profiles 50000] [--pages 20] [--limit 100]
+"""
+import argparse
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, StatementCounter, create_benchmark_db, seed_freelancers
+
+from fastapi import Response
+from sqlalchemy import func
+
+from app.api.endpoints.freelancers import get_featured_freelancers, search_freelancers
+from app.models.models import PortfolioItem, Profile, ProofOfBuild, ProofStatus, User, UserRole
+
+
+def legacy_search(db, limit: int, offset: int):
+    """The pre-aggregate implementation's query pattern"""
+    results = db.query(Profile, User).join(User, Profile.user_id == User.id).filter(
+        User.role == UserRole.FREELANCER, User.is_active == True
+    ).order_by(Profile.average_rating.desc(), Profile.completed_projects.desc()).offset(offset).limit(limit).all()
+
+    for profile, user in results:
+        db.query(PortfolioItem).filter(PortfolioItem.profile_id == profile.id).count()
+        db.query(func.count(ProofOfBuild.id)).filter(ProofOfBuild.user_id == user.id).scalar()
+        db.query(func.count(ProofOfBuild.id)).filter(
+            ProofOfBuild.user_id == user.id, ProofOfBuild.status == ProofStatus.VERIFIED
+        ).scalar()
+        db.query(func.count(func.distinct(ProofOfBuild.project_id))).filter(
+            ProofOfBuild.user_id == user.id, ProofOfBuild.project_id.isnot(None)
+        ).scalar()
+
+
+def legacy_featured(db, limit: int, offset: int):
+    """/freelancers/featured before the leaderboard: filter and sort every profile"""
+    portfolio_counts = db.query(
+        PortfolioItem.profile_id, func.count(PortfolioItem.id).label("portfolio_count")
+    ).group_by(PortfolioItem.profile_id).subquery()
+    db.query(Profile, User, func.coalesce(portfolio_counts.c.portfolio_count, 0)).join(
+        User, Profile.user_id == User.id
+    ).outerjoin(portfolio_counts, portfolio_counts.c.profile_id == Profile.id).filter(
+        User.role == UserRole.FREELANCER, User.is_active == True,
+        Profile.average_rating >= 4.0, Profile.total_reviews > 0
+    ).order_by(Profile.average_rating.desc(), Profile.completed_projects.desc()).limit(50).all()
+
+
+def current_search(db, limit: int, offset: int):
+    search_freelancers(
+        response=Response(), skills=None, skills_match="any", location=None, min_hourly_rate=None,
+        max_hourly_rate=None, timezone=None, min_rating=None, verified_skills_only=False, search_query=None,
+        min_verified_proofs=None, min_verified_percentage=None, limit=limit, offset=offset, cursor=None,
+        current_user=None, db=db
+    )
+
+
+def measure(name, fn, Session, counter, pages: int, limit: int) -> dict:
+    samples = []
+    statements = []
+    for page in range(pages):
+        with Session() as db:
+            counter.reset()
+            start = time.perf_counter()
+            fn(db, limit, page * limit)
+            samples.append(time.perf_counter() - start)
+            statements.append(counter.count)
+    return {"mode": name, "statements_per_page": max(statements), **latency_summary(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=50000)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    print_header(f"Freelancer search benchmark - {args.profiles} profiles, page size {args.limit}")
+    engine, Session = create_benchmark_db(args.database_url)
+    with Session() as db:
+        seed_freelancers(db, args.profiles)
+    counter = StatementCounter(engine)
+
+    rows = [
+        measure("search before", legacy_search, Session, counter, args.pages, args.limit),
+        measure("search after", current_search, Session, counter, args.pages, args.limit),
+        measure("featured before", legacy_featured, Session, counter, args.pages, args.limit),
+        measure(
+            "featured after",
+            lambda db, limit, offset: get_featured_freelancers(limit=50, current_user=None, db=db),
+            Session, counter, args.pages, args.limit
+        ),
+    ]
+    print_table(rows, ["mode", "statements_per_page", "p50_ms", "p95_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
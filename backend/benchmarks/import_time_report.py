@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Cold-start import report for main.py
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter, prints the
+slowest top-level packages by cumulative import time, checks that the heavy
+SDKs are not imported at startup, and exits non-zero if the total exceeds the
+startup budget (so it can gate CI).
+
+Usage:
+    python benchmarks/import_time_report.py [--budget-ms 1500] [--top 20]
+"""
+import argparse
+import subprocess
+import sys
+
+from utils import BACKEND_DIR, print_header, print_table
+
+# SDKs that must only be imported on first use
+LAZY_MODULES = ["openai", "anthropic", "stripe", "mailersend", "google.oauth2"]
+
+
+def run_importtime():
+    """Return {module: (self_us, cumulative_us)} for `import main`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(f"import main failed:\n{result.stderr[-2000:]}")
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def loaded_lazy_modules():
+    code = (
+        "import sys, main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Maximum total import time for main")
+    parser.add_argument("--top", type=int, default=20, help="Packages to list")
+    args = parser.parse_args()
+
+    timings = run_importtime()
+    total_ms = timings.get("main", (0, 0))[1] / 1000
+
+    # Top-level packages only (names without leading spaces in the raw output)
+    packages = [
+        {"package": name, "cumulative_ms": cumulative / 1000, "self_ms": self_us / 1000}
+        for name, (self_us, cumulative) in timings.items()
+        if "." not in name and name != "main"
+    ]
+    packages.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+
+    print_header("Import-time report - python -c 'import main'")
+    print_table(packages[:args.top], ["package", "cumulative_ms", "self_ms"])
+    print()
+
+    eager = loaded_lazy_modules()
+    print(f"Total: {total_ms:.0f}ms (budget {args.budget_ms:.0f}ms)")
+    print(f"Heavy SDKs imported at startup: {', '.join(eager) if eager else 'none'}")
+
+    if total_ms > args.budget_ms or eager:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
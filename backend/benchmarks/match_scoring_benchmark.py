@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Application match scoring: one pair at a time (before) vs batched NumPy (after)
+
+Seeds a throwaway database with freelancers, projects and applications, then
+scores the same work both ways:
+
+  applicants - every applicant of one project
+  candidates - one freelancer against every project
+
+  before - the old per-pair path: profile lookup + skill-overlap query per pair
+  after  - app.services.match_scoring: two queries and one sparse mat-vec per batch
+
+Usage:
+    python benchmarks/match_scoring_benchmark.py [--freelancers 20000] [--projects 10000] [--applicants 5000] [--runs 5]
+"""
+import argparse
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, _bulk_insert, create_benchmark_db, seed_freelancers, seed_projects
+
+from sqlalchemy import func, select
+
+from app.models.models import Application, Profile, ProfileSkill, Project, ProjectRequiredSkill
+from app.services.match_scoring import NEUTRAL_SCORE, score_applicants, score_candidate_projects
+
+
+def legacy_score(db, user_id: int, project_id: int) -> float:
+    """The pre-batch implementation's query pattern, without its random jitter"""
+    profile = db.query(Profile).filter(Profile.user_id == user_id).first()
+    if not profile or not profile.skills:
+        return NEUTRAL_SCORE
+    profile_skill = select(ProfileSkill.skill).where(ProfileSkill.profile_id == profile.id).subquery()
+    required, matched = db.execute(
+        select(func.count(ProjectRequiredSkill.skill), func.count(profile_skill.c.skill))
+        .select_from(ProjectRequiredSkill)
+        .outerjoin(profile_skill, profile_skill.c.skill == ProjectRequiredSkill.skill)
+        .where(ProjectRequiredSkill.project_id == project_id)
+    ).one()
+    return matched * 100.0 / required if required else NEUTRAL_SCORE
+
+
+def measure(name, fn, Session, runs: int) -> dict:
+    samples = []
+    with Session() as db:
+        for _ in range(runs):
+            start = time.perf_counter()
+            scores = fn(db)
+            samples.append(time.perf_counter() - start)
+    return {"mode": name, "scored": len(scores), **latency_summary(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--freelancers", type=int, default=20000)
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--applicants", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    print_header(
+        f"Match scoring benchmark - {args.applicants} applicants, {args.projects} candidate projects"
+    )
+    engine, Session = create_benchmark_db(args.database_url)
+    with Session() as db:
+        seed_freelancers(db, args.freelancers)
+        seed_projects(db, args.projects)
+        project_id = db.scalar(select(Project.id).order_by(Project.id).limit(1))
+        _bulk_insert(db, Application, [
+            {"project_id": project_id, "applicant_id": user_id}
+            for user_id in range(1, min(args.applicants, args.freelancers) + 1)
+        ])
+        db.commit()
+        applicant_ids = db.scalars(select(Application.applicant_id)).all()
+        project_ids = db.scalars(select(Project.id)).all()
+
+    user_id = applicant_ids[0]
+    with Session() as db:
+        batched = score_applicants(db, project_id)
+        for applicant_id in applicant_ids[:200]:
+            assert abs(batched[applicant_id] - legacy_score(db, applicant_id, project_id)) < 0.01
+
+    rows = [
+        measure("applicants before",
+                lambda db: [legacy_score(db, uid, project_id) for uid in applicant_ids], Session, args.runs),
+        measure("applicants after", lambda db: score_applicants(db, project_id), Session, args.runs),
+        measure("candidates before",
+                lambda db: [legacy_score(db, user_id, pid) for pid in project_ids], Session, args.runs),
+        measure("candidates after",
+                lambda db: score_candidate_projects(db, user_id, project_ids), Session, args.runs),
+    ]
+    print_table(rows, ["mode", "scored", "p50_ms", "p95_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Deep pagination on GET /projects/: offset (before) vs keyset cursor (after)
+
+Seeds a throwaway database with projects and fetches the same deep page
+(page 1000 by default) through the endpoint's query (bypassing its response
+cache) both ways:
+
+  offset - ?skip=(page-1)*limit: the database walks and discards every earlier row
+  cursor - ?cursor=<key of the previous page's last row>: one index seek
+
+Keyset pagination relies on the (status, created_at, id) index,
+idx_projects_status_created, which the schema now creates.
+
+Usage:
+    python benchmarks/pagination_benchmark.py [--projects 100000] [--page 1000] [--limit 20] [--runs 20]
+"""
+import argparse
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, create_benchmark_db, seed_projects
+
+from app.api.endpoints.projects import query_projects
+from app.db.pagination import encode_cursor
+from app.models.models import Project, ProjectStatus
+
+
+def fetch_page(db, skip: int, limit: int, cursor=None):
+    projects, _ = query_projects(
+        db, None, skip=skip, limit=limit, cursor=cursor, category=None, status=ProjectStatus.OPEN,
+        min_budget=None, max_budget=None, skills=[], skills_match="any"
+    )
+    return projects
+
+
+def cursor_before(db, position: int) -> str:
+    """Cursor pointing at the row just before `position` in the endpoint's ordering"""
+    created_at, project_id = db.query(Project.created_at, Project.id).filter(
+        Project.status == ProjectStatus.OPEN
+    ).order_by(Project.created_at.desc(), Project.id.desc()).offset(position - 1).limit(1).one()
+    return encode_cursor([created_at, project_id])
+
+
+def measure(name, fn, Session, runs: int) -> dict:
+    samples = []
+    with Session() as db:
+        for _ in range(runs):
+            start = time.perf_counter()
+            page = fn(db)
+            samples.append(time.perf_counter() - start)
+    return {"mode": name, "rows": len(page), **latency_summary(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=100000)
+    parser.add_argument("--page", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    print_header(f"Pagination benchmark - {args.projects} projects, page {args.page} x {args.limit}")
+    engine, Session = create_benchmark_db(args.database_url)
+    with Session() as db:
+        seed_projects(db, args.projects)
+
+    skip = (args.page - 1) * args.limit
+    with Session() as db:
+        cursor = cursor_before(db, skip)
+        offset_ids = [p.id for p in fetch_page(db, skip, args.limit)]
+        cursor_ids = [p.id for p in fetch_page(db, 0, args.limit, cursor)]
+    assert offset_ids == cursor_ids, "offset and cursor pages differ"
+
+    rows = [
+        measure("offset", lambda db: fetch_page(db, skip, args.limit), Session, args.runs),
+        measure("cursor", lambda db: fetch_page(db, 0, args.limit, cursor), Session, args.runs),
+        measure("page 1", lambda db: fetch_page(db, 0, args.limit), Session, args.runs),
+    ]
+    print_table(rows, ["mode", "rows", "p50_ms", "p95_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
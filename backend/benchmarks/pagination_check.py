@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Keyset pagination check: rows sharing a created_at second page through exactly once
+
+Seeds a few open projects and gives them all the same created_at - stored
+both as 'YYYY-MM-DD HH:MM:SS' (what SQLite's CURRENT_TIMESTAMP writes) and
+with a '.ffffff' fraction (what a bound datetime writes) - then walks the
+project list one row per page by following the cursors:
+
+  GET /projects/ order    - (created_at DESC, id DESC), row-value seek
+  mixed directions        - (created_at DESC, id ASC), the OR-expansion seek
+
+Each walk must return every project once and then stop. Exits 1 otherwise,
+e.g. when a cursor keeps returning the same row.
+
+Usage:
+    python benchmarks/pagination_check.py [--projects 3] [--database-url postgresql://...]
+"""
+import argparse
+import sys
+
+from utils import print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, create_benchmark_db, seed_projects
+
+from sqlalchemy import text
+
+from app.api.endpoints.projects import query_projects
+from app.db.pagination import keyset_page, split_page
+from app.models.models import Project, ProjectStatus
+
+
+def list_page(db, cursor):
+    return query_projects(
+        db, None, skip=0, limit=1, cursor=cursor, category=None, status=ProjectStatus.OPEN,
+        min_budget=None, max_budget=None, skills=[], skills_match="any"
+    )
+
+
+def mixed_page(db, cursor):
+    order = [(Project.created_at, True), (Project.id, False)]
+    query = db.query(Project).filter(Project.status == ProjectStatus.OPEN)
+    return split_page(keyset_page(query, order, 1, cursor).all(), order, 1)
+
+
+def walk(db, fetch, max_pages: int):
+    seen, cursor = [], None
+    for _ in range(max_pages):
+        projects, cursor = fetch(db, cursor)
+        seen.extend(project.id for project in projects)
+        if cursor is None:
+            break
+    return seen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=3)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    print_header(f"Keyset pagination check - {args.projects} projects created in the same second")
+    engine, Session = create_benchmark_db(args.database_url)
+    with Session() as db:
+        seed_projects(db, args.projects, open_share=1.0)
+        db.execute(text("UPDATE projects SET created_at = '2026-01-01 00:00:00'"))
+        db.execute(text("UPDATE projects SET created_at = '2026-01-01 00:00:00.000000' WHERE id % 2 = 0"))
+        db.commit()
+        expected = sorted(project_id for (project_id,) in db.query(Project.id))
+
+        rows = []
+        for name, fetch, order in [
+            ("GET /projects/ order", list_page, sorted(expected, reverse=True)),
+            ("mixed directions", mixed_page, expected),
+        ]:
+            # A repeating cursor would loop forever - stop after one extra page
+            seen = walk(db, fetch, max_pages=len(expected) + 1)
+            rows.append({"walk": name, "rows": len(seen), "ok": seen == order, "ids": seen})
+
+    print_table(rows, ["walk", "rows", "ok", "ids"])
+    if not all(row["ok"] for row in rows):
+        print("\nFAIL - rows created in the same second were repeated or skipped")
+        sys.exit(1)
+    print("\nOK - every row returned exactly once")
+
+
+if __name__ == "__main__":
+    main()
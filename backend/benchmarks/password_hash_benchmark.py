@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+bcrypt throughput at different hashing pool sizes
+
+Submits a burst of password verifications to a thread pool of each size and
+reports verifications per second and per-request latency (including queueing).
+bcrypt releases the GIL, so throughput should scale with workers up to the
+number of cores.
+
+Usage:
+    python benchmarks/password_hash_benchmark.py [--requests 64] [--sizes 1,2,4,8] [--rounds 12]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+
+from passlib.context import CryptContext
+
+
+def run(context: CryptContext, hashed: str, workers: int, requests: int) -> dict:
+    latencies = []
+
+    def verify(submitted_at: float):
+        assert context.verify("correct horse battery staple", hashed)
+        latencies.append(time.perf_counter() - submitted_at)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for _ in range(requests):
+            pool.submit(verify, time.perf_counter())
+    elapsed = time.perf_counter() - start
+
+    return {"workers": workers, "verifies_per_s": requests / elapsed, **latency_summary(latencies)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64, help="Verifications per pool size")
+    parser.add_argument("--sizes", default="1,2,4,8", help="Comma-separated pool sizes")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost (BCRYPT_ROUNDS)")
+    args = parser.parse_args()
+
+    context = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=args.rounds)
+    hashed = context.hash("correct horse battery staple")
+
+    print_header(f"bcrypt benchmark - {args.requests} verifications, cost {args.rounds}")
+    rows = [run(context, hashed, int(size), args.requests) for size in args.sizes.split(",")]
+    print_table(rows, ["workers", "verifies_per_s", "p50_ms", "p95_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Freelancer text search: ILIKE '%term%' scans (before) vs the full-text index (after)
+
+For each profile count, seeds a throwaway database and times the search_query
+filter on its own (no other filters), ranked and limited like the endpoint:
+
+  ilike - the old three-column ILIKE filter (full scan of profiles)
+  fts   - app.db.profile_search (FTS5 on SQLite, GIN tsvector on PostgreSQL)
+
+The fts latency should stay roughly flat as the table grows.
+
+Usage:
+    python benchmarks/profile_search_benchmark.py [--sizes 10000,50000,200000] [--queries 50]
+"""
+import argparse
+import random
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, SKILLS, WORDS, create_benchmark_db, seed_freelancers
+
+from sqlalchemy import or_
+
+from app.db.profile_search import apply_profile_search
+from app.models.models import Profile
+
+
+def ilike_search(db, search_query: str, limit: int):
+    pattern = f"%{search_query}%"
+    return db.query(Profile).filter(
+        or_(Profile.first_name.ilike(pattern), Profile.last_name.ilike(pattern), Profile.bio.ilike(pattern))
+    ).order_by(Profile.average_rating.desc()).limit(limit).all()
+
+
+def fts_search(db, search_query: str, limit: int):
+    query = apply_profile_search(db.query(Profile), db.get_bind().dialect.name, search_query)
+    return query.order_by(Profile.average_rating.desc()).limit(limit).all()
+
+
+def sample_queries(count: int, profiles: int, seed: int = 7):
+    """A mix of whole words, prefixes, multi-word queries and exact names"""
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        kind = i % 4
+        if kind == 0:
+            queries.append(rng.choice(WORDS))
+        elif kind == 1:
+            queries.append(rng.choice(SKILLS).split()[0][:4].lower())
+        elif kind == 2:
+            queries.append(f"{rng.choice(WORDS)} {rng.choice(SKILLS).split()[0]}")
+        else:
+            queries.append(f"Last{rng.randint(1, profiles)}")
+    return queries
+
+
+def measure(name, fn, Session, queries, limit: int) -> dict:
+    samples = []
+    with Session() as db:
+        for search_query in queries:
+            start = time.perf_counter()
+            fn(db, search_query, limit)
+            samples.append(time.perf_counter() - start)
+    return {"mode": name, **latency_summary(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,50000,200000", help="Comma-separated profile counts")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    rows = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        print_header(f"Seeding {size} profiles")
+        engine, Session = create_benchmark_db(args.database_url)
+        with Session() as db:
+            seed_freelancers(db, size)
+        queries = sample_queries(args.queries, size)
+
+        for name, fn in (("ilike", ilike_search), ("fts", fts_search)):
+            rows.append({"profiles": size, **measure(name, fn, Session, queries, args.limit)})
+        engine.dispose()
+
+    print_header("Profile text search latency")
+    print_table(rows, ["profiles", "mode", "p50_ms", "p95_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
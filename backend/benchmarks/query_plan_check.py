@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Query-plan check: EXPLAIN the main endpoint queries on seeded data and fail on sequential scans
+
+Seeds a throwaway database (users, profiles, projects, applications, proofs,
+notifications, messages, reviews), runs each endpoint query below while
+recording the SQL it sends, then EXPLAINs every recorded SELECT:
+
+  PostgreSQL - EXPLAIN (FORMAT JSON): any "Seq Scan" node fails
+  SQLite     - EXPLAIN QUERY PLAN: any "SCAN <table>" without an index fails
+
+Exits 1 when a query scans a whole table, so it can gate CI or a migration.
+
+Usage:
+    python benchmarks/query_plan_check.py [--users 20000] [--projects 50000] [--database-url postgresql://...]
+"""
+import argparse
+import json
+import sys
+
+from utils import print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, create_benchmark_db, seed_activity, seed_freelancers, seed_projects
+
+from sqlalchemy import event, func, text
+
+from app.api.endpoints.freelancers import get_featured_freelancers
+from app.api.endpoints.projects import query_projects
+from app.db.database import Base
+from app.models.models import (
+    Application, ApplicationStatus, Notification, Profile, ProjectMessage, ProjectStatus, ProofOfBuild,
+    ProofStatus, Review
+)
+
+USER_ID = 42
+PROJECT_ID = 4242
+
+# (name, query) - each mirrors the filters and ordering of an endpoint
+CHECKS = [
+    ("GET /projects/ (open, newest first)", lambda db: query_projects(
+        db, None, skip=0, limit=20, cursor=None, category=None, status=ProjectStatus.OPEN,
+        min_budget=None, max_budget=None, skills=[], skills_match="any"
+    )),
+    ("POST /applications/ duplicate check", lambda db: db.query(Application).filter(
+        Application.project_id == PROJECT_ID, Application.applicant_id == USER_ID
+    ).first()),
+    ("GET /applications/project/{project_id}", lambda db: db.query(Application).filter(
+        Application.project_id == PROJECT_ID
+    ).all()),
+    ("GET /applications/ (mine)", lambda db: db.query(Application).filter(
+        Application.applicant_id == USER_ID
+    ).all()),
+    ("verified proofs per user", lambda db: db.query(func.count(ProofOfBuild.id)).filter(
+        ProofOfBuild.user_id == USER_ID, ProofOfBuild.status == ProofStatus.VERIFIED
+    ).scalar()),
+    ("GET /projects/{project_id}/proofs", lambda db: db.query(ProofOfBuild).filter(
+        ProofOfBuild.project_id == PROJECT_ID
+    ).order_by(ProofOfBuild.created_at.desc()).all()),
+    ("GET /notifications/?unread_only=true", lambda db: db.query(Notification).filter(
+        Notification.user_id == USER_ID, Notification.is_read == False
+    ).order_by(Notification.created_at.desc()).all()),
+    ("GET /ai-copilot/messages/{project_id}", lambda db: db.query(ProjectMessage).filter(
+        ProjectMessage.project_id == PROJECT_ID, ProjectMessage.deleted_at.is_(None)
+    ).order_by(ProjectMessage.created_at.desc()).limit(50).all()),
+    ("GET /reviews/user/{user_id}", lambda db: db.query(Review).filter(
+        Review.reviewee_id == USER_ID
+    ).order_by(Review.created_at.desc()).limit(20).all()),
+    ("GitHub webhook profile lookup", lambda db: db.query(Profile).filter(
+        Profile.github_username == f"dev{USER_ID}"
+    ).first()),
+    ("GET /freelancers/featured", lambda db: get_featured_freelancers(limit=10, current_user=None, db=db)),
+]
+
+
+def record_statements(engine, fn, db):
+    """Run fn(db) and return the (statement, parameters) of every SELECT it sent"""
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        fn(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+    return statements
+
+
+def _pg_seq_scans(plan) -> list:
+    scans = []
+    if plan.get("Node Type") == "Seq Scan":
+        scans.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        scans.extend(_pg_seq_scans(child))
+    return scans
+
+
+def sequential_scans(conn, statement, parameters) -> list:
+    """Tables the statement reads in full"""
+    if conn.dialect.name == "postgresql":
+        raw = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        plan = raw if isinstance(raw, list) else json.loads(raw)
+        return _pg_seq_scans(plan[0]["Plan"])
+
+    tables = set(Base.metadata.tables)
+    scans = []
+    for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters):
+        detail = row[-1]
+        words = detail.split()
+        if len(words) >= 2 and words[0] == "SCAN" and words[1] in tables and "USING" not in detail:
+            scans.append(words[1])
+    return scans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--projects", type=int, default=50000)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    print_header(f"Query plan check - {args.users} users, {args.projects} projects")
+    engine, Session = create_benchmark_db(args.database_url)
+    with Session() as db:
+        seed_freelancers(db, args.users)
+        seed_projects(db, args.projects)
+        seed_activity(db, args.users, args.projects)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+    rows = []
+    failures = 0
+    for name, fn in CHECKS:
+        with Session() as db:
+            statements = record_statements(engine, fn, db)
+        with engine.connect() as conn:
+            scans = sorted({table for statement, parameters in statements
+                            for table in sequential_scans(conn, statement, parameters)})
+        failures += bool(scans)
+        rows.append({
+            "query": name,
+            "statements": len(statements),
+            "result": f"SEQ SCAN {', '.join(scans)}" if scans else "ok",
+        })
+    print_table(rows, ["query", "statements", "result"])
+
+    if failures:
+        print(f"\n{failures} quer{'y' if failures == 1 else 'ies'} fell back to a sequential scan")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
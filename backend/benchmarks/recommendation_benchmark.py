@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Project recommendations: full scan + sort (before) vs in-memory top-K index (after)
+
+Seeds a throwaway database with open projects and asks for one freelancer's
+top K both ways, using the same scoring function:
+
+  scan  - load every open project, score each one, sort
+  index - ProjectIndex.top_k: posting-list candidates + heap of size K
+
+Also reports the index build time and the cost of an incremental update.
+
+Usage:
+    python benchmarks/recommendation_benchmark.py [--projects 100000] [--k 20] [--runs 50]
+"""
+import argparse
+import random
+import time
+
+from utils import latency_summary, print_header, print_table  # also puts backend/ on sys.path
+from seed import DEFAULT_URL, SKILLS, create_benchmark_db, seed_projects
+
+from sqlalchemy import select
+
+from app.models.models import Project, ProjectStatus
+from app.services.project_recommender import ProjectIndex, project_entry, score_entry
+from app.services.skill_index import normalize_skills
+
+
+def scan_top_k(db, skills, categories, level, k):
+    """Score every open project straight from the database"""
+    scored = []
+    for project_id, required, category, experience_level, created_at in db.execute(
+        select(Project.id, Project.required_skills, Project.category, Project.experience_level, Project.created_at)
+        .where(Project.status == ProjectStatus.OPEN)
+    ):
+        entry = project_entry(required, category, experience_level, created_at)
+        scored.append((score_entry(entry, len(entry.skills & skills), categories, level), entry.created, project_id))
+    scored.sort(reverse=True)
+    return [project_id for _, _, project_id in scored[:k]]
+
+
+def measure(name, fn, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return {"mode": name, "results": len(result), **latency_summary(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=100000, help="Open projects to seed")
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--database-url", default=DEFAULT_URL, help="Throwaway database (dropped and reseeded)")
+    args = parser.parse_args()
+
+    print_header(f"Recommendation benchmark - {args.projects} open projects, top {args.k}")
+    engine, Session = create_benchmark_db(args.database_url)
+    with Session() as db:
+        seed_projects(db, args.projects, open_share=1.0)
+
+    rng = random.Random(7)
+    skills = set(normalize_skills(rng.sample(SKILLS, 4)))
+    categories, level = {"evaluation"}, 1
+
+    index = ProjectIndex(refresh_seconds=3600)
+    with Session() as db:
+        start = time.perf_counter()
+        index.rebuild(db)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        expected = scan_top_k(db, skills, categories, level, args.k)
+        assert index.top_k(skills, categories, level, args.k) == expected, "index and scan disagree"
+
+        rows = [
+            measure("scan + sort", lambda: scan_top_k(db, skills, categories, level, args.k), max(1, args.runs // 10)),
+            measure("index top-k", lambda: index.top_k(skills, categories, level, args.k), args.runs),
+        ]
+
+    project_id = expected[0]
+    update = {project_id: project_entry(["rust", "go"], "translation", "expert", None)}
+    rows.append(measure("incremental update", lambda: index.apply(update) or update, args.runs))
+
+    print_table(rows, ["mode", "results", "p50_ms", "p95_ms", "max_ms"])
+    print(f"\nIndex build: {build_ms:.0f} ms for {len(index)} projects")
+
+
+if __name__ == "__main__":
+    main()
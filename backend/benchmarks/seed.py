@@ -0,0 +1,194 @@
+"""
+Synthetic data for the query benchmarks
+
+Creates a throwaway database (SQLite by default) with the app's schema and
+bulk-inserts rows with the ORM's executemany path.
+"""
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from utils import BACKEND_DIR  # also puts backend/ on sys.path
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import Base
+from app.db.profile_search import ensure_profile_search_index
+from app.models.models import (
+    User, Profile, PortfolioItem, PortfolioItemType, ProofOfBuild, ProofType, ProofStatus, UserRole,
+    Project, ProjectStatus, Application, ApplicationStatus, Notification, ProjectMessage, Review
+)
+from app.services.dashboard_stats import reconcile_dashboard_stats
+from app.services.leaderboard import refresh_featured_leaderboard
+from app.services.proof_stats import rebuild_user_proof_stats
+from app.services.skill_index import rebuild_skill_index
+
+DEFAULT_URL = f"sqlite:///{BACKEND_DIR / 'benchmark.db'}"
+
+SKILLS = [
+    "Python", "JavaScript", "TypeScript", "React", "FastAPI", "Django", "PostgreSQL", "Docker",
+    "Kubernetes", "AWS", "Machine Learning", "PyTorch", "TensorFlow", "NLP", "Go", "Rust",
+    "Java", "Kotlin", "Swift", "SQL", "Data Analysis", "Transcription", "Translation", "Evaluation",
+]
+WORDS = ["senior", "backend", "frontend", "engineer", "data", "scientist", "writer", "designer",
+         "mobile", "cloud", "security", "ml", "research", "product", "analyst", "developer"]
+
+
+class StatementCounter:
+    """Counts statements executed on an engine"""
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def reset(self):
+        self.count = 0
+
+
+def create_benchmark_db(url: str = DEFAULT_URL, fresh: bool = True) -> Tuple[object, sessionmaker]:
+    if fresh and url.startswith("sqlite:///"):
+        path = url[len("sqlite:///"):]
+        if os.path.exists(path):
+            os.remove(path)
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args)
+    Base.metadata.create_all(bind=engine)
+    ensure_profile_search_index(engine)
+    return engine, sessionmaker(bind=engine)
+
+
+def _bulk_insert(db: Session, model, rows, batch: int = 5000):
+    for i in range(0, len(rows), batch):
+        db.execute(insert(model), rows[i:i + batch])
+
+
+def seed_freelancers(db: Session, count: int, seed: int = 42):
+    """Freelancer users + profiles, 0-3 portfolio items and 0-6 proofs each"""
+    rng = random.Random(seed)
+
+    _bulk_insert(db, User, [
+        {"id": i, "email": f"freelancer{i}@example.com", "role": UserRole.FREELANCER, "is_active": True}
+        for i in range(1, count + 1)
+    ])
+
+    profiles = []
+    for i in range(1, count + 1):
+        skills = rng.sample(SKILLS, rng.randint(1, 6))
+        profiles.append({
+            "id": i,
+            "user_id": i,
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "bio": " ".join(rng.choices(WORDS, k=12)) + " " + " ".join(skills),
+            "skills": skills,
+            "verified_skills": [{"skill": s, "verified": rng.random() < 0.3} for s in skills[:2]],
+            "hourly_rate": round(rng.uniform(15, 200), 2),
+            "timezone": "UTC",
+            "github_username": f"dev{i}",
+            "average_rating": round(rng.uniform(0, 5), 2),
+            "total_reviews": rng.randint(0, 50),
+            "completed_projects": rng.randint(0, 40),
+        })
+    _bulk_insert(db, Profile, profiles)
+
+    portfolio = []
+    proofs = []
+    for i in range(1, count + 1):
+        for n in range(rng.randint(0, 3)):
+            portfolio.append({"profile_id": i, "item_type": PortfolioItemType.LINK, "title": f"Item {n}"})
+        for _ in range(rng.randint(0, 6)):
+            proofs.append({
+                "user_id": i,
+                "project_id": rng.randint(1, max(1, count // 10)) if rng.random() < 0.8 else None,
+                "proof_type": rng.choice(list(ProofType)),
+                "status": ProofStatus.VERIFIED if rng.random() < 0.7 else ProofStatus.PENDING,
+            })
+    _bulk_insert(db, PortfolioItem, portfolio)
+    _bulk_insert(db, ProofOfBuild, proofs)
+    db.commit()
+
+    # Bulk inserts skip the ORM flush hooks that maintain the rollup, skill index and leaderboard
+    rebuild_user_proof_stats(db)
+    rebuild_skill_index(db)
+    refresh_featured_leaderboard(db)
+
+
+def seed_projects(db: Session, count: int, seed: int = 42, owner_id: int = None, open_share: float = 0.8):
+    """Projects spread over the last year (`open_share` of them open), owned by one business user"""
+    rng = random.Random(seed)
+
+    if owner_id is None:
+        owner_id = db.execute(insert(User).values(
+            email=f"business{rng.randrange(10**9)}@example.com", role=UserRole.BUSINESS, is_active=True
+        )).inserted_primary_key[0]
+
+    now = datetime.utcnow()
+    _bulk_insert(db, Project, [
+        {
+            "owner_id": owner_id,
+            "title": f"Project {i}",
+            "description": " ".join(rng.choices(WORDS, k=20)),
+            "category": rng.choice(["evaluation", "transcription", "translation"]),
+            "budget": round(rng.uniform(100, 10000), 2),
+            "status": ProjectStatus.OPEN if rng.random() < open_share else ProjectStatus.COMPLETED,
+            "experience_level": rng.choice([None, "beginner", "intermediate", "expert"]),
+            "required_skills": rng.sample(SKILLS, rng.randint(1, 5)),
+            "created_at": now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600)),
+        }
+        for i in range(1, count + 1)
+    ])
+    db.commit()
+    rebuild_skill_index(db)
+
+
+def seed_activity(db: Session, user_count: int, project_count: int, per_user: int = 5, seed: int = 42):
+    """Applications, project messages, notifications and reviews for users 1..user_count on projects 1..project_count"""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+
+    def created():
+        return now - timedelta(seconds=rng.randint(0, 365 * 24 * 3600))
+
+    applications, messages, notifications, reviews = [], [], [], []
+    for user_id in range(1, user_count + 1):
+        for project_id in rng.sample(range(1, project_count + 1), min(per_user, project_count)):
+            applications.append({
+                "project_id": project_id,
+                "applicant_id": user_id,
+                "status": rng.choice(list(ApplicationStatus)),
+            })
+            messages.append({
+                "project_id": project_id,
+                "sender_id": user_id,
+                "message": " ".join(rng.choices(WORDS, k=8)),
+                "created_at": created(),
+                "deleted_at": now if rng.random() < 0.05 else None,
+            })
+        for _ in range(per_user):
+            notifications.append({
+                "user_id": user_id,
+                "title": "Update",
+                "message": " ".join(rng.choices(WORDS, k=8)),
+                "type": "application",
+                "is_read": rng.random() < 0.7,
+                "created_at": created(),
+            })
+            reviews.append({
+                "project_id": rng.randint(1, project_count),
+                "reviewer_id": rng.randint(1, user_count),
+                "reviewee_id": user_id,
+                "rating": rng.randint(1, 5),
+                "created_at": created(),
+            })
+    _bulk_insert(db, Application, applications)
+    _bulk_insert(db, ProjectMessage, messages)
+    _bulk_insert(db, Notification, notifications)
+    _bulk_insert(db, Review, reviews)
+    db.commit()
+    # Bulk inserts skip the flush hook that maintains the dashboard counters
+    reconcile_dashboard_stats(db)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Upload throughput: buffered (read whole body, then hash and write) vs the
+streaming content-addressed store
+
+Writes a --size-mb file of random bytes into a spooled temporary file (what
+the multipart parser hands to UploadFile) and stores it with a local
+FILE_STORAGE_DIR-style store in a throwaway directory:
+
+  buffered  - body read into memory, hashed and written in one go
+  streamed  - LocalFileStore.save: chunked copy with incremental SHA-256
+  duplicate - the same bytes again (hash only, deduplicated - nothing published)
+  read      - iter_range over the whole blob, and a 1 MB range from the middle
+
+Reports MB/s and the peak Python heap allocation (tracemalloc) per mode.
+
+Usage:
+    python benchmarks/upload_benchmark.py [--size-mb 50] [--runs 5] [--chunk-kb 1024]
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from utils import print_header, print_table  # also puts backend/ on sys.path
+
+from app.core.file_storage import LocalFileStore
+
+MB = 1024 * 1024
+
+
+def make_source(size: int) -> tempfile.SpooledTemporaryFile:
+    source = tempfile.SpooledTemporaryFile(max_size=MB)
+    remaining = size
+    while remaining:
+        chunk = os.urandom(min(MB, remaining))
+        source.write(chunk)
+        remaining -= len(chunk)
+    return source
+
+
+def buffered_save(root: str, source) -> str:
+    """The naive approach - whole body in memory"""
+    data = source.read()
+    digest = hashlib.sha256(data).hexdigest()
+    with open(os.path.join(root, digest), "wb") as blob:
+        blob.write(data)
+    return digest
+
+
+def measure(name: str, fn, size: int, runs: int, before=None) -> dict:
+    samples = []
+    peak = 0
+    for _ in range(runs):
+        if before:
+            before()
+        tracemalloc.start()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    best = min(samples)
+    return {
+        "mode": name,
+        "best_ms": best * 1000,
+        "avg_ms": sum(samples) / len(samples) * 1000,
+        "mb_per_s": size / MB / best,
+        "peak_heap_mb": peak / MB,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--chunk-kb", type=int, default=1024, help="UPLOAD_CHUNK_SIZE in KiB")
+    args = parser.parse_args()
+
+    size = args.size_mb * MB
+    print_header(f"Upload benchmark - {args.size_mb} MB file, {args.chunk_kb} KiB chunks, {args.runs} runs")
+    root = tempfile.mkdtemp(prefix="upload-benchmark-")
+    try:
+        source = make_source(size)
+        store = LocalFileStore(os.path.join(root, "store"), args.chunk_kb * 1024)
+        buffered_dir = os.path.join(root, "buffered")
+        os.makedirs(buffered_dir)
+
+        def rewind():
+            source.seek(0)
+
+        def clear_store():
+            rewind()
+            shutil.rmtree(store.root, ignore_errors=True)
+
+        digest = None
+
+        def streamed():
+            nonlocal digest
+            blob = store.save(source, size)
+            assert blob.created and blob.size == size
+            digest = blob.digest
+
+        def duplicate():
+            assert not store.save(source, size).created
+
+        def read_all():
+            assert sum(len(chunk) for chunk in store.iter_range(digest, 0, size - 1)) == size
+
+        def read_range():
+            start = size // 2
+            assert sum(len(chunk) for chunk in store.iter_range(digest, start, start + MB - 1)) == MB
+
+        rows = [
+            measure("buffered", lambda: buffered_save(buffered_dir, source), size, args.runs, before=rewind),
+            measure("streamed", streamed, size, args.runs, before=clear_store),
+            measure("duplicate", duplicate, size, args.runs, before=rewind),
+            measure("read", read_all, size, args.runs),
+        ]
+        range_row = measure("read 1MB range", read_range, MB, args.runs)
+        print_table(rows + [range_row], ["mode", "best_ms", "avg_ms", "mb_per_s", "peak_heap_mb"])
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Shared helpers for the benchmark scripts in this directory
+"""
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+# Add backend directory to path so benchmarks can import app modules
+BACKEND_DIR = Path(__file__).parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples (pct in 0-100)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def latency_summary(samples_s: List[float]) -> Dict[str, float]:
+    """Summarise latency samples (seconds) as milliseconds"""
+    return {
+        "count": len(samples_s),
+        "p50_ms": percentile(samples_s, 50) * 1000,
+        "p95_ms": percentile(samples_s, 95) * 1000,
+        "p99_ms": percentile(samples_s, 99) * 1000,
+        "max_ms": (max(samples_s) if samples_s else 0.0) * 1000,
+    }
+
+
+def print_header(title: str):
+    print("=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_table(rows: List[Dict], columns: List[str]):
+    """Print a list of dicts as a fixed-width table"""
+    widths = {c: max(len(c), *(len(_fmt(r.get(c))) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    print("  ".join("-" * widths[c] for c in columns))
+    for row in rows:
+        print("  ".join(_fmt(row.get(c)).ljust(widths[c]) for c in columns))
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
@@ -1,12 +1,18 @@
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.api.endpoints import auth, projects, applications, users, ai_briefs, sandboxes, proof_of_build, collaboration, payments, escrow, reviews, ai_copilot, freelancers, milestones, webhooks, notifications, candidate_projects
-from app.db.database import Base, engine, get_db, init_db
+from app.api.endpoints import auth, projects, applications, users, ai_briefs, sandboxes, proof_of_build, collaboration, payments, escrow, reviews, ai_copilot, freelancers, milestones, webhooks, notifications, candidate_projects, admin, files
+from app.core.metrics import PrometheusMiddleware, metrics_payload
+from app.core.query_inspector import QueryInspectorMiddleware
+from app.core.upload_limits import MULTIPART_OVERHEAD, UploadLimitMiddleware
+from app.db.database import Base, engine, async_engine, replica_engines, async_replica_engines, get_db, init_db
+from app.db.health import DatabaseHealth, table_row_counts
+from app.services import dashboard_stats, leaderboard, match_scoring, proof_stats, skill_index  # noqa: F401 - session hooks that keep derived tables in sync
 from datetime import datetime
 import logging
 import sys
+import time
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +31,13 @@ app = FastAPI(
     description="Remote Works Platform API"
 )
 
+# Refuse oversized upload bodies before the multipart parser spools them to disk
+# (added before CORS so the 413 still carries CORS headers)
+app.add_middleware(UploadLimitMiddleware, limits={
+    "/users/me/profile/avatar": settings.AVATAR_MAX_BYTES + MULTIPART_OVERHEAD,
+    "/users/me/profile/resume": settings.RESUME_MAX_BYTES + MULTIPART_OVERHEAD,
+})
+
 # CORS middleware
 logger.info(f"Configuring CORS for origins: {settings.cors_origins}")
 app.add_middleware(
@@ -37,6 +50,21 @@ app.add_middleware(
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
+# Per-route request metrics, scraped from /metrics
+if settings.METRICS_ENABLED:
+    app.add_middleware(PrometheusMiddleware)
+
+# Opt-in N+1 detection / query budgets for dev and test runs
+if settings.QUERY_INSPECTOR_ENABLED:
+    app.add_middleware(QueryInspectorMiddleware)
+
+# Background DB ping shared by /health and /health/ready
+db_health = DatabaseHealth(async_engine, settings.HEALTH_CHECK_INTERVAL_SECONDS)
+
+# Diagnostics results by mode (exact counts or estimates) -> (computed_at, result)
+_diagnostics_cache = {}
+
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
@@ -50,6 +78,20 @@ async def startup_event():
     else:
         logger.error("Database initialization failed - some features may not work")
 
+    db_health.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled database connections on application shutdown"""
+    await db_health.stop()
+    await async_engine.dispose()
+    engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+    for replica in replica_engines:
+        replica.dispose()
+
 # Include routers
 # Auth and users routers are included both with and without API version prefix for backwards compatibility
 app.include_router(auth.router, prefix=settings.API_V1_STR, tags=["auth-v1"])
@@ -80,6 +122,8 @@ app.include_router(collaboration.router, prefix=settings.API_V1_STR)
 app.include_router(ai_copilot.router, prefix=settings.API_V1_STR)
 app.include_router(freelancers.router, prefix=settings.API_V1_STR)
 app.include_router(candidate_projects.router, prefix=settings.API_V1_STR)
+app.include_router(admin.router, prefix=settings.API_V1_STR)
+app.include_router(files.router, prefix=settings.API_V1_STR)
 
 
 @app.get("/")
@@ -92,26 +136,35 @@ def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus scrape endpoint"""
+    body, content_type = metrics_payload()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/health")
-def health_check(db: Session = Depends(get_db)):
-    """Health check endpoint with database connectivity test"""
-    try:
-        # Test database connection
-        from sqlalchemy import text
-        db.execute(text("SELECT 1"))
-        return {
-            "status": "healthy",
-            "database": "connected",
-            "version": settings.VERSION,
-            "environment": settings.ENVIRONMENT
-        }
-    except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "error": str(e)
-        }
+def health_check():
+    """Health check with database connectivity (cached background ping - no DB access per probe)"""
+    return {
+        **db_health.status(),
+        "version": settings.VERSION,
+        "environment": settings.ENVIRONMENT
+    }
+
+
+@app.get("/health/live")
+def liveness_check():
+    """Liveness probe - the process is up and serving; never touches the database"""
+    return {"status": "alive", "version": settings.VERSION}
+
+
+@app.get("/health/ready")
+def readiness_check(response: Response):
+    """Readiness probe - 503 until the background database ping succeeds"""
+    if not db_health.ready:
+        response.status_code = 503
+    return db_health.status()
 
 
 @app.post("/init-db")
@@ -137,8 +190,22 @@ def initialize_database():
 
 
 @app.get("/diagnostics")
-def run_diagnostics(db: Session = Depends(get_db)):
-    """Comprehensive diagnostics endpoint for troubleshooting"""
+def run_diagnostics(exact: bool = False, db: Session = Depends(get_db)):
+    """Comprehensive diagnostics endpoint for troubleshooting
+
+    Row counts come from catalog statistics unless `exact=true`. Results are
+    cached for DIAGNOSTICS_CACHE_TTL_SECONDS.
+    """
+    cached = _diagnostics_cache.get(exact)
+    if cached and time.monotonic() - cached[0] < settings.DIAGNOSTICS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    diagnostics = _collect_diagnostics(db, exact)
+    _diagnostics_cache[exact] = (time.monotonic(), diagnostics)
+    return diagnostics
+
+
+def _collect_diagnostics(db: Session, exact: bool):
     from sqlalchemy import text, inspect
     import traceback
 
@@ -153,6 +220,7 @@ def run_diagnostics(db: Session = Depends(get_db)):
             "api_prefix": settings.API_V1_STR
         },
         "database": {},
+        "row_counts": "exact" if exact else "estimated",
         "tables": {},
         "enums": {},
         "errors": []
@@ -196,14 +264,19 @@ def run_diagnostics(db: Session = Depends(get_db)):
                 diagnostics["tables"]["missing"] = list(missing_tables)
                 diagnostics["errors"].append(f"Missing tables: {missing_tables}")
 
-            # Get row counts for each table
+            # Get row counts for each table (catalog estimates unless exact)
+            row_counts = table_row_counts(db, tables, exact=exact)
             diagnostics["tables"]["details"] = {}
-            for table in tables:
-                try:
-                    count = db.execute(text(f"SELECT COUNT(*) FROM {table}")).fetchone()[0]
-                    diagnostics["tables"]["details"][table] = f"✓ {count} rows"
-                except Exception as e:
-                    diagnostics["tables"]["details"][table] = f"✗ Error: {str(e)[:30]}"
+            for table, count in row_counts.items():
+                if "error" in count:
+                    diagnostics["tables"]["details"][table] = f"✗ Error: {count['error']}"
+                elif count["rows"] is None:
+                    diagnostics["tables"]["details"][table] = "? not analyzed (use exact=true)"
+                else:
+                    prefix = "~" if count["estimate"] else ""
+                    diagnostics["tables"]["details"][table] = f"✓ {prefix}{count['rows']} rows"
+            if "users" in row_counts:
+                diagnostics["database"]["user_count"] = row_counts["users"]["rows"]
 
         except Exception as e:
             diagnostics["tables"]["error"] = str(e)
@@ -224,15 +297,6 @@ def run_diagnostics(db: Session = Depends(get_db)):
                 diagnostics["enums"]["error"] = str(e)
                 diagnostics["errors"].append(f"Enum check: {str(e)}")
 
-        # Test user creation
-        try:
-            from app.models.models import User
-            test_user_count = db.query(User).count()
-            diagnostics["database"]["user_count"] = test_user_count
-        except Exception as e:
-            diagnostics["database"]["user_query_error"] = str(e)
-            diagnostics["errors"].append(f"User query: {str(e)}")
-
         # Overall status
         diagnostics["status"] = "healthy" if len(diagnostics["errors"]) == 0 else "issues_found"
 
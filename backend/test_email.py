@@ -8,9 +8,11 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.services.email_service import email_service
+from app.services.email_service import get_email_service
 from app.core.config import settings
 
+email_service = get_email_service()
+
 def test_email():
     print("=" * 60)
     print("🔍 MAILERSEND EMAIL TEST")
@@ -9,10 +9,12 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.services.email_service import email_service
+from app.services.email_service import get_email_service
 from app.core.config import settings
 import logging
 
+email_service = get_email_service()
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 